@@ -0,0 +1,186 @@
+"""Simple benchmark to compare geometry compression of SQLite stores.
+
+Geometries in a :class:`SQLiteStore` are stored as compressed WKB. They
+are compressed once when written and decompressed every time they are
+read, e.g. by `query`. This compares the available compression methods
+for a grid of cell boundaries. The timings reported are the time to
+append all cells, the time to query and load all cells, and the size of
+the store on disk.
+
+Command Line Usage
+==================
+
+```
+usage: annotation_store_compression.py [-h] [-S SIZE SIZE] [-n N_POINTS]
+                                       [-r REPEATS]
+
+optional arguments:
+  -h, --help            show this help message and exit
+  -S SIZE SIZE, --size SIZE SIZE
+                        The size of the grid of cells to generate. Defaults to
+                        (200, 200).
+  -n N_POINTS, --n-points N_POINTS
+                        The number of points in each cell boundary. Defaults
+                        to 20.
+  -r REPEATS, --repeats REPEATS
+                        The number of times to repeat the query. Defaults to 3.
+```
+
+
+Example Output For 200x200 Grid Of 20 Point Cells (40,000 Annotations)
+======================================================================
+
+| compression | level | write (s) | query (s) | size (MiB) |
+| ----------- | ----- | --------- | --------- | ---------- |
+| None        | 0     | 1.19      | 0.23      | 21.67      |
+| zlib        | 9     | 1.65      | 0.34      | 11.08      |
+| zlib        | 1     | 1.27      | 0.34      | 11.54      |
+| zstd        | 3     | 1.59      | 0.68      | 11.76      |
+| lz4         | 1     | 1.09      | 0.38      | 13.49      |
+
+For small geometries such as nuclei, decompression is only a few
+microseconds per geometry for any codec and the per-call overhead of
+the numcodecs codecs outweighs their faster decompression.
+
+Example Output For 40x40 Grid Of 1000 Point Cells (1,600 Annotations)
+=====================================================================
+
+| compression | level | write (s) | query (s) | size (MiB) |
+| ----------- | ----- | --------- | --------- | ---------- |
+| None        | 0     | 0.21      | 0.05      | 25.20      |
+| zlib        | 9     | 10.42     | 0.12      | 6.61       |
+| zlib        | 1     | 0.46      | 0.14      | 6.76       |
+| zstd        | 3     | 0.34      | 0.10      | 6.45       |
+| lz4         | 1     | 0.26      | 0.06      | 12.70      |
+
+For large geometries such as tissue regions, "zstd" writes much faster
+than "zlib" at level 9 with a similar size, and "lz4" reads about twice
+as fast as "zlib" at the cost of a larger store.
+
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from timeit import default_timer
+
+sys.path.append("../")
+
+import numpy as np  # noqa: E402
+import shapely  # noqa: E402
+
+from tiatoolbox.annotation.storage import SQLiteStore  # noqa: E402
+
+COMPRESSIONS = [
+    (None, 0),
+    ("zlib", 9),
+    ("zlib", 1),
+    ("zstd", 3),
+    ("lz4", 1),
+]
+
+
+def cell_grid(
+    size: tuple[int, int] = (10, 10),
+    spacing: float = 35,
+    n_points: int = 20,
+    seed: int = 0,
+) -> np.ndarray:
+    """Generate a grid of randomly rotated elliptical cell boundaries."""
+    rng = np.random.default_rng(seed)
+    num_cells = size[0] * size[1]
+    centres = np.array(list(np.ndindex(size))) * spacing
+    alpha = np.linspace(0, 2 * np.pi, n_points, endpoint=False)
+    radii = rng.uniform(4, 12, (num_cells, 2)) * spacing / 35
+    angles = rng.uniform(0, 2 * np.pi, (num_cells, 1))
+    x = radii[:, :1] * np.cos(alpha)
+    y = radii[:, 1:] * np.sin(alpha)
+    coords = np.stack(
+        [
+            x * np.cos(angles) - y * np.sin(angles) + centres[:, :1],
+            x * np.sin(angles) + y * np.cos(angles) + centres[:, 1:],
+        ],
+        axis=-1,
+    )
+    return shapely.polygons(coords.round())
+
+
+def main(size: tuple[int, int], n_points: int, repeats: int) -> None:
+    """Run the benchmark.
+
+    Args:
+        size (tuple(int)): The size of the grid to generate.
+        n_points (int): The number of points in each cell boundary.
+        repeats (int): The number of times to repeat the query.
+
+    """
+    cells = cell_grid(size=tuple(size), spacing=35 * n_points / 20, n_points=n_points)
+    bounds = shapely.total_bounds(cells)
+    available = SQLiteStore.compression_methods()
+    print(f"Storing {len(cells)} cells")
+    print("| compression | level | write (s) | query (s) | size (MiB) |")
+    print("| ----------- | ----- | --------- | --------- | ---------- |")
+    with TemporaryDirectory() as temp_dir:
+        for compression, level in COMPRESSIONS:
+            if compression is not None and compression not in available:
+                print(f"| {compression!s:<11} | {level:<5} | unavailable")
+                continue
+            path = Path(temp_dir) / f"{compression}-{level}.db"
+            store = SQLiteStore(
+                path,
+                compression=compression,
+                compression_level=level,
+            )
+
+            start = default_timer()
+            store.append_geometries(cells)
+            write_time = default_timer() - start
+
+            start = default_timer()
+            for _ in range(repeats):
+                _ = store.query(bounds, geometry_predicate="bbox_intersects")
+            query_time = (default_timer() - start) / repeats
+
+            store.commit()
+            file_size = path.stat().st_size / (1024**2)
+            print(
+                f"| {compression!s:<11} | {level:<5} | {write_time:<9.2f} "
+                f"| {query_time:<9.2f} | {file_size:<10.2f} |",
+            )
+
+
+if __name__ == "__main__":
+    PARSER = argparse.ArgumentParser(
+        description=(
+            "Simple benchmark to compare geometry compression of SQLite stores."
+        ),
+    )
+    PARSER.add_argument(
+        "-S",
+        "--size",
+        type=int,
+        nargs=2,
+        default=(200, 200),
+        help="The size of the grid of cells to generate. Defaults to (200, 200).",
+    )
+    PARSER.add_argument(
+        "-n",
+        "--n-points",
+        type=int,
+        default=20,
+        help="The number of points in each cell boundary. Defaults to 20.",
+    )
+    PARSER.add_argument(
+        "-r",
+        "--repeats",
+        type=int,
+        default=3,
+        help="The number of times to repeat the query. Defaults to 3.",
+    )
+
+    # Parsed CLI arguments
+    ARGS = PARSER.parse_args()
+    # Run the benchmark
+    main(size=ARGS.size, n_points=ARGS.n_points, repeats=ARGS.repeats)
@@ -27,6 +27,11 @@ setup_requirements = [
     "pytest-runner",
 ]
 
+extras_require = {
+    # GeoParquet import and export of annotation stores
+    "parquet": ["pyarrow>=14.0.1"],
+}
+
 test_requirements = [
     "pytest>=3",
 ]
@@ -47,6 +52,7 @@ setup(
     ],
     description="Computational pathology toolbox developed by TIA Centre.",
     dependency_links=dependency_links,
+    extras_require=extras_require,
     entry_points={
         "console_scripts": [
             "tiatoolbox=tiatoolbox.cli:main",
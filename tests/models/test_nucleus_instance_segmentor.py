@@ -1,5 +1,7 @@
 """Test for Nucleus Instance Segmentor."""
 
+from __future__ import annotations
+
 import copy
 
 # ! The garbage collector
@@ -8,25 +10,33 @@ import shutil
 from pathlib import Path
 from typing import Callable
 
+import cv2
 import joblib
 import numpy as np
 import pytest
+import torch
 import yaml
 from click.testing import CliRunner
+from scipy import ndimage
+from torch import nn
 
 from tiatoolbox import cli
+from tiatoolbox.annotation.storage import SQLiteStore
 from tiatoolbox.models import (
     IOSegmentorConfig,
     NucleusInstanceSegmentor,
     SemanticSegmentor,
 )
 from tiatoolbox.models.architecture import fetch_pretrained_weights
+from tiatoolbox.models.architecture.hovernet import HoVerNet
 from tiatoolbox.models.engine.nucleus_instance_segmentor import (
     _process_tile_predictions,
 )
+from tiatoolbox.models.models_abc import ModelABC
 from tiatoolbox.utils import env_detection as toolbox_env
 from tiatoolbox.utils import imwrite
 from tiatoolbox.utils.metrics import f1_detection
+from tiatoolbox.utils.misc import store_from_dat
 from tiatoolbox.wsicore.wsireader import WSIReader
 
 ON_GPU = toolbox_env.has_gpu()
@@ -42,6 +52,40 @@ def _crash_func(_x: object) -> None:
     raise ValueError(msg)
 
 
+class _ThresholdNuclei(ModelABC):
+    """Segment bright blobs as nuclei.
+
+    Simple model to test functionality without any weights.
+
+    """
+
+    def __init__(self: _ThresholdNuclei) -> None:
+        super().__init__()
+        self.identity = nn.Identity()
+
+    def forward(self: _ThresholdNuclei, img: torch.Tensor) -> torch.Tensor:
+        """Define how to use layer."""
+        return self.identity(img)
+
+    @staticmethod
+    def infer_batch(
+        model: nn.Module,
+        batch_data: torch.Tensor,
+        *,
+        on_gpu: bool,  # noqa: ARG004
+    ) -> list:
+        """Threshold the red channel of an input batch."""
+        with torch.inference_mode():
+            output = model(batch_data.type(torch.float32))
+        return [(output[..., :1] > 127).numpy().astype(np.float32)]
+
+    @staticmethod
+    def postproc(raw_maps: list) -> tuple:
+        """Label connected foreground blobs as instances."""
+        inst_map, _ = ndimage.label(raw_maps[0][..., 0] > 0.5)
+        return inst_map, HoVerNet.get_instance_info(inst_map)
+
+
 def helper_tile_info() -> list:
     """Helper function for tile information."""
     predictor = NucleusInstanceSegmentor(model="A")
@@ -76,6 +120,48 @@ def helper_tile_info() -> list:
     return predictor._get_tile_info([16, 16], ioconfig)
 
 
+def helper_dot_grid(
+    tmp_path: Path,
+    size: int,
+    tile_shape: int,
+) -> tuple[Path, IOSegmentorConfig]:
+    """Helper function for an image of a grid of dots and its ioconfig.
+
+    The dots are 24 pixels apart, so :class:`_ThresholdNuclei` finds
+    `ceil((size - 8) / 24) ** 2` instances in the image.
+
+    Args:
+        tmp_path (Path):
+            The directory to write the image to.
+        size (int):
+            The width and height of the image.
+        tile_shape (int):
+            The width and height of the tiles to process.
+
+    Returns:
+        tuple:
+            The path of the image and the config to segment it with.
+
+    """
+    img = np.zeros((size, size, 3), dtype=np.uint8)
+    for y in range(8, size, 24):
+        for x in range(8, size, 24):
+            cv2.circle(img, (x, y), 6, (255, 255, 255), -1)
+    img_path = tmp_path / "tile.png"
+    imwrite(img_path, img)
+
+    ioconfig = IOSegmentorConfig(
+        input_resolutions=[{"units": "baseline", "resolution": 1.0}],
+        output_resolutions=[{"units": "baseline", "resolution": 1.0}],
+        margin=32,
+        tile_shape=[tile_shape, tile_shape],
+        patch_input_shape=[128, 128],
+        patch_output_shape=[128, 128],
+        stride_shape=[128, 128],
+    )
+    return img_path, ioconfig
+
+
 # ----------------------------------------------------
 
 
@@ -278,6 +364,106 @@ def test_crash_segmentor(remote_sample: Callable, tmp_path: Path) -> None:
         )
 
 
+def test_functionality_pipelined(tmp_path: Path) -> None:
+    """Test pipelined tile processing gives the same instances."""
+    img_path, ioconfig = helper_dot_grid(tmp_path, 512, 256)
+
+    centroids = {}
+    for pipeline_depth, num_postproc_workers in [(0, 0), (2, 0), (2, 2)]:
+        inst_segmentor = NucleusInstanceSegmentor(
+            batch_size=2,
+            num_postproc_workers=num_postproc_workers,
+            model=_ThresholdNuclei(),
+        )
+        inst_segmentor.pipeline_depth = pipeline_depth
+        output = inst_segmentor.predict(
+            [img_path],
+            mode="tile",
+            ioconfig=ioconfig,
+            on_gpu=ON_GPU,
+            crash_on_exception=True,
+            save_dir=tmp_path / f"{pipeline_depth}_{num_postproc_workers}",
+        )
+        inst_dict = joblib.load(f"{output[0][1]}.dat")
+        centroids[pipeline_depth, num_postproc_workers] = sorted(
+            tuple(np.round(inst["centroid"], 2)) for inst in inst_dict.values()
+        )
+    assert len(centroids[0, 0]) == 21 * 21
+    assert centroids[2, 0] == centroids[0, 0]
+    assert centroids[2, 2] == centroids[0, 0]
+
+
+def test_functionality_store_output(tmp_path: Path) -> None:
+    """Test streaming instances to an annotation store."""
+    img_path, ioconfig = helper_dot_grid(tmp_path, 512, 256)
+
+    centroids = {}
+    for output_type, pipeline_depth in [("dat", 0), ("db", 0), ("db", 2)]:
+        inst_segmentor = NucleusInstanceSegmentor(
+            batch_size=2,
+            model=_ThresholdNuclei(),
+        )
+        inst_segmentor.pipeline_depth = pipeline_depth
+        output = inst_segmentor.predict(
+            [img_path],
+            mode="tile",
+            ioconfig=ioconfig,
+            on_gpu=ON_GPU,
+            crash_on_exception=True,
+            save_dir=tmp_path / f"{output_type}_{pipeline_depth}",
+            output_type=output_type,
+        )
+        save_path = output[0][1]
+        if output_type == "dat":
+            assert not Path(f"{save_path}.db").exists()
+            store = store_from_dat(f"{save_path}.dat")
+        else:
+            assert not Path(f"{save_path}.dat").exists()
+            store = SQLiteStore(f"{save_path}.db")
+        centroids[output_type, pipeline_depth] = sorted(
+            tuple(np.round(ann.geometry.centroid.coords[0], 2))
+            for ann in store.values()
+        )
+    assert len(centroids["dat", 0]) == 21 * 21
+    assert centroids["db", 0] == centroids["dat", 0]
+    assert centroids["db", 2] == centroids["dat", 0]
+
+    with pytest.raises(ValueError, match="not a valid output type"):
+        inst_segmentor.predict(
+            [img_path],
+            mode="tile",
+            ioconfig=ioconfig,
+            save_dir=tmp_path / "invalid",
+            output_type="npy",
+        )
+
+
+def test_functionality_single_tile(tmp_path: Path) -> None:
+    """Test an image which fits in one tile, so has no cross-sections."""
+    img_path, ioconfig = helper_dot_grid(tmp_path, 256, 1024)
+
+    for output_type in ("dat", "db"):
+        inst_segmentor = NucleusInstanceSegmentor(
+            batch_size=2,
+            model=_ThresholdNuclei(),
+        )
+        output = inst_segmentor.predict(
+            [img_path],
+            mode="tile",
+            ioconfig=ioconfig,
+            on_gpu=ON_GPU,
+            crash_on_exception=True,
+            save_dir=tmp_path / output_type,
+            output_type=output_type,
+        )
+        save_path = output[0][1]
+        if output_type == "dat":
+            store = store_from_dat(f"{save_path}.dat")
+        else:
+            store = SQLiteStore(f"{save_path}.db")
+        assert len(store) == 11 * 11
+
+
 def test_functionality_ci(remote_sample: Callable, tmp_path: Path) -> None:
     """Functionality test for nuclei instance segmentor."""
     gc.collect()
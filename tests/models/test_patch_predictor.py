@@ -423,6 +423,30 @@ def test_wsi_patch_dataset(  # noqa: PLR0915
     assert np.min(correlation) > 0.9, correlation
 
 
+def test_wsi_patch_dataset_getitems(tmp_path: Path) -> None:
+    """Test batched reading of patches from a WSIPatchDataset."""
+    img_path = tmp_path / "tile.png"
+    imwrite(img_path, RNG.integers(0, 255, (200, 300, 3), dtype=np.uint8))
+    ds = WSIPatchDataset(
+        img_path=img_path,
+        mode="tile",
+        patch_input_shape=(64, 64),
+        stride_shape=(48, 48),
+        auto_get_mask=False,
+    )
+    indices = [5, 0, len(ds) - 1]
+    batch = ds.__getitems__(indices)
+    assert len(batch) == len(indices)
+    for item, idx in zip(batch, indices):
+        expected = ds[idx]
+        assert np.array_equal(item["image"], expected["image"])
+        assert np.array_equal(item["coords"], expected["coords"])
+
+    loader = torch.utils.data.DataLoader(ds, batch_size=4, shuffle=False)
+    batch = next(iter(loader))
+    assert batch["image"].shape == (4, 64, 64, 3)
+
+
 def test_patch_dataset_abc() -> None:
     """Test for ABC methods.
 
@@ -8,7 +8,7 @@ import gc
 import multiprocessing
 import shutil
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterator
 
 import numpy as np
 import pytest
@@ -16,6 +16,7 @@ import torch
 import torch.multiprocessing as torch_mp
 import torch.nn.functional as F  # noqa: N812
 import yaml
+import zarr
 from click.testing import CliRunner
 from torch import nn
 
@@ -26,6 +27,8 @@ from tiatoolbox.models.architecture.utils import centre_crop
 from tiatoolbox.models.engine.semantic_segmentor import (
     IOSegmentorConfig,
     WSIStreamDataset,
+    ZarrPredictionCanvas,
+    _run_pipelined,
 )
 from tiatoolbox.models.models_abc import ModelABC
 from tiatoolbox.utils import env_detection as toolbox_env
@@ -35,6 +38,7 @@ from tiatoolbox.wsicore.wsireader import WSIReader
 ON_GPU = toolbox_env.has_gpu()
 # The value is based on 2 TitanXP each with 12GB
 BATCH_SIZE = 1 if not ON_GPU else 16
+RNG = np.random.default_rng()  # Numpy Random Generator
 try:
     NUM_POSTPROC_WORKERS = multiprocessing.cpu_count()
 except NotImplementedError:
@@ -253,6 +257,13 @@ def test_functional_wsi_stream_dataset(remote_sample: Callable) -> None:
         assert np.round(patch_resolution1.shape[0] / patch_resolution2.shape[0]) == 2
         assert np.round(patch_resolution1.shape[0] / patch_resolution3.shape[0]) == 3
 
+    # test batched read matches reading each sample
+    batch = sds.__getitems__([0, 1])
+    for (patch_data, bound), (expected_data, expected_bound) in zip(batch, sds):
+        assert np.array_equal(bound, expected_bound)
+        for patch, expected in zip(patch_data, expected_data):
+            assert np.array_equal(patch, expected)
+
 
 # -------------------------------------------------------------------------------------
 # Engine
@@ -461,6 +472,180 @@ def test_functional_segmentor_merging(tmp_path: Path) -> None:
     del canvas  # skipcq
 
 
+def test_merge_prediction_on_drive_matches_memory(tmp_path: Path) -> None:
+    """Test merging overlapping patches on drive and in memory agree."""
+    locations = [
+        [x, y, x + 16, y + 16] for y in range(-4, 60, 8) for x in range(-4, 60, 8)
+    ]
+    # skip some patches to leave gaps between them
+    locations = [loc for idx, loc in enumerate(locations) if idx % 5 != 2]
+    predictions = [RNG.random((8, 8, 2)).astype(np.float32) for _ in locations]
+    in_memory = SemanticSegmentor.merge_prediction([50, 60], predictions, locations)
+
+    # accumulate on the drive over two calls
+    half = len(predictions) // 2
+    for start, end in [(0, half), (half, len(predictions))]:
+        on_drive = SemanticSegmentor.merge_prediction(
+            [50, 60],
+            predictions[start:end],
+            locations[start:end],
+            save_path=tmp_path / "raw.npy",
+            cache_count_path=tmp_path / "count.npy",
+        )
+    assert np.allclose(np.array(on_drive), in_memory, atol=1e-5)
+    del on_drive  # release the memmap
+
+    # predictions of the same size as the location are not resized
+    canvas = SemanticSegmentor.merge_prediction(
+        [4, 4],
+        [np.full((2, 2, 1), 1), np.full((4, 4, 1), 3)],
+        [[0, 0, 2, 2], [0, 0, 4, 4]],
+    )
+    assert np.allclose(canvas[:2, :2], 2)
+    assert np.allclose(canvas[2:, 2:], 3)
+
+
+def test_zarr_prediction_canvas(tmp_path: Path) -> None:
+    """Test merging into a chunked Zarr canvas matches merge_prediction."""
+    locations = np.array(
+        [[x, y, x + 16, y + 16] for y in range(-4, 60, 8) for x in range(-4, 60, 8)],
+    )
+    # skip some patches to leave gaps between them
+    locations = locations[np.arange(len(locations)) % 5 != 2]
+    predictions = [RNG.random((8, 8, 2)).astype(np.float32) for _ in locations]
+    expected = SemanticSegmentor.merge_prediction(
+        [50, 60],
+        predictions,
+        locations,
+        save_path=tmp_path / "raw.npy",
+        cache_count_path=tmp_path / "count.npy",
+    )
+
+    canvas = ZarrPredictionCanvas(
+        tmp_path / "raw.zarr",
+        canvas_shape=(50, 60),
+        locations=locations,
+        chunk_shape=(16, 16),
+    )
+    for start in range(0, len(locations), 10):
+        canvas.merge(
+            predictions[start : start + 10],
+            locations[start : start + 10],
+        )
+        # chunks are written as soon as no later patch touches them
+        assert len(canvas._pending) < len(canvas._last_patch)
+    output = canvas.close()
+    assert not canvas._pending
+    assert output.chunks == (16, 16, 2)
+    assert np.allclose(output[:], expected, atol=1e-5)
+    del expected  # release the memmap
+
+    # untouched chunks are not stored
+    canvas = ZarrPredictionCanvas(
+        tmp_path / "sparse.zarr",
+        canvas_shape=(64, 64),
+        locations=[[0, 0, 8, 8]],
+        chunk_shape=(16, 16),
+    )
+    canvas.merge([np.ones((8, 8))], [[0, 0, 8, 8]])
+    output = canvas.close()
+    assert output.nchunks_initialized == 1
+    assert np.sum(output[:]) == 64
+
+
+def test_functional_segmentor_zarr_output(tmp_path: Path) -> None:
+    """Test predicting with a Zarr output gives the same merged output."""
+    img_path = tmp_path / "tile.png"
+    imwrite(img_path, RNG.integers(0, 255, (300, 400, 3), dtype=np.uint8))
+    ioconfig = IOSegmentorConfig(
+        input_resolutions=[{"units": "baseline", "resolution": 1.0}],
+        output_resolutions=[{"units": "baseline", "resolution": 1.0}],
+        patch_input_shape=[128, 128],
+        patch_output_shape=[128, 128],
+        stride_shape=[96, 96],
+    )
+    semantic_segmentor = SemanticSegmentor(batch_size=BATCH_SIZE, model=_CNNTo1())
+    outputs = {}
+    for output_type in ["npy", "zarr"]:
+        output_list = semantic_segmentor.predict(
+            [img_path],
+            mode="tile",
+            on_gpu=ON_GPU,
+            ioconfig=ioconfig,
+            crash_on_exception=True,
+            save_dir=tmp_path / output_type,
+            output_type=output_type,
+        )
+        save_path = output_list[0][1]
+        if output_type == "npy":
+            outputs[output_type] = np.load(f"{save_path}.raw.0.npy")
+        else:
+            outputs[output_type] = zarr.open(f"{save_path}.raw.0.zarr", mode="r")[:]
+    assert outputs["zarr"].shape == (300, 400, 1)
+    assert np.allclose(outputs["zarr"], outputs["npy"])
+
+    with pytest.raises(ValueError, match="not a valid output type"):
+        semantic_segmentor.predict(
+            [img_path],
+            mode="tile",
+            ioconfig=ioconfig,
+            save_dir=tmp_path / "invalid",
+            output_type="tiff",
+        )
+
+
+def test_functional_segmentor_pipelined(tmp_path: Path) -> None:
+    """Test pipelined post-processing gives the same merged output."""
+    img_path = tmp_path / "tile.png"
+    imwrite(img_path, RNG.integers(0, 255, (300, 400, 3), dtype=np.uint8))
+    ioconfig = IOSegmentorConfig(
+        input_resolutions=[{"units": "baseline", "resolution": 1.0}],
+        output_resolutions=[{"units": "baseline", "resolution": 1.0}],
+        patch_input_shape=[128, 128],
+        patch_output_shape=[128, 128],
+        stride_shape=[64, 64],
+    )
+    semantic_segmentor = SemanticSegmentor(batch_size=2, model=_CNNTo1())
+    outputs = {}
+    for pipeline_depth in [0, 2]:
+        semantic_segmentor.pipeline_depth = pipeline_depth
+        output_list = semantic_segmentor.predict(
+            [img_path],
+            mode="tile",
+            on_gpu=ON_GPU,
+            ioconfig=ioconfig,
+            crash_on_exception=True,
+            save_dir=tmp_path / str(pipeline_depth),
+        )
+        outputs[pipeline_depth] = np.load(f"{output_list[0][1]}.raw.0.npy")
+    assert np.allclose(outputs[0], outputs[2])
+
+
+def test_run_pipelined() -> None:
+    """Test running items through a bounded pipeline."""
+    results = []
+    _run_pipelined(range(10), results.append, max_pending=2)
+    assert results == list(range(10))
+
+    def fail(item: int) -> None:
+        """Fail on the third item."""
+        if item == 2:
+            msg = "Processing failed."
+            raise ValueError(msg)
+
+    with pytest.raises(ValueError, match="Processing failed"):
+        _run_pipelined(range(100), fail, max_pending=2)
+
+    def produce() -> Iterator[int]:
+        """Fail after producing some items."""
+        yield from range(3)
+        msg = "Producing failed."
+        raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError, match="Producing failed"):
+        _run_pipelined(produce(), results.append, max_pending=2)
+
+
 def test_functional_segmentor(
     remote_sample: Callable,
     tmp_path: Path,
@@ -5,6 +5,9 @@ import json
 import pickle
 import sqlite3
 import sys
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from itertools import repeat, zip_longest
 from pathlib import Path
 from timeit import timeit
@@ -618,7 +621,10 @@ def test_sqlite_drop_index_error(fill_store: Callable, tmp_path: Path) -> None:
 
 def test_sqlite_store_unsupported_compression(sample_triangle: Polygon) -> None:
     """Test that using an unsupported compression str raises error."""
-    store = SQLiteStore(compression="foo")
+    with pytest.raises(ValueError, match="Unsupported compression method: foo"):
+        SQLiteStore(compression="foo")
+    store = SQLiteStore()
+    store.compression = "foo"
     with pytest.raises(ValueError, match="Unsupported"):
         _ = store.serialise_geometry(sample_triangle)
 
@@ -629,6 +635,42 @@ def test_sqlite_optimize(fill_store: Callable, tmp_path: Path) -> None:
     store.optimize()
 
 
+def test_sqlite_append_geometries_rtree(cell_grid: list[Polygon]) -> None:
+    """Test the rtree is populated for every bulk appended geometry."""
+    store = SQLiteStore()
+    store.bulk_chunk_size = 7
+    keys = store.append_geometries(cell_grid)
+    rows = store.con.execute(
+        """
+        SELECT key, min_x, min_y, max_x, max_y
+        FROM annotations, rtree
+        WHERE annotations.id == rtree.id
+        """,
+    ).fetchall()
+    assert len(rows) == len(cell_grid)
+    bounds = dict(zip(keys, (cell.bounds for cell in cell_grid)))
+    for key, *rtree_bounds in rows:
+        # rtree stores 32-bit floats, rounded outwards
+        assert np.allclose(rtree_bounds, bounds[key], atol=1e-3)
+
+
+def test_sqlite_append_geometries_without_area(cell_grid: list[Polygon]) -> None:
+    """Test bulk appending to a store without an area column."""
+    store = SQLiteStore()
+    store.remove_area_column()
+    keys = store.append_geometries(cell_grid, [{"i": i} for i in range(len(cell_grid))])
+    assert len(store) == len(cell_grid)
+    assert store[keys[1]].properties == {"i": 1}
+    assert store[keys[1]].geometry.equals(cell_grid[1])
+
+
+def test_sqlite_z_order() -> None:
+    """Test points are ordered along a Z-order curve."""
+    points = np.array([[1, 1], [0, 0], [1, 0], [0, 1]])
+    assert SQLiteStore._z_order(points).tolist() == [1, 2, 3, 0]
+    assert SQLiteStore._z_order(np.zeros((0, 2))).tolist() == []
+
+
 def test_sqlite_store_no_compression(sample_triangle: Polygon) -> None:
     """Test that using no compression raises no error."""
     store = SQLiteStore(compression=None)
@@ -637,9 +679,59 @@ def test_sqlite_store_no_compression(sample_triangle: Polygon) -> None:
     assert deserialised.wkb == sample_triangle.wkb
 
 
+def test_sqlite_store_compression_methods() -> None:
+    """Test listing the available compression methods."""
+    methods = SQLiteStore.compression_methods()
+    assert "zlib" in methods
+    assert set(methods) <= {"zlib", "zstd", "lz4"}
+
+
+@pytest.mark.parametrize("compression", SQLiteStore.compression_methods())
+def test_sqlite_store_compression_round_trip(
+    compression: str,
+    cell_grid: list[Polygon],
+    tmp_path: Path,
+) -> None:
+    """Test geometries are unchanged after compression and reopening."""
+    path = tmp_path / f"{compression}.db"
+    store = SQLiteStore(path, compression=compression)
+    keys = store.append_geometries(cell_grid)
+    store.append(Annotation(Point(1, 2)), key="point")
+    store.commit()
+    assert store.deserialize_geometry(
+        store.serialise_geometry(cell_grid[0]),
+    ).equals(cell_grid[0])
+    del store
+
+    store = SQLiteStore(path)
+    assert store.compression == compression
+    for key, cell in zip(keys, cell_grid):
+        assert store[key].geometry.equals(cell)
+    assert store["point"].geometry == Point(1, 2)
+
+
+@pytest.mark.parametrize(
+    ("compression", "level"),
+    [("zlib", 9), ("zstd", 3), ("lz4", 1), (None, None)],
+)
+def test_sqlite_store_default_compression_level(
+    compression: str | None,
+    level: int | None,
+) -> None:
+    """Test each compression method has its own default level."""
+    if compression not in [None, *SQLiteStore.compression_methods()]:
+        pytest.skip(f"{compression} is not available")
+    store = SQLiteStore(compression=compression)
+    assert store.compression_level == level
+    assert (
+        SQLiteStore(compression=compression, compression_level=2).compression_level == 2
+    )
+
+
 def test_sqlite_store_unsupported_decompression() -> None:
     """Test that using an unsupported decompression str raises error."""
-    store = SQLiteStore(compression="foo")
+    store = SQLiteStore()
+    store.compression = "foo"
     with pytest.raises(ValueError, match="Unsupported"):
         _ = store.deserialize_geometry(b"")
 
@@ -833,6 +925,514 @@ def test_auto_commit(fill_store: Callable, tmp_path: Path) -> None:
     assert len(store) == 2  # check explicitly committing works
 
 
+def test_dictionary_store_spatial_index(cell_grid: list[Polygon]) -> None:
+    """Test the spatial index stays in sync with the stored annotations."""
+    store = DictionaryStore()
+    keys = store.append_many(Annotation(cell) for cell in cell_grid)
+    for key in keys[::3]:
+        store.remove(key)
+    for key in keys[1::3]:
+        store.patch(key, affinity.translate(store[key].geometry, 100, 100))
+    store[keys[0]] = Annotation(Point(5, 5))
+    assert store._num_removed < len(store._bounds_keys)
+
+    bounds = (0, 0, 150, 150)
+    box = Polygon.from_bounds(*bounds)
+    expected = [key for key, ann in store.items() if ann.geometry.intersects(box)]
+    assert list(store.query(bounds)) == expected
+    assert store.iquery(bounds) == expected
+    assert set(store.bquery(bounds)) == {
+        key
+        for key, ann in store.items()
+        if Polygon.from_bounds(*ann.geometry.bounds).intersects(box)
+    }
+    assert len(store.query(bounds, geometry_predicate="disjoint")) == len(
+        store,
+    ) - len(expected)
+    assert list(
+        store.query(bounds, geometry_predicate="centers_within_k", distance=50),
+    ) == [
+        key
+        for key, ann in store.items()
+        if Polygon.from_bounds(*ann.geometry.bounds).centroid.dwithin(
+            box.centroid,
+            50,
+        )
+    ]
+
+    store.clear()
+    assert store.query(bounds) == {}
+    assert store._bounds_keys == []
+
+
+def test_dictionary_store_column_where(cell_grid: list[Polygon]) -> None:
+    """Test vectorised where predicates match per annotation evaluation."""
+    store = DictionaryStore()
+    keys = store.append_many(
+        Annotation(cell, {"type": i % 4, "prob": (i % 10) / 10})
+        for i, cell in enumerate(cell_grid)
+    )
+    store.remove(keys[0])
+    store.patch(keys[1], properties={"type": 2, "prob": 1.0})
+    where = "props['type'] == 2 and props['prob'] > 0.5"
+
+    def where_callable(props: dict) -> bool:
+        """Python equivalent of the where predicate."""
+        return props["type"] == 2 and props["prob"] > 0.5
+
+    expected = store.query(where=where_callable)
+    assert keys[1] in expected
+    assert store._where_mask(where) is not None
+    assert store.query(where=where) == expected
+    assert set(store.bquery(where=where)) == set(expected)
+    assert store.query((0, 0, 100, 100), where=where) == store.query(
+        (0, 0, 100, 100),
+        where=where_callable,
+    )
+    assert store.pquery("*", where=where, unique=False) == {
+        key: ann.properties for key, ann in expected.items()
+    }
+
+    # Columns are only built for the candidates of a spatial query
+    column_lengths = []
+    property_column = store._property_column
+
+    def record_property_column(properties: list, key: str) -> tuple:
+        """Record the length of each column built."""
+        column_lengths.append(len(properties))
+        return property_column(properties, key)
+
+    store._property_column = record_property_column
+    bounds = cell_grid[5].bounds
+    assert store.query(bounds, where=where) == store.query(
+        bounds,
+        where=where_callable,
+    )
+    assert 0 < max(column_lengths) < len(store) // 2
+    del store._property_column
+
+    # Columns are rebuilt after changes
+    store.patch(keys[2], properties={"type": 2, "prob": 0.9})
+    assert keys[2] in store.query(where=where)
+
+    # Properties changed in place are seen by later queries
+    store[keys[2]].properties["prob"] = 0.1
+    assert keys[2] not in store.query(where=where)
+    store[keys[3]].properties.update({"type": 2, "prob": 0.9})
+    assert keys[3] in store.query(where=where)
+
+    # Predicates which can not be vectorised fall back to python
+    store.append(Annotation(Point(0, 0), {"type": [2]}), key="list")
+    assert store._where_mask("props['type'] == 2") is None
+    assert list(store.query(where="props['type'] == [2]")) == ["list"]
+    with pytest.raises(KeyError):
+        store.query(where="props['missing'] == 1")
+
+
+def test_parquet_schema(tmp_path: Path) -> None:
+    """Test the GeoParquet schema and row groups written by to_parquet."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    store = SQLiteStore()
+    store.append_geometries(
+        [Point(i, i) for i in range(5)],
+        [
+            {"type": i, "prob": i / 5, "flag": i > 2, "mixed": i or "a"}
+            for i in range(5)
+        ],
+    )
+    store.to_parquet(tmp_path / "store.parquet", batch_size=2)
+    parquet_file = pq.ParquetFile(tmp_path / "store.parquet")
+    schema = parquet_file.schema_arrow
+    assert parquet_file.metadata.num_row_groups == 3
+    assert schema.field("geometry").type == pa.binary()
+    assert schema.field("type").type == pa.int64()
+    assert schema.field("prob").type == pa.float64()
+    assert schema.field("flag").type == pa.bool_()
+    assert schema.field("mixed").type == pa.string()
+    geo = json.loads(schema.metadata[b"geo"])
+    assert geo["primary_column"] == "geometry"
+    assert geo["columns"]["geometry"]["encoding"] == "WKB"
+    assert json.loads(schema.metadata[b"tiatoolbox"])["json_properties"] == ["mixed"]
+
+    store.append(Annotation(Point(0, 0), {"key": 1}))
+    with pytest.raises(ValueError, match="reserved"):
+        store.to_parquet(tmp_path / "reserved.parquet")
+
+
+def test_parquet_without_pyarrow(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a clear error is raised for GeoParquet files without pyarrow."""
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    store = DictionaryStore()
+    store.append(Annotation(Point(1, 2)))
+    with pytest.raises(ImportError, match="tiatoolbox\\[parquet\\]"):
+        store.to_parquet(tmp_path / "store.parquet")
+    with pytest.raises(ImportError, match="pyarrow is required"):
+        DictionaryStore.from_parquet(tmp_path / "store.parquet")
+
+
+def test_from_parquet_other(tmp_path: Path) -> None:
+    """Test importing a GeoParquet file written by another tool."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    table = pa.table(
+        {
+            "geom": shapely.to_wkb([Point(1, 1), Point(2, 2)]),
+            "class": ["a", None],
+        },
+        metadata={
+            "geo": json.dumps(
+                {"primary_column": "geom", "columns": {"geom": {"encoding": "WKB"}}},
+            ),
+        },
+    )
+    pq.write_table(table, tmp_path / "other.parquet")
+    store = DictionaryStore.from_parquet(tmp_path / "other.parquet")
+    assert sorted((ann.geometry.x, ann.properties) for ann in store.values()) == [
+        (1.0, {"class": "a"}),
+        (2.0, {}),
+    ]
+
+    table = table.replace_schema_metadata(
+        {"geo": json.dumps({"columns": {"geometry": {"encoding": "point"}}})},
+    )
+    pq.write_table(table, tmp_path / "geoarrow.parquet")
+    with pytest.raises(ValueError, match="Unsupported GeoParquet"):
+        DictionaryStore.from_parquet(tmp_path / "geoarrow.parquet")
+
+
+def test_sqlite_read_only(cell_grid: list[Polygon], tmp_path: Path) -> None:
+    """Test querying a read-only store from many threads."""
+    writer = SQLiteStore(tmp_path / "cells.db", auto_commit=False)
+    writer.append_geometries(
+        cell_grid,
+        [{"class": str(i % 3)} for i in range(len(cell_grid))],
+    )
+    writer.commit()
+    # Opening read-only does not modify the file
+    contents = (tmp_path / "cells.db").read_bytes()
+    store = SQLiteStore(tmp_path / "cells.db", read_only=True)
+    assert store.con.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    assert (tmp_path / "cells.db").read_bytes() == contents
+    store.close()
+    writer.close()
+    writer = SQLiteStore(tmp_path / "cells.db", auto_commit=False, wal=True)
+    store = SQLiteStore(tmp_path / "cells.db", read_only=True)
+    assert store.con.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert store.metadata["compression"] == "zlib"
+
+    boxes = [(x, y, x + 100, y + 100) for x in range(0, 250, 50) for y in (0, 100)]
+
+    def count(box: tuple[int, int, int, int]) -> int:
+        """Count annotations using a custom function (REGEXP) in the query."""
+        return len(store.query(box, where="regexp('1', props['class'])"))
+
+    expected = [count(box) for box in boxes]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert list(executor.map(count, boxes)) == expected
+    assert len(store.con._connections) > 1
+
+    # Connections of exited threads are closed, e.g. a thread per request
+    for box in boxes:
+        thread = threading.Thread(target=count, args=(box,))
+        thread.start()
+        thread.join()
+    assert len(store.con._connections) <= 2
+
+    # Uncommitted writes do not block or appear in reads
+    writer.append(Annotation(Point(0, 0)), key="new")
+    assert "new" not in store
+    writer.commit()
+    assert "new" in store
+
+    with pytest.raises(sqlite3.OperationalError, match="readonly"):
+        store.append(Annotation(Point(1, 1)))
+    store.close()
+    assert store.con._connections == {}
+
+
+def test_sqlite_read_only_memory() -> None:
+    """Test a read-only store requires an existing file."""
+    with pytest.raises(ValueError, match="existing database file"):
+        SQLiteStore(read_only=True)
+
+
+def test_sqlite_simplified_geometries(tmp_path: Path) -> None:
+    """Test querying simplified geometries from a SQLiteStore."""
+    circles = [Point(x * 100, 0).buffer(40, quad_segs=64) for x in range(5)]
+    store = SQLiteStore(tmp_path / "circles.db")
+    keys = store.append_geometries(circles)
+    store.append(Annotation(Point(0, 0)), key="point")
+    store.add_simplified_geometries(tolerances=(8, 1))
+    assert store.simplified_tolerances == [1, 8]
+    assert SQLiteStore(tmp_path / "circles.db").simplified_tolerances == [1, 8]
+
+    def num_points(tolerance: float) -> list[int]:
+        """Number of exterior points of each circle queried with tolerance."""
+        result = store.query((0, -50, 500, 50), tolerance=tolerance)
+        assert result["point"].geometry == Point(0, 0)
+        return [len(result[key].geometry.exterior.coords) for key in keys]
+
+    full = num_points(0)
+    assert full == [len(circle.exterior.coords) for circle in circles]
+    assert all(a > b for a, b in zip(full, num_points(2)))
+    assert all(a > b for a, b in zip(num_points(2), num_points(10)))
+    # Predicates use the full geometry
+    assert len(store.query((0, 39.5, 1, 40), tolerance=10)) == 1
+
+    # Patched geometries are not simplified until rebuilt
+    store.patch(keys[0], Point(0, 0).buffer(40, quad_segs=64))
+    assert num_points(10)[0] == full[0]
+    store.add_simplified_geometries(tolerances=(1, 8))
+    assert num_points(10)[0] < full[0]
+
+    # Appended geometries use the full geometry until rebuilt
+    circle = Point(600, 0).buffer(40, quad_segs=64)
+    store.append(Annotation(circle), key="appended")
+    (appended,) = store.append_geometries([circle.buffer(1)])
+    store.append_many([Annotation(circle.buffer(2))])
+    store.patch_many(["patched"], [circle.buffer(3)])
+    result = store.query((550, -50, 650, 50), tolerance=10)
+    assert len(result) == 4
+    assert result["patched"].geometry.equals(circle.buffer(3))
+    assert result["appended"].geometry.equals(circle)
+    assert result[appended].geometry.equals(circle.buffer(1))
+    assert len(store.simplified_tolerances) == 2
+
+    # Geometries which are not smaller when simplified use the full
+    # geometry and are not simplified again
+    box = Polygon.from_bounds(700, 0, 710, 10)
+    store.append(Annotation(box), key="box")
+    store.add_simplified_geometries(tolerances=(1, 8))
+    assert store.query(box.bounds, tolerance=10)["box"].geometry.equals(box)
+    statements = []
+    store.con.set_trace_callback(statements.append)
+    store.add_simplified_geometries(tolerances=(1, 8))
+    store.con.set_trace_callback(None)
+    assert not any(statement.startswith("UPDATE") for statement in statements)
+
+    with pytest.raises(ValueError, match="At least one"):
+        store.add_simplified_geometries(tolerances=())
+    assert len(store.simplified_tolerances) == 2
+
+    store.remove_simplified_geometries()
+    assert store.simplified_tolerances == []
+    assert "simplified_tolerances" not in store.metadata
+    assert num_points(10) == full
+    store.commit()
+
+
+def test_sqlite_density_grid() -> None:
+    """Test maintaining a grid of annotation counts in a SQLiteStore."""
+    store = SQLiteStore()
+    with pytest.raises(ValueError, match="no density grid"):
+        store.density((0, 0, 10, 10))
+    store.append_many(
+        [
+            Annotation(Point(10, 10), {"type": "a"}),
+            Annotation(Point(20, 20), {"type": "a"}),
+            Annotation(Point(-5, 120), {"type": "b"}),
+            Annotation(Point(500, 500), {}),
+        ],
+        keys=["w", "x", "y", "z"],
+    )
+    store.add_density_grid(cell_size=100, levels=3, by="type")
+    density = store.density((-100, 0, 200, 200))
+    assert density.keys() == {"a", "b"}
+    assert density["a"].tolist() == [[0, 0, 2]]
+    assert density["b"].tolist() == [[-1, 1, 1]]
+    assert store.density((0, 0, 1000, 1000), level=2)[None].tolist() == [[1, 1, 1]]
+    assert store.max_density(0) == 2
+    assert store.max_density(2) == 2
+    # The largest count of a level is cached until the store is modified
+    statements = []
+    store.con.set_trace_callback(statements.append)
+    assert store.max_density(0) == 2
+    store.con.set_trace_callback(None)
+    assert statements == []
+
+    # The grid is updated as annotations are added, patched and removed
+    store.append(Annotation(Point(30, 30), {"type": "b"}), key="v")
+    store.remove("w")
+    store.patch("x", Point(150, 50))
+    store.patch("y", properties={"type": "a"})
+    density = store.density((-100, 0, 200, 200))
+    assert sorted(density["a"].tolist()) == [[-1, 1, 1], [1, 0, 1]]
+    assert density["b"].tolist() == [[0, 0, 1]]
+    assert store.max_density(0) == 1
+    assert store.max_density(2) == 2
+    store.add_density_grid(cell_size=1000, levels=1)
+    assert store.max_density(0) == 3
+
+    store.clear()
+    assert store.density((-100, 0, 200, 200)) == {}
+    assert store.max_density(0) == 0
+    store.remove_density_grid()
+    assert store.density_grid is None
+    assert "density_grid" not in store.metadata
+
+
+def test_sqlite_query_cache(cell_grid: list[Polygon]) -> None:
+    """Test caching query results in a SQLiteStore."""
+    assert SQLiteStore().query_cache_info() is None
+    store = SQLiteStore(query_cache_size=2**20)
+    keys = store.append_geometries(cell_grid)
+    bounds = (0, 0, 200, 200)
+
+    result = store.query(bounds, geometry_predicate="bbox_intersects")
+    # A box polygon shares the result of its bounds
+    cached = store.query(
+        Polygon.from_bounds(*bounds),
+        geometry_predicate="bbox_intersects",
+    )
+    assert cached == result
+    assert cached is not result
+    info = store.query_cache_info()
+    assert (info["hits"], info["misses"], info["results"]) == (1, 1, 1)
+    assert 0 < info["bytes"] <= info["max_bytes"]
+    # Different arguments are cached separately
+    store.query(bounds)
+    store.query(bounds, where="props.get('class') == 1")
+    store.query(bounds, where=lambda _: True)
+    assert store.query_cache_info()["results"] == 3
+
+    # Modifying the store invalidates the cache
+    for modify in (
+        lambda: store.append(Annotation(Point(1, 1))),
+        lambda: store.patch(keys[0], Point(2, 2)),
+        lambda: store.remove(keys[1]),
+    ):
+        modify()
+        assert store.query(bounds, geometry_predicate="bbox_intersects") != result
+        result = store.query(bounds, geometry_predicate="bbox_intersects")
+        assert store.query_cache_info()["results"] == 1
+    store.clear()
+    assert store.query(bounds) == {}
+
+    # Least recently used results are evicted to stay within budget
+    store = SQLiteStore(query_cache_size=50_000)
+    store.append_geometries(cell_grid)
+    store.query(bounds)
+    store.query((0, 0, 100, 100))
+    store.query((0, 0, 150, 150))
+    assert store.query_cache_info()["results"] == 2
+    store.query((0, 0, 150, 150))
+    assert store.query_cache_info()["hits"] == 1
+    # Results larger than the budget are not cached
+    store.query((0, 0, 1e6, 1e6))
+    info = store.query_cache_info()
+    assert info["results"] == 2
+    assert info["bytes"] <= info["max_bytes"]
+
+
+def test_sqlite_query_cache_read_only(tmp_path: Path) -> None:
+    """Test the query cache of a read-only store sees changes by a writer."""
+    writer = SQLiteStore(tmp_path / "points.db")
+    writer.append(Annotation(Point(1, 1)), key="a")
+    writer.commit()
+    store = SQLiteStore(
+        tmp_path / "points.db",
+        read_only=True,
+        query_cache_size=2**20,
+    )
+    bounds = (0, 0, 10, 10)
+    assert list(store.query(bounds)) == ["a"]
+    assert list(store.query(bounds)) == ["a"]
+    assert store.query_cache_info()["hits"] == 1
+
+    writer.append(Annotation(Point(2, 2)), key="b")
+    writer.commit()
+    assert sorted(store.query(bounds)) == ["a", "b"]
+    # Also for a thread with a new connection
+    writer.remove("a")
+    writer.commit()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert list(executor.submit(store.query, bounds).result()) == ["b"]
+    assert list(store.query(bounds)) == ["b"]
+    store.close()
+    writer.close()
+
+
+def test_sqlite_geometry_predicates(
+    cell_grid: list[Polygon],
+    points_grid: list[Point],
+) -> None:
+    """Test evaluating geometry predicates for batches of candidates."""
+    store = SQLiteStore()
+    store.bulk_chunk_size = 7
+    geometries = cell_grid + points_grid
+    keys = store.append_geometries(geometries)
+    query_geometry = Polygon.from_bounds(30, 30, 200, 200)
+    for predicate in store._geometry_predicate_names[:-2]:
+        expected = {
+            key
+            for key, geometry in zip(keys, geometries)
+            if getattr(query_geometry, predicate)(geometry)
+            and query_geometry.envelope.intersects(geometry.envelope)
+        }
+        result = store.iquery(query_geometry, geometry_predicate=predicate)
+        assert set(result) == expected
+    assert not shapely.is_prepared(query_geometry)
+    store.commit()
+
+
+def test_sqlite_point_storage(points_grid: list[Point]) -> None:
+    """Test that points are stored and read back from coordinate columns."""
+    store = SQLiteStore()
+    store.bulk_chunk_size = 7
+    keys = store.append_geometries(
+        points_grid,
+        {"class": list(range(len(points_grid)))},
+    )
+    assert len(set(keys)) == len(points_grid)
+    assert all(uuid.UUID(key).version == 4 for key in keys)
+    (num_blobs,) = store.con.execute(
+        "SELECT COUNT(*) FROM annotations WHERE geometry IS NOT NULL",
+    ).fetchone()
+    assert num_blobs == 0
+    geometries = store._geometries_from_columns(
+        [point.x for point in points_grid],
+        [point.y for point in points_grid],
+        [None] * len(points_grid),
+    )
+    assert all(shapely.equals(geometries, points_grid))
+    query_geometry = Polygon.from_bounds(30, 30, 200, 200)
+    result = store.query(query_geometry, geometry_predicate="contains")
+    assert {key: ann.geometry for key, ann in result.items()} == {
+        key: point
+        for key, point in zip(keys, points_grid)
+        if query_geometry.contains(point)
+    }
+    store.commit()
+
+
+def test_sqlite_transform_affine_without_area(
+    cell_grid: list[Polygon],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test affine transforms of stores without an area column, and failures."""
+    store = SQLiteStore()
+    keys = store.append_geometries(cell_grid)
+    store.remove_area_column()
+    store.transform(np.array([[1, 0, 10], [0, 1, 20], [0, 0, 1]]))
+    assert store[keys[0]].geometry.equals(affinity.translate(cell_grid[0], 10, 20))
+
+    def fail(_: list[bytes]) -> list[bytes]:
+        """Fail part way through the transform."""
+        raise RuntimeError
+
+    monkeypatch.setattr(store, "_compress_many", fail)
+    with pytest.raises(RuntimeError):
+        store.transform(np.array([[2, 0, 0], [0, 2, 0], [0, 0, 1]]))
+    assert not store.con.in_transaction
+    assert store[keys[0]].geometry.equals(affinity.translate(cell_grid[0], 10, 20))
+
+
 def test_init_base_class_exception() -> None:
     """Test that the base class cannot be initialized."""
     with pytest.raises(TypeError, match="abstract class"):
@@ -913,6 +1513,69 @@ class TestStore:
         with pytest.raises(ValueError, match="equal"):
             store.append_many(annotations, keys=keys)
 
+    @staticmethod
+    def test_append_geometries(
+        cell_grid: list[Polygon],
+        points_grid: list[Point],
+        tmp_path: Path,
+        store_cls: type[AnnotationStore],
+    ) -> None:
+        """Test bulk append of geometries with properties as columns."""
+        store = store_cls(tmp_path / "polygons")
+        geometries = np.array(cell_grid + points_grid, dtype=object)
+        classes = RNG.integers(0, 7, len(geometries))
+        probs = RNG.random(len(geometries))
+        keys = store.append_geometries(
+            geometries,
+            {"class": classes, "prob": probs},
+        )
+        assert len(keys) == len(geometries)
+        for key, geometry, class_, prob in zip(keys, geometries, classes, probs):
+            annotation = store[key]
+            assert annotation.geometry.equals_exact(geometry, 1e-9)
+            assert annotation.properties == {"class": class_, "prob": prob}
+        # check spatial queries see the new geometries
+        bounds = cell_grid[0].bounds
+        result = store.query(bounds, geometry_predicate="bbox_intersects")
+        expected = [
+            key
+            for key, geometry in zip(keys, geometries)
+            if shapely.box(*bounds).intersects(shapely.box(*geometry.bounds))
+        ]
+        assert set(result) == set(expected)
+
+    @staticmethod
+    def test_append_geometries_records(
+        cell_grid: list[Polygon],
+        tmp_path: Path,
+        store_cls: type[AnnotationStore],
+    ) -> None:
+        """Test bulk append of geometries with properties as records."""
+        store = store_cls(tmp_path / "polygons")
+        properties = [{"class": n % 7} for n, _ in enumerate(cell_grid)]
+        keys = [str(n) for n, _ in enumerate(cell_grid)]
+        returned_keys = store.append_geometries(cell_grid, properties, keys)
+        assert returned_keys == keys
+        assert store["3"].properties == {"class": 3}
+        keys = store.append_geometries(cell_grid)
+        assert store[keys[0]].properties == {}
+        assert len(store) == 2 * len(cell_grid)
+
+    @staticmethod
+    def test_append_geometries_len_mismatch(
+        cell_grid: list[Polygon],
+        tmp_path: Path,
+        store_cls: type[AnnotationStore],
+    ) -> None:
+        """Test bulk append of geometries with properties of wrong length."""
+        store = store_cls(tmp_path / "polygons")
+        with pytest.raises(ValueError, match="equal"):
+            store.append_geometries(cell_grid, {"class": [1]})
+        with pytest.raises(ValueError, match="equal"):
+            store.append_geometries(cell_grid, [{"class": 1}])
+        with pytest.raises(ValueError, match="equal"):
+            store.append_geometries(cell_grid, keys=["foo"])
+
     @staticmethod
     def test_query_bbox(
         fill_store: Callable,
@@ -1239,6 +1902,36 @@ class TestStore:
         assert store_as_df.index.name == "key"
         assert isinstance(store_as_df.geometry.iloc[0], Polygon)
 
+    @staticmethod
+    def test_parquet_round_trip(
+        tmp_path: Path,
+        store_cls: type[AnnotationStore],
+    ) -> None:
+        """Test exporting to and importing from GeoParquet."""
+        pytest.importorskip("pyarrow")
+        store = store_cls()
+        store.append(
+            Annotation(Point(1, 2), {"type": 1, "prob": 0.5, "box": [0, 1]}),
+            key="point",
+        )
+        store.append(
+            Annotation(Polygon.from_bounds(0, 0, 3, 3), {"type": 2, "name": "a"}),
+            key="polygon",
+        )
+        store.append(
+            Annotation(LineString([(0, 0), (1, 1)]), {"prob": 1, "name": None}),
+            key="line",
+        )
+        store.to_parquet(tmp_path / "store.parquet", batch_size=2)
+        loaded = store_cls.from_parquet(tmp_path / "store.parquet", batch_size=2)
+        assert set(loaded.keys()) == set(store.keys())
+        for key, annotation in store.items():
+            assert loaded[key].geometry.equals(annotation.geometry)
+        assert loaded["point"].properties == {"type": 1, "prob": 0.5, "box": [0, 1]}
+        assert loaded["polygon"].properties == {"type": 2, "name": "a"}
+        # Nulls are dropped and ints in a float column become floats
+        assert loaded["line"].properties == {"prob": 1.0}
+
     @staticmethod
     def test_features(
         fill_store: Callable,
@@ -1348,6 +2041,47 @@ class TestStore:
         assert com2.x - com.x == pytest.approx(100)
         assert com2.y - com.y == pytest.approx(100)
 
+    @staticmethod
+    def test_transform_affine(
+        store_cls: type[AnnotationStore],
+        cell_grid: list[Polygon],
+        points_grid: list[Point],
+    ) -> None:
+        """Test transforming a store with an affine transformation matrix."""
+        matrix = np.array([[0, -2, 100], [1.5, 0, -50], [0, 0, 1]])
+        geometries = cell_grid + points_grid
+        store: AnnotationStore = store_cls()
+        store.bulk_chunk_size = 7
+        keys = store.append_many(
+            Annotation(geometry, {"class": i % 3})
+            for i, geometry in enumerate(geometries)
+        )
+        store.transform(matrix)
+        expected = {
+            key: affinity.affine_transform(geometry, [0, -2, 1.5, 0, 100, -50])
+            for key, geometry in zip(keys, geometries)
+        }
+        assert len(store) == len(expected)
+        for key, annotation in store.items():
+            assert annotation.geometry.equals_exact(expected[key], 1e-9)
+            assert annotation.properties == {"class": keys.index(key) % 3}
+        # Spatial queries use the transformed geometries
+        bounds = (-100, -50, 50, 200)
+        assert set(store.iquery(bounds)) == {
+            key
+            for key, geometry in expected.items()
+            if geometry.intersects(Polygon.from_bounds(*bounds))
+        }
+        store.transform(matrix[:2])
+        assert store[keys[0]].geometry.equals_exact(
+            affinity.affine_transform(expected[keys[0]], [0, -2, 1.5, 0, 100, -50]),
+            1e-9,
+        )
+        with pytest.raises(ValueError, match="not affine"):
+            store.transform(np.ones((3, 3)))
+        with pytest.raises(ValueError, match="3x3 or 2x3"):
+            store.transform(np.eye(2))
+
     @staticmethod
     def test_to_geojson_str(
         fill_store: Callable,
@@ -2765,6 +3499,238 @@ class TestStore:
         for v in result.values():
             assert len(v) == 1
 
+    @staticmethod
+    def test_nquery_matches_subqueries(
+        store_cls: type[AnnotationStore],
+        cell_grid: list[Polygon],
+        points_grid: list[Point],
+    ) -> None:
+        """Test bulk neighbourhood search against a query per annotation."""
+        store: AnnotationStore = store_cls()
+        geometries = cell_grid + points_grid
+        store.append_many(
+            Annotation(geometry, {"class": i % 3})
+            for i, geometry in enumerate(geometries)
+        )
+        for mode, n_where in (
+            ("box-box", "props['class'] != 0"),
+            ("boxpoint-boxpoint", "props['class'] > 0"),
+            ("poly-poly", lambda props: props["class"] != 0),
+        ):
+            result = store.nquery(
+                geometry=(0, 0, 150, 150),
+                where="props['class'] == 0",
+                n_where=n_where,
+                distance=30,
+                mode=mode,
+            )
+            sources = store.query((0, 0, 150, 150), where="props['class'] == 0")
+            expected = {}
+            for key, annotation in sources.items():
+                geometry = annotation.geometry
+                if mode == "box-box":
+                    neighbours = store.query(
+                        Polygon.from_bounds(*geometry.buffer(30, cap_style=3).bounds),
+                        geometry_predicate="bbox_intersects",
+                    )
+                    neighbours = {
+                        n_key: n_ann
+                        for n_key, n_ann in neighbours.items()
+                        if n_ann.properties["class"] != 0
+                    }
+                else:
+                    centre = Polygon.from_bounds(*geometry.bounds).centroid
+                    neighbours = {
+                        n_key: n_ann
+                        for n_key, n_ann in store.items()
+                        if n_ann.properties["class"] != 0
+                        and (
+                            centre.distance(
+                                Polygon.from_bounds(*n_ann.geometry.bounds).centroid,
+                            )
+                            if mode == "boxpoint-boxpoint"
+                            else geometry.distance(n_ann.geometry)
+                        )
+                        <= 30
+                    }
+                if neighbours:
+                    expected[key] = neighbours
+            assert expected
+            assert result == expected
+
+    @staticmethod
+    def test_spatial_join(
+        store_cls: type[AnnotationStore],
+        cell_grid: list[Polygon],
+        points_grid: list[Point],
+        tmp_path: Path,
+    ) -> None:
+        """Test joining two stores against a query per annotation."""
+        regions = [
+            Polygon.from_bounds(x, y, x + 120, y + 90)
+            for x in range(0, 800, 150)
+            for y in range(0, 800, 150)
+        ]
+        store: AnnotationStore = store_cls(tmp_path / "regions")
+        store.append_many(
+            Annotation(region, {"class": i % 2}) for i, region in enumerate(regions)
+        )
+        other: AnnotationStore = store_cls(tmp_path / "cells")
+        geometries = cell_grid + points_grid
+        other.append_many(
+            Annotation(geometry, {"class": i % 3})
+            for i, geometry in enumerate(geometries)
+        )
+        for geometry_predicate, distance, other_where in (
+            ("contains", 0, None),
+            ("intersects", 25, "props['class'] > 0"),
+            ("covers", 10, lambda props: props["class"] != 1),
+            ("bbox_intersects", 5, None),
+        ):
+            result = store.spatial_join(
+                other,
+                geometry_predicate,
+                distance=distance,
+                where="props['class'] == 0",
+                other_where=other_where,
+                grouped=True,
+            )
+            expected = {}
+            for key, annotation in store.query(where="props['class'] == 0").items():
+                geometry = annotation.geometry
+                if geometry_predicate == "bbox_intersects":
+                    matches = other.query(
+                        Polygon.from_bounds(*geometry.buffer(distance).bounds),
+                        where=other_where,
+                        geometry_predicate="bbox_intersects",
+                    )
+                elif geometry_predicate == "intersects":
+                    matches = {
+                        o_key: o_ann
+                        for o_key, o_ann in other.query(where=other_where).items()
+                        if geometry.distance(o_ann.geometry) <= distance
+                    }
+                else:
+                    matches = other.query(
+                        geometry.buffer(distance),
+                        where=other_where,
+                        geometry_predicate=geometry_predicate,
+                    )
+                if matches:
+                    expected[key] = matches
+            assert expected
+            assert result == expected
+            pairs = store.spatial_join(
+                other,
+                geometry_predicate,
+                distance=distance,
+                where="props['class'] == 0",
+                other_where=other_where,
+            )
+            assert sorted(pairs) == sorted(
+                (key, o_key) for key, matches in expected.items() for o_key in matches
+            )
+        assert store.spatial_join(other, where="props['class'] == 2") == []
+        with pytest.raises(ValueError, match="Unsupported geometry predicate"):
+            store.spatial_join(other, "disjoint")
+        with pytest.raises(ValueError, match="must not be negative"):
+            store.spatial_join(other, distance=-1)
+
+    @staticmethod
+    def test_iter_query(
+        fill_store: Callable,
+        tmp_path: Path,
+        store_cls: type[AnnotationStore],
+    ) -> None:
+        """Test querying annotations in chunks."""
+        _, store = fill_store(store_cls, tmp_path / "polygon.db")
+        for where in (
+            None,
+            "props.get('class') == 1",
+            lambda props: props.get("class") == 1,
+        ):
+            expected = store.query((0, 0, 500, 500), where=where)
+            chunks = list(
+                store.iter_query((0, 0, 500, 500), where=where, chunk_size=7),
+            )
+            assert all(0 < len(chunk) <= 7 for chunk in chunks)
+            result = {}
+            for chunk in chunks:
+                result.update(chunk)
+            assert result == expected
+            assert list(result) == list(expected)
+        assert list(store.iter_query(where="props.get('class') == -1")) == []
+
+    @staticmethod
+    def test_aggregate(store_cls: type[AnnotationStore]) -> None:
+        """Test computing summary statistics of annotations."""
+        store: AnnotationStore = store_cls()
+        store.append_many(
+            [
+                Annotation(Point(0, 0).buffer(1, 1), {"class": 1, "prob": 0.2}),
+                Annotation(Point(5, 5).buffer(2, 1), {"class": 1, "prob": 0.6}),
+                Annotation(Point(5, 5).buffer(1, 1), {"class": 2, "prob": 1.0}),
+                Annotation(Point(50, 50), {"class": 2}),
+            ],
+        )
+        assert store.aggregate() == {None: {"count": 4}}
+        result = store.aggregate(
+            {
+                "n": ("count", "*"),
+                "n_prob": ("count", "props['prob']"),
+                "prob": ("mean", "props['prob']"),
+                "max_prob": ("max", "props['prob']"),
+                "area": ("sum", "area"),
+            },
+            by="props['class']",
+        )
+        assert result.keys() == {1, 2}
+        assert result[1]["n"] == 2
+        assert result[1]["prob"] == pytest.approx(0.4)
+        assert result[1]["max_prob"] == 0.6
+        assert result[1]["area"] == pytest.approx(10)
+        assert result[2]["n"] == 2
+        assert result[2]["n_prob"] == 1
+        # Restricted to a region and filtered
+        result = store.aggregate(
+            {"min_prob": ("min", "props['prob']")},
+            by="props['class']",
+            geometry=(0, 0, 10, 10),
+            where=lambda props: props["class"] == 2,
+        )
+        assert result == {2: {"min_prob": 1.0}}
+        # Histogram
+        result = store.aggregate(by="props['prob']", bins=[0, 0.5, 1])
+        assert result == {(0, 0.5): {"count": 1}, (0.5, 1): {"count": 2}}
+        assert store.aggregate(where="props['class'] == 3") == {}
+
+        with pytest.raises(ValueError, match="Invalid aggregate function"):
+            store.aggregate({"x": ("median", "props['prob']")})
+        with pytest.raises(ValueError, match="'count'"):
+            store.aggregate({"x": ("sum", "*")})
+        with pytest.raises(ValueError, match="`by` must be given"):
+            store.aggregate(bins=[0, 1])
+        with pytest.raises(ValueError, match="two bin edges"):
+            store.aggregate(by="props['prob']", bins=[0])
+
+    @staticmethod
+    def test_get_many(
+        fill_store: Callable,
+        tmp_path: Path,
+        store_cls: type[AnnotationStore],
+    ) -> None:
+        """Test getting annotations by many keys at once."""
+        keys, store = fill_store(store_cls, tmp_path / "polygon.db")
+        store.bulk_chunk_size = 7
+        selected = keys[::-3]
+        result = store.get_many(selected)
+        assert list(result) == selected
+        assert result == {key: store[key] for key in selected}
+        assert list(store.values_for(selected)) == list(result.values())
+        assert store.get_many([]) == {}
+        with pytest.raises(KeyError, match="missing"):
+            store.get_many([*selected, "missing"])
+
     @staticmethod
     def test_invalid_mode_type(store_cls: type[AnnotationStore]) -> None:
         """Test invalid mode type for AnnotationStore."""
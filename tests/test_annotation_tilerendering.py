@@ -207,6 +207,38 @@ def test_decimation(fill_store: Callable, tmp_path: Path) -> None:
     assert num == 17  # expect 17 pts in bottom right quadrant
 
 
+def test_density_rendering(fill_store: Callable, tmp_path: Path) -> None:
+    """Test rendering zoomed out tiles from a density grid."""
+    array = np.ones((1024, 1024))
+    wsi = wsireader.VirtualWSIReader(array, mpp=(1, 1))
+    _, store = fill_store(SQLiteStore, tmp_path / "test.db")
+    store.add_density_grid(cell_size=100, levels=3, by="type")
+    renderer = AnnotationRenderer(
+        score_prop="type",
+        mapper={"cell": (1, 0, 0), "pt": (0, 0, 1), "line": (0, 1, 0)},
+        max_scale=1,
+        zoomed_out_strat="density",
+    )
+    tg = AnnotationTileGenerator(wsi.info, store, renderer, tile_size=256)
+
+    thumb = np.array(tg.get_tile(1, 0, 0))
+    # One cell annotation per 100x100 grid cell
+    assert np.all(thumb[:240, :240, 0] == 255)
+    assert np.all(thumb[:240, :240, 2] == 0)
+    assert np.all(thumb[:240, :240, 3] > 0)
+    thumb = np.array(tg.get_tile(1, 1, 1))
+    assert np.all(thumb[100:200, 100:200, 2] == 255)
+    # The densest cells are opaque
+    assert thumb[..., 3].max() == 255
+
+    # Stores without a density grid use the "scale" strategy
+    store.remove_density_grid()
+    renderer.zoomed_out_strat = "scale"
+    expected = tg.get_tile(1, 0, 0)
+    renderer.zoomed_out_strat = "density"
+    assert np.array_equal(tg.get_tile(1, 0, 0), expected)
+
+
 def test_get_tile_negative_level(fill_store: Callable, tmp_path: Path) -> None:
     """Test for IndexError on negative levels."""
     array = np.ones((1024, 1024))
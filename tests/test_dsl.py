@@ -6,16 +6,21 @@ import sqlite3
 from numbers import Number
 from typing import Callable, ClassVar, Mapping
 
+import numpy as np
 import pytest
 
 from tiatoolbox.annotation.dsl import (
     PY_GLOBALS,
     SQL_GLOBALS,
+    ColumnDictionary,
+    ColumnPredicate,
     SQLJSONDictionary,
     SQLTriplet,
+    column_predicate,
     json_contains,
     json_list_sum,
     py_regexp,
+    to_column,
 )
 
 BINARY_OP_STRINGS = [
@@ -63,6 +68,103 @@ def test_json_contains() -> None:
     assert not json_contains(properties, "foo")
 
 
+COLUMN_ROWS = [
+    {"type": 1, "prob": 0.9, "name": "a", "null": None, "x": 10, "id": 2**53 + 1},
+    {"type": 2, "prob": 0.5, "name": "b", "null": 1, "x": 2**62, "id": 0.5},
+    {"type": 2, "prob": 0.95, "name": "c", "x": -3, "id": 1},
+    {"type": 3, "prob": 0.0, "name": "a", "null": None, "x": 0, "id": 2},
+]
+COLUMN_PREDICATES = [
+    "props['type'] == 2",
+    "(props['type'] == 2) & (props['prob'] > 0.8)",
+    "props['type'] == 2 and props['prob'] > 0.8",
+    "props['type'] == 1 or not props['prob']",
+    "0.4 < props['prob'] <= 0.9",
+    "props['name'] != 'a'",
+    "abs(-props['type']) % 2 == 0",
+    "props['type'] ** 2 // 3 - 1 >= props['prob'] * 2 + 1 / 4",
+    "'null' in props",
+    "'null' not in props",
+    "has_key(props, 'null') | (props['type'] > 2)",
+    "is_none(props.get('null'))",
+    "is_not_none(props.get('null', 0))",
+    "props.get('missing', 3) == props['type']",
+    "True",
+    # Integer overflow and integers which are not exact as floats
+    "props['x'] * 4 > 0",
+    "-props['x'] ** 2 < 0",
+    "props['x'] + 0.5 > 10",
+    "props['x'] / 3 > 1",
+    "props['id'] == 9007199254740992",
+    "props['type'] * 2**62 > 0",
+]
+
+
+def test_column_predicate() -> None:
+    """Test vectorised predicates give the same result as python."""
+
+    def get_column(key: str) -> tuple[np.ndarray, np.ndarray]:
+        """Return a column of values from the sample rows."""
+        return (
+            to_column([row.get(key) for row in COLUMN_ROWS]),
+            np.array([key in row for row in COLUMN_ROWS]),
+        )
+
+    for predicate in COLUMN_PREDICATES:
+        expected = [
+            bool(eval(predicate, PY_GLOBALS, {"props": row}))  # noqa: S307
+            for row in COLUMN_ROWS
+        ]
+        try:
+            result = column_predicate(predicate)(ColumnDictionary(get_column))
+        except (ArithmeticError, TypeError):
+            # Stores evaluate the predicate for each annotation instead
+            assert any(key in predicate for key in ("'x'", "'id'", "2**62"))
+            continue
+        result = np.broadcast_to(result, (4,))
+        assert result.astype(bool).tolist() == expected, predicate
+    columns = ColumnDictionary(get_column)
+    assert ColumnPredicate("props['type'] > props.get('prob')").keys == {
+        "type",
+        "prob",
+    }
+    with pytest.raises(KeyError):
+        ColumnPredicate("props['null'] == 1")(columns)
+    with pytest.raises(FloatingPointError):
+        ColumnPredicate("props['type'] / 0 > 1")(columns)
+
+
+@pytest.mark.parametrize(
+    "predicate",
+    [
+        "props['list'][0] == 1",
+        "1 in props['list']",
+        "regexp('a', props['name'])",
+        "sum(props['list']) > 1",
+        "props[key] == 1",
+        "abs(x=props['type'])",
+        "props['type'] is None",
+        "props['type'] ==",
+    ],
+)
+def test_column_predicate_unsupported(predicate: str) -> None:
+    """Test predicates which can not be vectorised are rejected."""
+    assert column_predicate(predicate) is None
+
+
+def test_to_column() -> None:
+    """Test converting property values to columns."""
+    assert to_column([1, 2.5, True]).dtype == float
+    assert to_column(["a", None]).dtype == object
+    assert to_column([2**53 + 1, 2]).dtype == np.int64
+    with pytest.raises(TypeError, match="too large"):
+        to_column([2**53 + 1, 0.5])
+    with pytest.raises(TypeError, match="scalars"):
+        to_column([[1, 2], [3, 4]])
+    with pytest.raises(TypeError, match="scalars"):
+        to_column([[1, 2], None])
+
+
 def sqlite_eval(query: str | Number) -> bool:
     """Evaluate an SQL predicate on dummy data and return the result.
 
@@ -141,6 +141,34 @@ def test_imresize_no_scale_factor_or_output_size() -> None:
         utils.transforms.imresize(img)
 
 
+def test_imresize_out() -> None:
+    """Test imresize writing into a preallocated output array."""
+    img = RNG.integers(0, 255, (50, 40, 3), dtype=np.uint8)
+    expected = utils.transforms.imresize(img, output_size=(20, 25))
+    out = np.zeros((25, 20, 3), dtype=np.uint8)
+    result = utils.transforms.imresize(img, output_size=(20, 25), out=out)
+    assert result is out
+    assert np.array_equal(out, expected)
+
+    # No resizing required
+    out = np.zeros_like(img)
+    result = utils.transforms.imresize(img, scale_factor=1, out=out)
+    assert result is out
+    assert np.array_equal(out, img)
+
+    # Output of a different dtype
+    out = np.zeros((25, 20, 3), dtype=np.float32)
+    utils.transforms.imresize(img, output_size=(20, 25), out=out)
+    assert np.array_equal(out, expected)
+
+    with pytest.raises(ValueError, match="does not match"):
+        utils.transforms.imresize(
+            img,
+            output_size=(20, 25),
+            out=np.zeros((20, 20, 3), dtype=np.uint8),
+        )
+
+
 def test_background_composite() -> None:
     """Test for background composite."""
     new_im = np.zeros((2000, 2000, 4)).astype("uint8")
@@ -157,6 +185,39 @@ def test_background_composite() -> None:
     assert np.all(im[:, :, 3] == 255)
 
 
+def test_background_composite_out() -> None:
+    """Test background composite writing into a preallocated output array."""
+    rgb = RNG.integers(0, 255, (20, 30, 3), dtype=np.uint8)
+    im = utils.transforms.background_composite(rgb, alpha=False)
+    assert np.array_equal(im, rgb)
+    assert im is not rgb
+    assert np.array_equal(
+        im,
+        utils.transforms.background_composite(Image.fromarray(rgb), alpha=False),
+    )
+
+    out = np.zeros_like(rgb)
+    im = utils.transforms.background_composite(rgb, alpha=False, out=out)
+    assert im is out
+    assert np.array_equal(out, rgb)
+
+    rgba = np.zeros((20, 30, 4), dtype=np.uint8)
+    out = np.zeros((20, 30, 3), dtype=np.uint8)
+    utils.transforms.background_composite(rgba, alpha=False, out=out)
+    assert np.all(out == 255)
+
+
+def test_copy_to_out() -> None:
+    """Test copying into a preallocated output array."""
+    array = np.ones((2, 3))
+    assert misc.copy_to_out(array, None) is array
+    out = np.zeros((2, 3), dtype=np.uint8)
+    assert misc.copy_to_out(array, out) is out
+    assert np.all(out == 1)
+    with pytest.raises(ValueError, match="does not match"):
+        misc.copy_to_out(array, np.zeros((3, 2)))
+
+
 def test_mpp2common_objective_power() -> None:
     """Test approximate conversion of mpp to objective power."""
     mapping = [
@@ -369,6 +430,52 @@ def test_safe_padded_read_stride_shape() -> None:
         utils.image.safe_padded_read(data, bounds, stride=(1, 1, 1))
 
 
+def test_safe_padded_read_out() -> None:
+    """Test safe_padded_read writing into a preallocated output array."""
+    data = RNG.integers(0, 255, (16, 16, 3), dtype=np.uint8)
+    for bounds, kwargs in [
+        ((1, 1, 5, 5), {}),
+        ((-5, -3, 5, 7), {}),
+        ((10, 12, 20, 22), {"pad_constant_values": 7}),
+        ((-5, -3, 5, 7), {"pad_mode": "reflect"}),
+        ((-5, -3, 5, 7), {"pad_mode": "constant", "padding": 2}),
+    ]:
+        expected = utils.image.safe_padded_read(data, bounds, **kwargs)
+        out = np.zeros_like(expected)
+        region = utils.image.safe_padded_read(data, bounds, out=out, **kwargs)
+        assert region is out
+        assert np.array_equal(out, expected)
+
+    with pytest.raises(ValueError, match="does not match"):
+        utils.image.safe_padded_read(
+            data,
+            (-5, -5, 5, 5),
+            out=np.zeros((5, 5, 3), dtype=np.uint8),
+        )
+
+
+def test_sub_pixel_read_out() -> None:
+    """Test sub_pixel_read writing into a preallocated output array."""
+    data = RNG.integers(0, 255, (16, 16, 3), dtype=np.uint8)
+    for bounds in [(0, 0, 8, 8), (-2.5, 1.5, 7.5, 11.5), (8, 8, 0, 0)]:
+        expected = utils.image.sub_pixel_read(
+            data,
+            bounds,
+            output_size=(12, 12),
+            pad_at_baseline=False,
+        )
+        out = np.zeros_like(expected)
+        region = utils.image.sub_pixel_read(
+            data,
+            bounds,
+            output_size=(12, 12),
+            pad_at_baseline=False,
+            out=out,
+        )
+        assert region is out
+        assert np.array_equal(out, expected)
+
+
 def test_sub_pixel_read(source_image: Path) -> None:
     """Test sub-pixel numpy image reads with known tricky parameters."""
     image_path = Path(source_image)
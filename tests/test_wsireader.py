@@ -6,6 +6,7 @@ import json
 import logging
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from pathlib import Path
 
@@ -16,6 +17,7 @@ import cv2
 import glymur
 import numpy as np
 import pytest
+import tifffile
 import zarr
 from click.testing import CliRunner
 from packaging.version import Version
@@ -1947,6 +1949,249 @@ def test_arrayview_single_number_index() -> None:
     assert np.array_equal(view_1, view_2)
 
 
+def test_tile_cache_lru_eviction() -> None:
+    """Test that TileCache evicts least recently used tiles."""
+    tile = np.zeros((8, 8, 3), dtype=np.uint8)  # 192 bytes
+    cache = wsireader.TileCache(max_bytes=tile.nbytes * 2)
+    cache.put("a", tile.copy())
+    cache.put("b", tile.copy())
+    assert cache.get("a") is not None  # "b" is now least recently used
+    cache.put("c", tile.copy())
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+    assert cache.nbytes == tile.nbytes * 2
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    # Tiles larger than the budget are not cached
+    cache.put("d", np.zeros((100, 100, 3), dtype=np.uint8))
+    assert "d" not in cache
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.nbytes, cache.hits, cache.misses) == (0, 0, 0)
+
+
+def test_tile_cache_invalid_max_bytes() -> None:
+    """Test that TileCache raises for a negative byte budget."""
+    with pytest.raises(ValueError, match="max_bytes"):
+        wsireader.TileCache(max_bytes=-1)
+
+
+def test_cached_tile_view() -> None:
+    """Test reading from a CachedTileView gives the same result as numpy."""
+    image = RNG.integers(0, 255, (100, 120, 3), dtype=np.uint8)
+    cache = wsireader.TileCache()
+    view = wsireader.CachedTileView(image, cache, key="foo", tile_shape=(32, 32))
+    assert view.shape == image.shape
+    assert np.array_equal(view[10:70, 5:90, ...], image[10:70, 5:90])
+    assert np.array_equal(view[:50, 90:], image[:50, 90:])
+    assert np.array_equal(view[10:70, 5:90, 1], image[10:70, 5:90, 1])
+    # Strided reads of regions starting on a multiple of the stride
+    assert np.array_equal(view[8:100:4, 0:99:4], image[8:100:4, 0:99:4])
+    # Empty reads
+    assert view[10:10, 5:90].shape == (0, 85, 3)
+    # Overlapping reads hit the cache
+    misses = cache.misses
+    assert np.array_equal(view[20:60, 20:60], image[20:60, 20:60])
+    assert cache.misses == misses
+    assert cache.hits > 0
+
+
+def test_cached_tile_view_invalid_index() -> None:
+    """Test invalid indexing of a CachedTileView."""
+    view = wsireader.CachedTileView(
+        np.zeros((10, 10)),
+        wsireader.TileCache(),
+        key="foo",
+    )
+    with pytest.raises(TypeError, match="slice"):
+        _ = view[0, 0]
+    with pytest.raises(ValueError, match="strides"):
+        _ = view[::2, ::4]
+
+
+@pytest.fixture()
+def tiled_tiff(tmp_path: Path) -> Path:
+    """Write a small random RGB image to a tiled TIFF file."""
+    image = RNG.integers(0, 255, (300, 400, 3), dtype=np.uint8)
+    path = tmp_path / "tiled.tif"
+    tifffile.imwrite(
+        path,
+        image,
+        tile=(64, 64),
+        photometric="rgb",
+        resolution=(2e4, 2e4),
+        resolutionunit="CENTIMETER",
+    )
+    return path
+
+
+def test_tile_cache_tiffreader(tiled_tiff: Path) -> None:
+    """Test reading a tiled TIFF via a TileCache gives identical output."""
+    cache = wsireader.TileCache()
+    wsi = wsireader.TIFFWSIReader(tiled_tiff)
+    cached_wsi = wsireader.TIFFWSIReader(tiled_tiff)
+    cached_wsi.tile_cache = cache
+    for location in [(0, 0), (30, 40), (250, 350), (-20, -20)]:
+        assert np.array_equal(
+            cached_wsi.read_rect(location, (100, 100)),
+            wsi.read_rect(location, (100, 100)),
+        )
+        assert np.array_equal(
+            cached_wsi.read_bounds((*location, location[0] + 80, location[1] + 90)),
+            wsi.read_bounds((*location, location[0] + 80, location[1] + 90)),
+        )
+    assert cache.hits > 0
+    assert all(
+        key[0] == ("TIFFWSIReader", str(tiled_tiff), 0, 0) for key in cache._tiles
+    )
+
+
+def test_tile_cache_openslide(tiled_tiff: Path) -> None:
+    """Test reading with OpenSlide via a TileCache gives identical output."""
+    wsi = wsireader.OpenSlideWSIReader(tiled_tiff)
+    cached_wsi = WSIReader.open(tiled_tiff, tile_cache=wsireader.TileCache())
+    assert isinstance(cached_wsi, wsireader.OpenSlideWSIReader)
+    for location in [(0, 0), (30, 40), (250, 350), (-20, -20)]:
+        assert np.array_equal(
+            cached_wsi.read_rect(location, (100, 100)),
+            wsi.read_rect(location, (100, 100)),
+        )
+        assert np.array_equal(
+            cached_wsi.read_bounds((*location, location[0] + 80, location[1] + 90)),
+            wsi.read_bounds((*location, location[0] + 80, location[1] + 90)),
+        )
+    assert cached_wsi.tile_cache.hits > 0
+
+
+def test_tile_cache_shared_between_readers(tiled_tiff: Path) -> None:
+    """Test readers of the same file with different backends share a cache."""
+    cache = wsireader.TileCache()
+    readers = [
+        wsireader.OpenSlideWSIReader(tiled_tiff),
+        wsireader.TIFFWSIReader(tiled_tiff),
+    ]
+    expected = [wsi.read_rect((30, 40), (100, 100)) for wsi in readers]
+    # OpenSlide decodes RGBA tiles, TIFF decodes RGB tiles
+    for _ in range(2):
+        for wsi, region in zip(readers, expected):
+            wsi.tile_cache = cache
+            assert np.array_equal(wsi.read_rect((30, 40), (100, 100)), region)
+    assert {key[0][0] for key in cache._tiles} == {
+        "OpenSlideWSIReader",
+        "TIFFWSIReader",
+    }
+
+
+def test_read_bounds_batch(tiled_tiff: Path) -> None:
+    """Test batched reads match reading each region on its own."""
+    wsi = wsireader.TIFFWSIReader(tiled_tiff)
+    bounds = np.array([[250, 200, 330, 290], [0, 0, 80, 90], [-20, 30, 60, 120]])
+    batch = wsi.read_bounds_batch(bounds, coord_space="resolution")
+    assert batch.shape == (3, 90, 80, 3)
+    for region, bound in zip(batch, bounds):
+        assert np.array_equal(
+            region,
+            wsi.read_bounds(bound, coord_space="resolution"),
+        )
+    # The temporary tile cache and read parameters are discarded
+    assert wsi.tile_cache is None
+    assert wsi._batch_state() == (None, None)
+
+    out = np.zeros_like(batch)
+    result = wsi.read_rects_batch(bounds[:, :2], (80, 90), out=out)
+    assert result is out
+    assert np.array_equal(out, batch)
+
+
+def test_read_rect_out(tiled_tiff: Path) -> None:
+    """Test reading into a preallocated output array."""
+    for wsi in (
+        wsireader.TIFFWSIReader(tiled_tiff),
+        wsireader.OpenSlideWSIReader(tiled_tiff),
+        wsireader.VirtualWSIReader(tifffile.imread(tiled_tiff)),
+    ):
+        expected = wsi.read_rect((-10, 20), (50, 60))
+        out = np.zeros_like(expected)
+        assert wsi.read_rect((-10, 20), (50, 60), out=out) is out
+        assert np.array_equal(out, expected)
+
+        expected = wsi.read_bounds((20, 30, 120, 90), resolution=0.5, units="baseline")
+        out = np.zeros_like(expected)
+        region = wsi.read_bounds(
+            (20, 30, 120, 90),
+            resolution=0.5,
+            units="baseline",
+            out=out,
+        )
+        assert region is out
+        assert np.array_equal(out, expected)
+
+
+def test_read_bounds_batch_virtual() -> None:
+    """Test batched reads with a VirtualWSIReader at a lower resolution."""
+    image = RNG.integers(0, 255, (300, 400, 3), dtype=np.uint8)
+    wsi = wsireader.VirtualWSIReader(image)
+    locations = np.array([[0, 0], [100, 50], [350, 250]])
+    batch = wsi.read_rects_batch(locations, (32, 32), resolution=0.5, units="baseline")
+    assert batch.shape == (3, 32, 32, 3)
+    for region, location in zip(batch, locations):
+        assert np.array_equal(
+            region,
+            wsi.read_rect(location, (32, 32), resolution=0.5, units="baseline"),
+        )
+
+
+def test_read_bounds_batch_threads() -> None:
+    """Test concurrent batched reads with the same reader."""
+    image = RNG.integers(0, 255, (300, 400, 3), dtype=np.uint8)
+    wsi = wsireader.VirtualWSIReader(image)
+    with wsi._batch_read():
+        tile_cache, memo = wsi._batch_state()
+        assert isinstance(tile_cache, wsireader.TileCache)
+        assert memo == {}
+        # Other threads do not see the temporary state of this batch
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(wsi._batch_state).result() == (None, None)
+        # Nested batches share the state
+        with wsi._batch_read():
+            assert wsi._batch_state()[0] is tile_cache
+    assert wsi._batch_state() == (None, None)
+
+    locations = RNG.integers(0, 250, (16, 2))
+    expected = wsi.read_rects_batch(locations, (48, 48))
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for batch in executor.map(
+            lambda _: wsi.read_rects_batch(locations, (48, 48)),
+            range(8),
+        ):
+            assert np.array_equal(batch, expected)
+
+
+def test_read_bounds_batch_empty() -> None:
+    """Test batched reads of no regions."""
+    wsi = wsireader.VirtualWSIReader(np.zeros((100, 100, 3), dtype=np.uint8))
+    batch = wsi.read_bounds_batch(np.zeros((0, 4)))
+    assert batch.shape == (0, 0, 0, 3)
+    assert batch.dtype == np.uint8
+    batch = wsi.read_rects_batch(np.zeros((0, 2)), (32, 16))
+    assert batch.shape == (0, 16, 32, 3)
+
+
+def test_read_bounds_batch_invalid() -> None:
+    """Test batched reads with invalid input."""
+    wsi = wsireader.VirtualWSIReader(np.zeros((100, 100, 3), dtype=np.uint8))
+    with pytest.raises(ValueError, match="shape"):
+        wsi.read_bounds_batch([0, 0, 10, 10])
+    with pytest.raises(ValueError, match="shape"):
+        wsi.read_rects_batch([[0, 0, 1]], (10, 10))
+    with pytest.raises(ValueError, match="same length"):
+        wsi.read_bounds_batch([[0, 0, 10, 10]], out=np.zeros((2, 10, 10, 3)))
+    with pytest.raises(ValueError, match="does not match"):
+        wsi.read_bounds_batch([[0, 0, 10, 10], [0, 0, 20, 20]])
+
+
 def test_manual_mpp_tuple(sample_svs: Path) -> None:
     """Test setting a manual mpp for a WSI."""
     wsi = wsireader.OpenSlideWSIReader(sample_svs, mpp=(0.123, 0.123))
@@ -2752,6 +2997,16 @@ def test_file_path_does_not_exist() -> None:
             _ = reader_class("./foo.bar")
 
 
+def test_tile_cache_matches_uncached(wsi: WSIReader) -> None:
+    """Test reading via a TileCache gives the same output for each reader."""
+    locations = [(0, 0), (1000, 500), (-50, -50)]
+    expected = [wsi.read_rect(location, (256, 256)) for location in locations]
+    wsi.tile_cache = wsireader.TileCache()
+    for _ in range(2):
+        for location, region in zip(locations, expected):
+            assert np.array_equal(wsi.read_rect(location, (256, 256)), region)
+
+
 def test_read_mpp(wsi: WSIReader) -> None:
     """Test that the mpp is read correctly."""
     assert wsi.info.mpp == pytest.approx(0.25, 1)
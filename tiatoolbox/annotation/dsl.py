@@ -48,6 +48,16 @@ Unsupported operations:
     - Imports: `import re`
     - List length: `len(props["key"])` (support planned)
 
+Vectorised evaluation:
+    Predicates can also be evaluated for many annotations at once when
+    properties are held as columns of values (one NumPy array per
+    property key). See :class:`ColumnPredicate`. This supports property
+    access (`props["key"]`, `props.get("key", default)`), math and
+    comparison operators (including chained comparisons), `&`, `|`,
+    `and`, `or`, `not`, `"key" in props`, `abs`, `has_key`, `is_none`
+    and `is_not_none`. Other operations (e.g. list indexing, `regexp`
+    or `sum`) are not supported and must be evaluated per annotation.
+
 Compile options:
     Some mathematical functions will not function if the compile option
     `ENABLE_MATH_FUNCTIONS` is not set. These are:
@@ -57,13 +67,17 @@ Compile options:
 """
 from __future__ import annotations
 
+import ast
 import json
 import operator
 import re
 from dataclasses import dataclass
+from functools import lru_cache, reduce
 from numbers import Number
 from typing import Callable
 
+import numpy as np
+
 
 @dataclass
 class SQLNone:
@@ -421,6 +435,401 @@ def sql_has_key(dictionary: SQLJSONDictionary, key: str | int) -> SQLTriplet:
     return SQLTriplet(dictionary[key], "is_not_none")
 
 
+# Integers below this magnitude are represented exactly as floats
+_MAX_EXACT_FLOAT_INT = 2**53
+# Integer column results from this magnitude may have overflowed int64
+_MAX_INT_RESULT = 2**62
+
+
+def to_column(values: list[object]) -> np.ndarray:
+    """Convert a list of property values to a column for vectorised evaluation.
+
+    Numeric and boolean values are converted to a numeric array. Other
+    values (e.g. strings or a mix of types including None) are kept as
+    python objects in an object array so that operators behave as they
+    do for the individual values.
+
+    Args:
+        values (list):
+            The property values, one per annotation.
+
+    Returns:
+        np.ndarray:
+            A 1D array of values.
+
+    Raises:
+        TypeError:
+            If the values include lists, which can not be represented
+            as a column, or integers mixed with floats which can not be
+            converted to floats exactly.
+
+    """
+    try:
+        column = np.array(values)
+    except ValueError as error:  # Ragged nested sequences
+        msg = "Property values must be scalars."
+        raise TypeError(msg) from error
+    if column.ndim != 1:
+        msg = "Property values must be scalars."
+        raise TypeError(msg)
+    if column.dtype.kind == "f":
+        large = np.flatnonzero(np.abs(column) >= _MAX_EXACT_FLOAT_INT)
+        if any(isinstance(values[i], int) for i in large):
+            msg = "Integer property values are too large to convert to float."
+            raise TypeError(msg)
+    if column.dtype.kind in "biuf":
+        return column
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def column_is_none(x: np.ndarray | object) -> np.ndarray | bool:
+    """Check which values of a column are None."""
+    if not isinstance(x, np.ndarray):
+        return x is None
+    if x.dtype != object:
+        return np.zeros(x.shape, dtype=bool)
+    return np.array([value is None for value in x], dtype=bool)
+
+
+def column_is_not_none(x: np.ndarray | object) -> np.ndarray | bool:
+    """Check which values of a column are not None."""
+    return np.logical_not(column_is_none(x))
+
+
+class ColumnDictionary:
+    """Representation of properties as columns for vectorised evaluation.
+
+    Each column is fetched at most once per instance, so an instance
+    should be created for each evaluation of a predicate.
+
+    Attributes:
+        get_column (Callable):
+            A function which takes a property key and returns a tuple of
+            the values of that property for every annotation (None where
+            the key is missing) and a boolean array which is True where
+            the key is present.
+
+    """
+
+    def __init__(
+        self: ColumnDictionary,
+        get_column: Callable[[str], tuple[np.ndarray, np.ndarray]],
+    ) -> None:
+        """Initialize :class:`ColumnDictionary`."""
+        self.get_column = lru_cache(maxsize=None)(get_column)
+
+    def __getitem__(self: ColumnDictionary, key: str) -> np.ndarray:
+        """Return the column of values for a property key."""
+        values, present = self.get_column(key)
+        if not present.all():
+            raise KeyError(key)
+        return values
+
+    def get(
+        self: ColumnDictionary,
+        key: str,
+        default: object = None,
+    ) -> np.ndarray:
+        """Return the column of values for a key with a default if missing."""
+        values, present = self.get_column(key)
+        if present.all():
+            return values
+        return np.where(present, values, default)
+
+    def has_key(self: ColumnDictionary, key: str) -> np.ndarray:
+        """Return a boolean array which is True where the key is present."""
+        _, present = self.get_column(key)
+        return present
+
+
+def exact_column_operator(
+    column_operator: Callable[..., object],
+) -> Callable[..., object]:
+    """Wrap an operator to raise where it may not give the python result.
+
+    NumPy integer arithmetic wraps around on overflow, and integers
+    are converted to floats (losing precision beyond 2**53) when
+    combined with floats. Python integers have neither problem, so
+    in these cases an error is raised instead, which makes callers
+    fall back to evaluating the predicate for each annotation.
+
+    Args:
+        column_operator (Callable):
+            The operator to apply to columns (or scalars).
+
+    Returns:
+        Callable:
+            The operator, raising OverflowError if an integer result may
+            have overflowed and TypeError if large integers would be
+            converted to floats.
+
+    """
+
+    def exact_operator(*operands: np.ndarray | object) -> np.ndarray | object:
+        """Apply the operator, checking integer operands and results."""
+        result = column_operator(*operands)
+        kinds = [np.asarray(operand).dtype.kind for operand in operands]
+        if "i" not in kinds and "u" not in kinds:
+            return result
+        if np.asarray(result).dtype.kind in "iu":
+            # Redo the operation with floats to check the magnitude
+            approximate = column_operator(
+                *(np.asarray(operand, dtype=float) for operand in operands),
+            )
+            if np.any(np.abs(approximate) >= _MAX_INT_RESULT):
+                msg = "Integer result may have overflowed."
+                raise OverflowError(msg)
+        elif np.asarray(result).dtype.kind == "f" or "f" in kinds:
+            for operand, kind in zip(operands, kinds):
+                if kind in "iu" and np.any(
+                    np.abs(np.asarray(operand, dtype=float)) >= _MAX_EXACT_FLOAT_INT,
+                ):
+                    msg = "Integers are too large to convert to float exactly."
+                    raise TypeError(msg)
+        return result
+
+    return exact_operator
+
+
+_COLUMN_BINARY_OPERATORS = {
+    ast.Add: exact_column_operator(operator.add),
+    ast.Sub: exact_column_operator(operator.sub),
+    ast.Mult: exact_column_operator(operator.mul),
+    ast.Div: exact_column_operator(operator.truediv),
+    ast.FloorDiv: exact_column_operator(operator.floordiv),
+    ast.Mod: exact_column_operator(operator.mod),
+    ast.Pow: exact_column_operator(operator.pow),
+    ast.BitAnd: operator.and_,
+    ast.BitOr: operator.or_,
+    ast.Eq: exact_column_operator(operator.eq),
+    ast.NotEq: exact_column_operator(operator.ne),
+    ast.Lt: exact_column_operator(operator.lt),
+    ast.LtE: exact_column_operator(operator.le),
+    ast.Gt: exact_column_operator(operator.gt),
+    ast.GtE: exact_column_operator(operator.ge),
+}
+_COLUMN_UNARY_OPERATORS = {
+    ast.Not: np.logical_not,
+    ast.USub: exact_column_operator(operator.neg),
+    ast.UAdd: operator.pos,
+    ast.Invert: operator.invert,
+}
+_COLUMN_FUNCTIONS = {
+    "abs": exact_column_operator(np.abs),
+    "is_none": column_is_none,
+    "is_not_none": column_is_not_none,
+}
+
+
+class ColumnPredicate:
+    """A DSL predicate compiled for evaluation over columns of properties.
+
+    Rather than evaluating a predicate string once per annotation, the
+    expression is parsed once and each operation is applied to whole
+    columns of property values (NumPy arrays) at a time. Python
+    `and`, `or` and `not` are applied element-wise.
+
+    Arithmetic errors (e.g. division by zero) raise an error, as they
+    would when evaluating the predicate for a single annotation. So do
+    integer operations whose NumPy result may differ from python, see
+    :func:`exact_column_operator`.
+
+    Attributes:
+        predicate (str):
+            The predicate string.
+        keys (set):
+            The property keys used by the predicate.
+
+    Raises:
+        ValueError:
+            If the predicate uses an operation which is not supported
+            for vectorised evaluation.
+
+    Example:
+        >>> import numpy as np
+        >>> from tiatoolbox.annotation.dsl import ColumnDictionary, ColumnPredicate
+        >>> columns = {
+        ...     "type": (np.array([1, 2, 2]), np.ones(3, bool)),
+        ...     "prob": (np.array([0.9, 0.5, 0.9]), np.ones(3, bool)),
+        ... }
+        >>> predicate = ColumnPredicate(
+        ...     "props['type'] == 2 and props['prob'] > 0.8",
+        ... )
+        >>> predicate(ColumnDictionary(columns.__getitem__))
+        array([False, False,  True])
+
+    """
+
+    def __init__(self: ColumnPredicate, predicate: str) -> None:
+        """Initialize :class:`ColumnPredicate`."""
+        self.predicate = predicate
+        self.keys = set()
+        self._evaluate = self._compile(ast.parse(predicate, mode="eval").body)
+
+    def __call__(
+        self: ColumnPredicate,
+        columns: ColumnDictionary,
+    ) -> np.ndarray | object:
+        """Evaluate the predicate for columns of properties.
+
+        Args:
+            columns (ColumnDictionary):
+                The properties as columns.
+
+        Returns:
+            np.ndarray or object:
+                The result for each annotation. This is a scalar if the
+                predicate does not use any properties.
+
+        """
+        with np.errstate(all="raise"):
+            return self._evaluate(columns)
+
+    @staticmethod
+    def _is_props(node: ast.AST) -> bool:
+        """Return True if the node is the name `props`."""
+        return isinstance(node, ast.Name) and node.id == "props"
+
+    def _property_key(self: ColumnPredicate, node: ast.AST) -> str:
+        """Return the (constant string) property key of a node."""
+        if isinstance(node, getattr(ast, "Index", ())):  # pragma: no cover
+            node = node.value  # Python 3.8
+        if not (isinstance(node, ast.Constant) and isinstance(node.value, str)):
+            msg = "Property keys must be constant strings."
+            raise ValueError(msg)  # noqa: TRY004
+        self.keys.add(node.value)
+        return node.value
+
+    def _compile(  # noqa: PLR0911
+        self: ColumnPredicate,
+        node: ast.AST,
+    ) -> Callable[[ColumnDictionary], object]:
+        """Compile an expression node to a function of the columns."""
+        if isinstance(node, ast.Constant) and (
+            node.value is None or isinstance(node.value, (Number, str))
+        ):
+            value = node.value
+            return lambda _: value
+        if isinstance(node, ast.Subscript) and self._is_props(node.value):
+            key = self._property_key(node.slice)
+            return lambda columns: columns[key]
+        if isinstance(node, ast.Call):
+            return self._compile_call(node)
+        if isinstance(node, ast.BinOp) and type(node.op) in _COLUMN_BINARY_OPERATORS:
+            binary_op = _COLUMN_BINARY_OPERATORS[type(node.op)]
+            lhs, rhs = self._compile(node.left), self._compile(node.right)
+            return lambda columns: binary_op(lhs(columns), rhs(columns))
+        if isinstance(node, ast.UnaryOp):
+            unary_op = _COLUMN_UNARY_OPERATORS[type(node.op)]
+            operand = self._compile(node.operand)
+            return lambda columns: unary_op(operand(columns))
+        if isinstance(node, ast.BoolOp):
+            bool_op = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+            operands = [self._compile(value) for value in node.values]  # noqa: PD011
+            return lambda columns: reduce(bool_op, (f(columns) for f in operands))
+        if isinstance(node, ast.Compare):
+            return self._compile_compare(node)
+        msg = f"Unsupported expression for vectorised evaluation: {ast.dump(node)}"
+        raise ValueError(msg)
+
+    def _compile_call(
+        self: ColumnPredicate,
+        node: ast.Call,
+    ) -> Callable[[ColumnDictionary], object]:
+        """Compile a function call node to a function of the columns."""
+        func, args = node.func, node.args
+        if node.keywords:
+            msg = "Keyword arguments are not supported."
+            raise ValueError(msg)
+        if (
+            isinstance(func, ast.Attribute)
+            and self._is_props(func.value)
+            and func.attr == "get"
+            and len(args) in (1, 2)
+        ):
+            key = self._property_key(args[0])
+            default = self._compile(args[1]) if args[1:] else lambda _: None
+            return lambda columns: columns.get(key, default(columns))
+        if (
+            isinstance(func, ast.Name)
+            and func.id == "has_key"
+            and len(args) == 2  # noqa: PLR2004
+            and self._is_props(args[0])
+        ):
+            key = self._property_key(args[1])
+            return lambda columns: columns.has_key(key)
+        if (
+            isinstance(func, ast.Name)
+            and func.id in _COLUMN_FUNCTIONS
+            and len(args) == 1
+        ):
+            function = _COLUMN_FUNCTIONS[func.id]
+            arg = self._compile(args[0])
+            return lambda columns: function(arg(columns))
+        msg = f"Unsupported function call for vectorised evaluation: {ast.dump(node)}"
+        raise ValueError(msg)
+
+    def _compile_compare(
+        self: ColumnPredicate,
+        node: ast.Compare,
+    ) -> Callable[[ColumnDictionary], object]:
+        """Compile a (possibly chained) comparison to a function of the columns."""
+        comparisons = []
+        left = node.left
+        for compare_op, right in zip(node.ops, node.comparators):
+            if isinstance(compare_op, (ast.In, ast.NotIn)):
+                # Only key checks (`"key" in props`) can be vectorised
+                if not self._is_props(right):
+                    msg = "Only 'in' checks for keys of props are supported."
+                    raise ValueError(msg)
+                key = self._property_key(left)
+                if isinstance(compare_op, ast.In):
+                    comparisons.append(lambda columns, key=key: columns.has_key(key))
+                else:
+                    comparisons.append(
+                        lambda columns, key=key: np.logical_not(columns.has_key(key)),
+                    )
+            elif type(compare_op) in _COLUMN_BINARY_OPERATORS:
+                binary_op = _COLUMN_BINARY_OPERATORS[type(compare_op)]
+                lhs, rhs = self._compile(left), self._compile(right)
+                comparisons.append(
+                    lambda columns, op=binary_op, lhs=lhs, rhs=rhs: op(
+                        lhs(columns),
+                        rhs(columns),
+                    ),
+                )
+            else:
+                msg = f"Unsupported comparison: {type(compare_op).__name__}."
+                raise ValueError(msg)
+            left = right
+        return lambda columns: reduce(
+            np.logical_and,
+            (compare(columns) for compare in comparisons),
+        )
+
+
+@lru_cache(maxsize=128)
+def column_predicate(predicate: str) -> ColumnPredicate | None:
+    """Return a (cached) :class:`ColumnPredicate` for a predicate string.
+
+    Args:
+        predicate (str):
+            The predicate string.
+
+    Returns:
+        ColumnPredicate or None:
+            The compiled predicate or None if the predicate can not be
+            evaluated for columns.
+
+    """
+    try:
+        return ColumnPredicate(predicate)
+    except (SyntaxError, ValueError):
+        return None
+
+
 # Constants defining the global variables for use in eval() when
 # evaluating expressions.
 
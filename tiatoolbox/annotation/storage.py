@@ -24,9 +24,11 @@ Properties
 """
 from __future__ import annotations
 
+import bisect
 import contextlib
 import copy
 import io
+import itertools
 import json
 import os
 import pickle
@@ -34,24 +36,29 @@ import sqlite3
 import struct
 import sys
 import tempfile
+import threading
 import uuid
 import zlib
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from functools import lru_cache
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import (
     IO,
     TYPE_CHECKING,
+    Any,
     Callable,
     ClassVar,
     Generator,
+    Hashable,
     Iterable,
     Iterator,
 )
 
+import numcodecs
 import numpy as np
 import pandas as pd
 import shapely
@@ -67,13 +74,20 @@ from tiatoolbox import DuplicateFilter, logger
 from tiatoolbox.annotation.dsl import (
     PY_GLOBALS,
     SQL_GLOBALS,
+    ColumnDictionary,
+    column_predicate,
     json_contains,
     json_list_sum,
     py_regexp,
+    to_column,
 )
 from tiatoolbox.enums import GeometryType
 
 if TYPE_CHECKING:  # pragma: no cover
+    from types import ModuleType
+
+    import pyarrow as pa
+
     from tiatoolbox.typing import (
         CallablePredicate,
         CallableSelect,
@@ -88,6 +102,24 @@ sqlite3.enable_callback_tracebacks(True)  # noqa: FBT003
 
 WKB_POINT_STRUCT = struct.Struct("<BIdd")
 
+# Geometry type names as given by `geom_type`, indexed by `shapely.get_type_id`
+SHAPELY_GEOMETRY_TYPES = np.array(
+    [
+        "Point",
+        "LineString",
+        "LinearRing",
+        "Polygon",
+        "MultiPoint",
+        "MultiLineString",
+        "MultiPolygon",
+        "GeometryCollection",
+    ],
+)
+
+# Default compression level of each compression method. For "lz4" this
+# is the acceleration, where higher values are faster but compress less.
+DEFAULT_COMPRESSION_LEVELS = {"zlib": 9, "zstd": 3, "lz4": 1}
+
 # Only Python 3.10+ supports using slots for dataclasses
 # https://docs.python.org/3/library/dataclasses.html#dataclasses.dataclass
 # therefore we use the following workaround to only use them when available.
@@ -95,6 +127,30 @@ WKB_POINT_STRUCT = struct.Struct("<BIdd")
 USE_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}  # pragma: no cover
 
 
+def _import_pyarrow() -> tuple[ModuleType, ModuleType]:
+    """Import pyarrow, which is optional and only used for GeoParquet files.
+
+    Returns:
+        tuple:
+            The `pyarrow` and `pyarrow.parquet` modules.
+
+    Raises:
+        ImportError:
+            If pyarrow is not installed (or can not be imported).
+
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        msg = (
+            "pyarrow is required to read and write GeoParquet files. "
+            "Install it with `pip install tiatoolbox[parquet]`."
+        )
+        raise ImportError(msg) from error
+    return pa, pq
+
+
 @dataclass(frozen=True, init=False, eq=True, **USE_SLOTS)
 class Annotation:
     """An annotation: a geometry and associated properties.
@@ -732,6 +788,78 @@ class AnnotationStore(ABC, MutableMapping):
         result.extend(self.append(annotation) for annotation in annotations)
         return result
 
+    def append_geometries(
+        self: AnnotationStore,
+        geometries: Iterable[Geometry],
+        properties: Iterable[Properties] | dict[str, Iterable] | None = None,
+        keys: Iterable[str] | None = None,
+    ) -> list[str]:
+        """Bulk append of geometries and their properties.
+
+        This avoids creating an :class:`Annotation` per geometry and
+        may be more performant than `append_many` when appending many
+        geometries at once, e.g. the output of a model.
+
+        Args:
+            geometries (iter(Geometry)):
+                An iterable or array of geometries.
+            properties (iter(dict) or dict):
+                The properties of each geometry. Either an iterable of
+                dictionaries or a dictionary of columns, each with one
+                value per geometry. If None, each geometry has empty
+                properties.
+            keys (iter(str)):
+                An iterable of unique keys associated with each geometry being
+                inserted. If None, a new UUID4 is generated for each geometry.
+
+        Returns:
+            list(str):
+                A list of unique keys for the inserted geometries.
+
+        """
+        geometries = list(geometries)
+        properties = self._properties_to_records(properties, len(geometries))
+        return self.append_many(
+            (
+                Annotation(geometry, props)
+                for geometry, props in zip(geometries, properties)
+            ),
+            keys,
+        )
+
+    @staticmethod
+    def _properties_to_records(
+        properties: Iterable[Properties] | dict[str, Iterable] | None,
+        length: int,
+    ) -> list[Properties]:
+        """Convert properties given as records or columns to records.
+
+        Args:
+            properties (iter(dict) or dict):
+                An iterable of dictionaries, a dictionary of columns or
+                None for empty properties.
+            length (int):
+                The expected number of records.
+
+        Returns:
+            list(dict):
+                A list of `length` properties dictionaries.
+
+        """
+        if properties is None:
+            return [{} for _ in range(length)]
+        if isinstance(properties, dict):
+            # tolist converts NumPy scalars to native (JSON serialisable) types
+            columns = {
+                name: np.asarray(values).tolist() for name, values in properties.items()
+            }
+            AnnotationStore._validate_equal_lengths(range(length), *columns.values())
+            rows = zip(*columns.values()) if columns else ([] for _ in range(length))
+            return [dict(zip(columns, row)) for row in rows]
+        properties = list(properties)
+        AnnotationStore._validate_equal_lengths(range(length), properties)
+        return properties
+
     def patch(
         self: AnnotationStore,
         key: str,
@@ -881,6 +1009,47 @@ class AnnotationStore(ABC, MutableMapping):
         for _, annotation in self.items():  # noqa: PERF102
             yield annotation
 
+    def values_for(self: AnnotationStore, keys: Iterable[str]) -> Iterator[Annotation]:
+        """Return an iterator of the annotations with the given keys.
+
+        Back ends may fetch the annotations in batches, which is faster
+        than getting each annotation by key in turn.
+
+        Args:
+            keys (Iterable[str]):
+                The keys of the annotations.
+
+        Returns:
+            Iterator[Annotation]:
+                The annotations, in the order of `keys`.
+
+        Raises:
+            KeyError:
+                If a key is not in the store.
+
+        """
+        for key in keys:
+            yield self[key]
+
+    def get_many(self: AnnotationStore, keys: Iterable[str]) -> dict[str, Annotation]:
+        """Get the annotations with the given keys.
+
+        Args:
+            keys (Iterable[str]):
+                The keys of the annotations.
+
+        Returns:
+            dict:
+                A mapping of keys to annotations, in the order of `keys`.
+
+        Raises:
+            KeyError:
+                If a key is not in the store.
+
+        """
+        keys = list(keys)
+        return dict(zip(keys, self.values_for(keys)))
+
     def __iter__(self: AnnotationStore) -> Iterator[str]:
         """Return an iterable of keys in the store.
 
@@ -927,6 +1096,80 @@ class AnnotationStore(ABC, MutableMapping):
             predicate = pickle.loads(predicate)  # skipcq: BAN-B301  # noqa: S301
         return bool(predicate(properties))
 
+    @staticmethod
+    def _candidate_bounds(
+        query_geometry: Geometry | None,
+        geometry_predicate: str = "intersects",
+        distance: float = 0,
+    ) -> tuple[float, float, float, float] | None:
+        """Return bounds which any result of a geometry query must intersect.
+
+        Every geometry predicate except "disjoint" can only hold if the
+        bounds of the annotation intersect the bounds of the query
+        geometry (or the bounds of the query centre expanded by the
+        distance for "centers_within_k").
+
+        Args:
+            query_geometry (Geometry):
+                The query geometry.
+            geometry_predicate (str):
+                The name of the geometry predicate to be evaluated.
+            distance (float):
+                Distance used for the "centers_within_k" predicate.
+
+        Returns:
+            tuple(float) or None:
+                The bounds (min_x, min_y, max_x, max_y) or None if
+                results are not limited to any bounds.
+
+        """
+        if query_geometry is None or geometry_predicate == "disjoint":
+            return None
+        bounds = query_geometry.bounds
+        if geometry_predicate == "centers_within_k":
+            centre = Polygon.from_bounds(*bounds).centroid
+            bounds = (
+                centre.x - distance,
+                centre.y - distance,
+                centre.x + distance,
+                centre.y + distance,
+            )
+        return bounds
+
+    def _query_candidates(
+        self: AnnotationStore,
+        query_geometry: Geometry | None,  # noqa: ARG002
+        geometry_predicate: str = "intersects",  # noqa: ARG002
+        distance: float = 0,  # noqa: ARG002
+        where: Predicate | None = None,
+    ) -> tuple[Iterable[tuple[str, Annotation]], Predicate | None]:
+        """Return candidate items for a query.
+
+        The default implementation returns all items and the where
+        predicate unchanged. Subclasses with a spatial index or a faster
+        way to evaluate the where predicate should override this.
+
+        Args:
+            query_geometry (Geometry):
+                The query geometry. If None, there is no geometry
+                constraint.
+            geometry_predicate (str):
+                The name of the geometry predicate to be evaluated.
+            distance (float):
+                Distance used for the "centers_within_k" predicate.
+            where (str or bytes or Callable):
+                The properties predicate of the query.
+
+        Returns:
+            tuple:
+                An iterable of key and annotation pairs which may
+                satisfy the query, and the part of the where predicate
+                which must still be evaluated for each of them (None if
+                the candidates already satisfy it).
+
+        """
+        return self.items(), where  # pragma: no cover
+
     def query(
         self: AnnotationStore,
         geometry: QueryGeometry | None = None,
@@ -934,6 +1177,8 @@ class AnnotationStore(ABC, MutableMapping):
         geometry_predicate: str = "intersects",
         min_area: float | None = None,
         distance: float = 0,
+        *,
+        tolerance: float = 0,  # noqa: ARG002
     ) -> dict[str, Annotation]:
         """Query the store for annotations.
 
@@ -983,6 +1228,14 @@ class AnnotationStore(ABC, MutableMapping):
             distance (float):
                 Distance used when performing a distance based query.
                 E.g. "centers_within_k" geometry predicate.
+            tolerance (float):
+                Maximum simplification tolerance of the returned
+                geometries, e.g. the size of a pixel when rendering.
+                Stores with simplified geometries (see
+                :meth:`SQLiteStore.add_simplified_geometries`) may
+                return simplified geometries within this tolerance.
+                Predicates are always evaluated with the full geometry.
+                Defaults to 0 (full geometries).
 
         Returns:
                 list:
@@ -1072,12 +1325,74 @@ class AnnotationStore(ABC, MutableMapping):
                 )
             ) and self._eval_where(where, annotation.properties)
 
+        candidates, where = self._query_candidates(
+            query_geometry,
+            geometry_predicate,
+            distance,
+            where,
+        )
         return {
             key: annotation
-            for key, annotation in self.items()
+            for key, annotation in candidates
             if filter_function(annotation)
         }
 
+    def iter_query(
+        self: AnnotationStore,
+        geometry: QueryGeometry | None = None,
+        where: Predicate | None = None,
+        geometry_predicate: str = "intersects",
+        min_area: float | None = None,
+        distance: float = 0,
+        *,
+        chunk_size: int = 10_000,
+        tolerance: float = 0,
+    ) -> Generator[dict[str, Annotation], None, None]:
+        """Query the store for annotations in chunks.
+
+        Acts the same as :meth:`query` except the result is yielded in
+        chunks, so that stores with results too large to fit in memory
+        at once (e.g. all cells of a whole slide) can be processed. The
+        store should not be modified while iterating.
+
+        Args:
+            geometry (Geometry or Iterable):
+                Geometry to use when querying, see :meth:`query`.
+            where (str or bytes or Callable):
+                Predicate to filter annotations by, see :meth:`query`.
+            geometry_predicate (str):
+                The binary geometry predicate, see :meth:`query`.
+            min_area (float):
+                Minimum area of the annotation geometry.
+            distance (float):
+                Distance used by the "centers_within_k" predicate.
+            chunk_size (int):
+                The maximum number of annotations in each chunk.
+                Defaults to 10,000.
+            tolerance (float):
+                Maximum simplification tolerance of the returned
+                geometries, see :meth:`query`.
+
+        Yields:
+            dict:
+                Chunks of the query result, mapping keys to annotations.
+
+        """
+        # Annotations of in memory stores are already loaded, so only
+        # the result is chunked.
+        result = iter(
+            self.query(
+                geometry,
+                where,
+                geometry_predicate,
+                min_area,
+                distance,
+                tolerance=tolerance,
+            ).items(),
+        )
+        while chunk := dict(itertools.islice(result, chunk_size)):
+            yield chunk
+
     def iquery(
         self: AnnotationStore,
         geometry: QueryGeometry,
@@ -1145,9 +1460,14 @@ class AnnotationStore(ABC, MutableMapping):
         query_geometry = geometry
         if isinstance(query_geometry, Iterable):
             query_geometry = Polygon.from_bounds(*query_geometry)
+        candidates, where = self._query_candidates(
+            query_geometry,
+            geometry_predicate,
+            where=where,
+        )
         return [
             key
-            for key, annotation in self.items()
+            for key, annotation in candidates
             if (
                 self._geometry_predicate(
                     geometry_predicate,
@@ -1232,16 +1552,21 @@ class AnnotationStore(ABC, MutableMapping):
         query_geometry = geometry
         if isinstance(query_geometry, Iterable):
             query_geometry = Polygon.from_bounds(*query_geometry)
+        candidates, where = self._query_candidates(
+            query_geometry,
+            "bbox_intersects",
+            where=where,
+        )
         return {
             key: annotation.geometry.bounds
-            for key, annotation in self.items()
+            for key, annotation in candidates
             if (
                 query_geometry is None
                 or Polygon.from_bounds(*annotation.geometry.bounds).intersects(
                     Polygon.from_bounds(*query_geometry.bounds),
                 )
-                and self._eval_where(where, annotation.properties)
             )
+            and self._eval_where(where, annotation.properties)
         }
 
     def pquery(
@@ -1398,6 +1723,169 @@ class AnnotationStore(ABC, MutableMapping):
             squeeze=squeeze,
         )
 
+    # Functions which can be used by `aggregate`
+    _aggregate_functions: ClassVar[list[str]] = ["count", "sum", "mean", "min", "max"]
+
+    def aggregate(
+        self: AnnotationStore,
+        aggregates: dict[str, tuple[str, str]] | None = None,
+        by: str | None = None,
+        geometry: QueryGeometry | None = None,
+        where: Predicate | None = None,
+        geometry_predicate: str = "intersects",
+        *,
+        bins: Iterable[float] | None = None,
+    ) -> dict[object, dict[str, object]]:
+        """Compute summary statistics of annotations, optionally in groups.
+
+        Back ends may compute these without loading the annotations,
+        e.g. `SQLiteStore` computes them in the database.
+
+        Args:
+            aggregates (dict):
+                A mapping of output names to pairs of an aggregate
+                function and the expression it is applied to. Functions
+                are one of "count", "sum", "mean", "min" and "max".
+                Expressions are strings in the domain specific language
+                (see :mod:`tiatoolbox.annotation.dsl`), "area" for the
+                area of the geometry or "*" (for "count" only) to count
+                annotations. Values which are missing (or None) are
+                ignored. Defaults to `{"count": ("count", "*")}`.
+            by (str):
+                An expression to group annotations by, e.g.
+                "props['class']". Defaults to None (one group).
+            geometry (Geometry or Iterable):
+                Geometry to restrict the annotations to, see
+                :meth:`query`. Defaults to None (no restriction).
+            where (str or bytes or Callable):
+                Predicate to filter annotations by, see :meth:`query`.
+                Defaults to None (no restriction).
+            geometry_predicate (str):
+                The binary geometry predicate, see :meth:`query`.
+            bins (Iterable[float]):
+                Optional increasing bin edges to group the values of
+                `by` into, e.g. to compute a histogram. Groups are keyed
+                by the (lower, upper) edges of the bin. The last bin
+                includes its upper edge and values outside of the bins
+                are ignored.
+
+        Returns:
+            dict:
+                A mapping of group (None when not grouping) to a
+                dictionary of the aggregate values.
+
+        Examples:
+            >>> from tiatoolbox.annotation.storage import SQLiteStore
+            >>> store = SQLiteStore("cells.db")
+            >>> store.aggregate(
+            ...     {"count": ("count", "*"), "area": ("mean", "area")},
+            ...     by="props['type']",
+            ...     geometry=(0, 0, 1000, 1000),
+            ... )
+            {1: {'count': 52, 'area': 102.4}, 2: {'count': 13, 'area': 87.1}}
+            >>> store.aggregate(by="props['prob']", bins=[0, 0.5, 1])
+            {(0, 0.5): {'count': 27}, (0.5, 1): {'count': 38}}
+
+        """
+        aggregates, bins = self._validate_aggregate(aggregates, by, bins)
+        if geometry is None and where is None:
+            annotations = self.values()
+        else:
+            annotations = self.query(
+                geometry,
+                where,
+                geometry_predicate,
+            ).values()
+
+        def evaluate(expression: str, annotation: Annotation) -> object:
+            """Evaluate an aggregate expression for an annotation."""
+            if expression == "*":
+                return 1
+            if expression == "area":
+                return annotation.geometry.area
+            with contextlib.suppress(KeyError):
+                return eval(  # skipcq: PYL-W0123,  # noqa: PGH001, S307
+                    expression,
+                    PY_GLOBALS,
+                    {"props": annotation.properties},
+                )
+            return None
+
+        groups = defaultdict(lambda: defaultdict(list))
+        for annotation in annotations:
+            group = None if by is None else evaluate(by, annotation)
+            if bins is not None:
+                group = self._bin(group, bins)
+                if group is None:
+                    continue
+            for name, (_, expression) in aggregates.items():
+                value = evaluate(expression, annotation)
+                if value is not None:
+                    groups[group][name].append(value)
+
+        reducers = {
+            "count": len,
+            "sum": sum,
+            "mean": lambda values: sum(values) / len(values),
+            "min": min,
+            "max": max,
+        }
+        return {
+            group: {
+                name: (
+                    reducers[function](values[name])
+                    if values[name] or function == "count"
+                    else None
+                )
+                for name, (function, _) in aggregates.items()
+            }
+            for group, values in groups.items()
+        }
+
+    def _validate_aggregate(
+        self: AnnotationStore,
+        aggregates: dict[str, tuple[str, str]] | None,
+        by: str | None,
+        bins: Iterable[float] | None,
+    ) -> tuple[dict[str, tuple[str, str]], list[float] | None]:
+        """Validate the arguments of :meth:`aggregate`.
+
+        Returns:
+            tuple:
+                The aggregates (with the default applied) and the bins
+                as a list (or None).
+
+        """
+        if aggregates is None:
+            aggregates = {"count": ("count", "*")}
+        for function, expression in aggregates.values():
+            if function not in self._aggregate_functions:
+                msg = (
+                    f"Invalid aggregate function {function!r}. Allowed values "
+                    f"are: {', '.join(self._aggregate_functions)}."
+                )
+                raise ValueError(msg)
+            if expression == "*" and function != "count":
+                msg = "Only the 'count' aggregate can be applied to '*'."
+                raise ValueError(msg)
+        if bins is not None:
+            if by is None:
+                msg = "`by` must be given to group values into bins."
+                raise ValueError(msg)
+            bins = list(bins)
+            if len(bins) < 2:  # noqa: PLR2004
+                msg = "At least two bin edges must be given."
+                raise ValueError(msg)
+        return aggregates, bins
+
+    @staticmethod
+    def _bin(value: object, bins: list[float]) -> tuple[float, float] | None:
+        """Return the (lower, upper) edges of the bin containing a value."""
+        if value is None or not bins[0] <= value <= bins[-1]:
+            return None
+        i = min(bisect.bisect_right(bins, value), len(bins) - 1)
+        return bins[i - 1], bins[i]
+
     def nquery(
         self: AnnotationStore,
         geometry: Geometry | None = None,
@@ -1554,107 +2042,422 @@ class AnnotationStore(ABC, MutableMapping):
                 msg,
             )
         from_mode, _ = mode
-
-        # Initial selection of annotations to query around
-        selection = self.query(
+        return self._nquery(
             geometry=geometry,
             where=where,
+            n_where=n_where,
+            distance=distance,
+            geometry_predicate=geometry_predicate,
+            from_mode=from_mode,
         )
 
-        # Query for others within the distance of initial selection
-        result = {}
-        for key, ann in selection.items():
-            geometry = ann.geometry
-            if from_mode == "box":
-                geometry_predicate = "bbox_intersects"
-                min_x, min_y, max_x, max_y = ann.geometry.bounds
-                geometry = Polygon.from_bounds(
-                    min_x - distance,
-                    min_y - distance,
-                    max_x + distance,
-                    max_y + distance,
-                )
-            elif from_mode == "boxpoint":
-                geometry_predicate = "centers_within_k"
-            elif from_mode == "poly":  # pragma: no branch
-                geometry = ann.geometry
-                geometry = geometry.buffer(distance)
-            subquery_result = self.query(
-                geometry=geometry,
-                where=n_where,
-                geometry_predicate=geometry_predicate,
-                distance=distance,
-            )
-            if subquery_result:
-                result[key] = subquery_result
-
-        return result
+    def _nquery(
+        self: AnnotationStore,
+        geometry: Geometry | None,
+        where: Predicate | None,
+        n_where: Predicate | None,
+        distance: float,
+        geometry_predicate: str,
+        from_mode: str,
+    ) -> dict[str, dict[str, Annotation]]:
+        """Find the neighbourhoods of all selected annotations at once.
 
-    @staticmethod
-    def _handle_pquery_results(
-        select: Select,
-        items: Generator[tuple[str, Properties], None, None],
-        get_values: Callable[
-            [Select, Annotation],
-            Properties | object | tuple[object, ...],
-        ],
-        *,
-        unique: bool,
-        squeeze: bool,
-    ) -> dict[str, object] | dict:
-        """Package the results of a pquery into the right output format.
+        Rather than querying around each annotation in turn, the
+        neighbours are found for all annotations in one pass with a
+        :class:`shapely.STRtree` and vectorised distances and
+        predicates. This can be overridden by back ends which can do
+        this more efficiently.
 
         Args:
-            select (str or bytes or Callable):
-                A statement defining the value to look up from the
-                annotation properties. If `select = "*"`, all properties
-                are returned for each annotation (`unique` must be
-                False).
-            unique (bool):
-                If True, only unique values for each selected property
-                will be returned as a list of sets. If False, all values
-                will be returned as a dictionary mapping keys values.
-                Defaults to True.
-            squeeze (bool):
-                If True, when querying for a single value with
-                `unique=True`, the result will be a single set instead
-                of a list of sets.
-            items (Dict[str, Properties]):
-                A dictionary mapping annotation keys/IDs to annotation
-                properties.
-            get_values (Callable):
-                A function to get the values to return from an
-                annotation via a select.
-
-        """  # Q440, Q441
-        result = defaultdict(set) if unique else {}
-        for key, annotation in items:
-            values = get_values(select, annotation)
-            if unique:
-                # Wrap scalar values in a tuple
-                if not isinstance(values, tuple):
-                    values = (values,)
-                # Add each value to the result set
-                for i, value in enumerate(values):
-                    result[i].add(value)
-            else:
-                result[key] = values
-        if unique:
-            result = list(result.values())
-        if unique and squeeze and len(result) == 1:
-            result = result[0]
-        return result  # CCR001
-
-    def features(self: AnnotationStore) -> Generator[dict[str, object], None, None]:
-        """Return annotations as a list of geoJSON features.
+            geometry (Geometry):
+                The geometry to select annotations to search around.
+            where (str or bytes or Callable):
+                The predicate to select annotations to search around.
+            n_where (str or bytes or Callable):
+                The predicate to filter neighbours by.
+            distance (float):
+                The distance to search for neighbours within.
+            geometry_predicate (str):
+                The predicate to use in "poly" mode.
+            from_mode (str):
+                One of "box", "boxpoint" or "poly", see :meth:`nquery`.
 
         Returns:
-            list:
-                List of features as dictionaries.
+            Dict[str, Dict[str, Annotation]]:
+                A dictionary mapping annotation keys to a dictionary of
+                their neighbours, for annotations with any neighbours.
 
         """
-        for a in self.values():
-            yield a.to_feature()
+        sources = self.query(geometry=geometry, where=where)
+        neighbours = (
+            dict(self.items()) if n_where is None else self.query(where=n_where)
+        )
+        if not sources or not neighbours:
+            return {}
+        source_geometries = np.array(
+            [annotation.geometry for annotation in sources.values()],
+        )
+        neighbour_annotations = list(neighbours.values())
+        neighbour_geometries = np.array(
+            [annotation.geometry for annotation in neighbour_annotations],
+        )
+        # Candidate pairs with bounding boxes within the distance
+        source_bounds = shapely.bounds(source_geometries)
+        source_bounds += [-distance, -distance, distance, distance]
+        tree = shapely.STRtree(neighbour_geometries)
+        source_index, neighbour_index = tree.query(shapely.box(*source_bounds.T))
+        is_neighbour = self._neighbour_mask(
+            source_geometries,
+            neighbour_geometries,
+            source_index,
+            neighbour_index,
+            distance,
+            geometry_predicate,
+            from_mode,
+        )
+        return self._group_neighbours(
+            list(sources),
+            list(neighbours),
+            neighbour_annotations,
+            source_index[is_neighbour],
+            neighbour_index[is_neighbour],
+        )
+
+    @staticmethod
+    def _neighbour_mask(
+        source_geometries: np.ndarray,
+        neighbour_geometries: np.ndarray,
+        source_index: np.ndarray,
+        neighbour_index: np.ndarray,
+        distance: float,
+        geometry_predicate: str,
+        from_mode: str,
+    ) -> np.ndarray:
+        """Check which candidate pairs of annotations are neighbours.
+
+        Args:
+            source_geometries (np.ndarray):
+                The geometries to search around.
+            neighbour_geometries (np.ndarray):
+                The candidate neighbour geometries.
+            source_index (np.ndarray):
+                The index of the source geometry of each pair.
+            neighbour_index (np.ndarray):
+                The index of the neighbour geometry of each pair.
+            distance (float):
+                The distance to search for neighbours within.
+            geometry_predicate (str):
+                The predicate to use in "poly" mode.
+            from_mode (str):
+                One of "box", "boxpoint" or "poly", see :meth:`nquery`.
+
+        Returns:
+            np.ndarray:
+                A boolean mask of the pairs which are neighbours.
+
+        """
+        if from_mode == "poly" and geometry_predicate == "intersects":
+            # Equivalent to, but much faster than, intersecting a buffer
+            return shapely.dwithin(
+                source_geometries[source_index],
+                neighbour_geometries[neighbour_index],
+                distance,
+            )
+        if from_mode == "poly":
+            buffers = shapely.buffer(source_geometries, distance)
+            return getattr(shapely, geometry_predicate)(
+                buffers[source_index],
+                neighbour_geometries[neighbour_index],
+            )
+        source_bounds = shapely.bounds(source_geometries)[source_index]
+        neighbour_bounds = shapely.bounds(neighbour_geometries)[neighbour_index]
+        if from_mode == "box":
+            return np.all(
+                neighbour_bounds[:, 2:] >= source_bounds[:, :2] - distance,
+                axis=1,
+            ) & np.all(
+                neighbour_bounds[:, :2] <= source_bounds[:, 2:] + distance,
+                axis=1,
+            )
+        # Bounding box centre to bounding box centre distance
+        offsets = (
+            neighbour_bounds[:, :2]
+            + neighbour_bounds[:, 2:]
+            - source_bounds[:, :2]
+            - source_bounds[:, 2:]
+        ) / 2
+        return np.sum(offsets**2, axis=1) <= distance**2
+
+    @staticmethod
+    def _group_neighbours(
+        source_keys: list[str],
+        neighbour_keys: list[str],
+        neighbour_annotations: list[Annotation],
+        source_index: np.ndarray,
+        neighbour_index: np.ndarray,
+    ) -> dict[str, dict[str, Annotation]]:
+        """Group pairs of neighbouring annotations by the source annotation.
+
+        Args:
+            source_keys (list(str)):
+                The keys of the annotations searched around.
+            neighbour_keys (list(str)):
+                The keys of the neighbour annotations.
+            neighbour_annotations (list(Annotation)):
+                The neighbour annotations.
+            source_index (np.ndarray):
+                The index of the source key of each pair.
+            neighbour_index (np.ndarray):
+                The index of the neighbour of each pair.
+
+        Returns:
+            Dict[str, Dict[str, Annotation]]:
+                A dictionary mapping source keys to a dictionary of
+                their neighbours.
+
+        """
+        result = {}
+        for i, j in zip(source_index.tolist(), neighbour_index.tolist()):
+            result.setdefault(source_keys[i], {})[
+                neighbour_keys[j]
+            ] = neighbour_annotations[j]
+        return result
+
+    def spatial_join(
+        self: AnnotationStore,
+        other: AnnotationStore,
+        geometry_predicate: str = "intersects",
+        distance: float = 0.0,
+        where: Predicate | None = None,
+        other_where: Predicate | None = None,
+        *,
+        grouped: bool = False,
+    ) -> list[tuple[str, str]] | dict[str, dict[str, Annotation]]:
+        """Find all pairs of annotations from two stores which satisfy a predicate.
+
+        This is much faster than querying `other` for each annotation in
+        this store in turn. For example, to find all nuclei inside each
+        tumour region:
+
+        >>> regions.spatial_join(nuclei, "contains")
+
+        Or to find all detections within 50 units of a vessel:
+
+        >>> vessels.spatial_join(detections, distance=50)
+
+        Args:
+            other (AnnotationStore):
+                The store to join with.
+            geometry_predicate (str):
+                The binary predicate to check between the geometry of an
+                annotation in this store (first argument) and one in
+                `other` (second argument). Defaults to "intersects".
+                Any of the store geometry predicates except "disjoint"
+                and "centers_within_k".
+            distance (float):
+                A distance to grow the geometries of this store by
+                before checking the predicate. For "intersects", pairs
+                within `distance` of each other are found. For
+                "bbox_intersects", pairs with bounding boxes within
+                `distance` of each other are found. Defaults to 0.
+            where (str or bytes or Callable):
+                A predicate to select the annotations of this store to
+                join. See :meth:`query` for details. Defaults to None
+                (all annotations).
+            other_where (str or bytes or Callable):
+                A predicate to select the annotations of `other` to
+                join. Defaults to None (all annotations).
+            grouped (bool):
+                Whether to group the results by the annotations of this
+                store. Defaults to False.
+
+        Returns:
+            list or dict:
+                If `grouped` is False, a list of (key, other key) pairs.
+                Otherwise, a dictionary mapping the keys of annotations
+                in this store with any matches to a dictionary of the
+                matching annotations of `other`.
+
+        """
+        self._validate_spatial_join(geometry_predicate, distance)
+        sources = dict(self.items()) if where is None else self.query(where=where)
+        targets = (
+            dict(other.items())
+            if other_where is None
+            else other.query(where=other_where)
+        )
+        if not sources or not targets:
+            return {} if grouped else []
+        source_geometries = np.array(
+            [annotation.geometry for annotation in sources.values()],
+        )
+        target_annotations = list(targets.values())
+        target_geometries = np.array(
+            [annotation.geometry for annotation in target_annotations],
+        )
+        # Candidate pairs with bounding boxes within the distance
+        source_bounds = shapely.bounds(source_geometries)
+        source_bounds += [-distance, -distance, distance, distance]
+        tree = shapely.STRtree(target_geometries)
+        source_index, target_index = tree.query(shapely.box(*source_bounds.T))
+        is_match = self._spatial_join_mask(
+            source_geometries,
+            target_geometries,
+            source_index,
+            target_index,
+            geometry_predicate,
+            distance,
+        )
+        source_index = source_index[is_match]
+        target_index = target_index[is_match]
+        if grouped:
+            return self._group_neighbours(
+                list(sources),
+                list(targets),
+                target_annotations,
+                source_index,
+                target_index,
+            )
+        source_keys = list(sources)
+        target_keys = list(targets)
+        return [
+            (source_keys[i], target_keys[j])
+            for i, j in zip(source_index.tolist(), target_index.tolist())
+        ]
+
+    def _validate_spatial_join(
+        self: AnnotationStore,
+        geometry_predicate: str,
+        distance: float,
+    ) -> None:
+        """Validate the arguments of :meth:`spatial_join`.
+
+        Raises:
+            ValueError:
+                If the geometry predicate is not supported for joins or
+                the distance is negative.
+
+        """
+        if geometry_predicate not in self._geometry_predicate_names or (
+            geometry_predicate in ("disjoint", "centers_within_k")
+        ):
+            msg = f"Unsupported geometry predicate for a join: {geometry_predicate}."
+            raise ValueError(msg)
+        if distance < 0:
+            msg = "The distance must not be negative."
+            raise ValueError(msg)
+
+    @staticmethod
+    def _spatial_join_mask(
+        source_geometries: np.ndarray,
+        target_geometries: np.ndarray,
+        source_index: np.ndarray,
+        target_index: np.ndarray,
+        geometry_predicate: str,
+        distance: float,
+    ) -> np.ndarray:
+        """Check which candidate pairs of a spatial join satisfy the predicate.
+
+        Args:
+            source_geometries (np.ndarray):
+                The geometries of the first store.
+            target_geometries (np.ndarray):
+                The geometries of the second store.
+            source_index (np.ndarray):
+                The index of the source geometry of each pair.
+            target_index (np.ndarray):
+                The index of the target geometry of each pair.
+            geometry_predicate (str):
+                The predicate to check, see :meth:`spatial_join`.
+            distance (float):
+                The distance to grow the source geometries by.
+
+        Returns:
+            np.ndarray:
+                A boolean mask of the pairs which satisfy the predicate.
+
+        """
+        if geometry_predicate == "bbox_intersects":
+            # Candidates are exactly the pairs with intersecting boxes
+            return np.ones(len(source_index), dtype=bool)
+        if geometry_predicate == "intersects":
+            return shapely.dwithin(
+                source_geometries[source_index],
+                target_geometries[target_index],
+                distance,
+            )
+        if distance > 0:
+            source_geometries = shapely.buffer(source_geometries, distance)
+        return getattr(shapely, geometry_predicate)(
+            source_geometries[source_index],
+            target_geometries[target_index],
+        )
+
+    @staticmethod
+    def _handle_pquery_results(
+        select: Select,
+        items: Generator[tuple[str, Properties], None, None],
+        get_values: Callable[
+            [Select, Annotation],
+            Properties | object | tuple[object, ...],
+        ],
+        *,
+        unique: bool,
+        squeeze: bool,
+    ) -> dict[str, object] | dict:
+        """Package the results of a pquery into the right output format.
+
+        Args:
+            select (str or bytes or Callable):
+                A statement defining the value to look up from the
+                annotation properties. If `select = "*"`, all properties
+                are returned for each annotation (`unique` must be
+                False).
+            unique (bool):
+                If True, only unique values for each selected property
+                will be returned as a list of sets. If False, all values
+                will be returned as a dictionary mapping keys values.
+                Defaults to True.
+            squeeze (bool):
+                If True, when querying for a single value with
+                `unique=True`, the result will be a single set instead
+                of a list of sets.
+            items (Dict[str, Properties]):
+                A dictionary mapping annotation keys/IDs to annotation
+                properties.
+            get_values (Callable):
+                A function to get the values to return from an
+                annotation via a select.
+
+        """  # Q440, Q441
+        result = defaultdict(set) if unique else {}
+        for key, annotation in items:
+            values = get_values(select, annotation)
+            if unique:
+                # Wrap scalar values in a tuple
+                if not isinstance(values, tuple):
+                    values = (values,)
+                # Add each value to the result set
+                for i, value in enumerate(values):
+                    result[i].add(value)
+            else:
+                result[key] = values
+        if unique:
+            result = list(result.values())
+        if unique and squeeze and len(result) == 1:
+            result = result[0]
+        return result  # CCR001
+
+    def features(self: AnnotationStore) -> Generator[dict[str, object], None, None]:
+        """Return annotations as a list of geoJSON features.
+
+        Returns:
+            list:
+                List of features as dictionaries.
+
+        """
+        for a in self.values():
+            yield a.to_feature()
 
     def to_geodict(self: AnnotationStore) -> dict[str, object]:
         """Return annotations as a dictionary in geoJSON format.
@@ -2007,26 +2810,353 @@ class AnnotationStore(ABC, MutableMapping):
         )
         return pd.json_normalize(features).set_index("key")
 
+    def _export_batches(
+        self: AnnotationStore,
+        batch_size: int,
+        *,
+        geometry: bool = True,
+    ) -> Generator[tuple[list[str], list[bytes] | None, list[Properties]], None, None]:
+        """Return batches of annotations for export.
+
+        Args:
+            batch_size (int):
+                The (maximum) number of annotations in each batch.
+            geometry (bool):
+                Whether to include the geometries. If False, None is
+                returned in place of the geometries.
+
+        Yields:
+            tuple:
+                The keys, WKB geometries, and properties of a batch of
+                annotations.
+
+        """
+        items = iter(self.items())
+        while batch := list(itertools.islice(items, batch_size)):
+            keys, annotations = zip(*batch)
+            wkb = None
+            if geometry:
+                wkb = list(shapely.to_wkb([ann.geometry for ann in annotations]))
+            yield list(keys), wkb, [ann.properties for ann in annotations]
+
+    @staticmethod
+    def _arrow_property_type(types: set[type]) -> tuple[pa.DataType, bool]:
+        """Return the Arrow type for a property with values of the given types.
+
+        Args:
+            types (set):
+                The python types of the (non-null) property values.
+
+        Returns:
+            tuple:
+                The Arrow type and whether values must be JSON encoded.
+                Lists, dictionaries, and properties with values of mixed
+                types are stored as JSON strings.
+
+        """
+        pa, _ = _import_pyarrow()
+        if not types:
+            return pa.null(), False
+        if types == {bool}:
+            return pa.bool_(), False
+        if types == {int}:
+            return pa.int64(), False
+        if types <= {int, float}:
+            return pa.float64(), False
+        if types == {str}:
+            return pa.string(), False
+        return pa.string(), True
+
+    def _parquet_schema(self: AnnotationStore, batch_size: int) -> pa.Schema:
+        """Return the GeoParquet schema for the annotations in the store.
+
+        This scans the properties of all annotations (in batches) to
+        find the type of each property column.
+
+        Args:
+            batch_size (int):
+                The number of annotations to read at once.
+
+        Returns:
+            pa.Schema:
+                The Arrow schema with GeoParquet metadata.
+
+        """
+        pa, _ = _import_pyarrow()
+        property_types = defaultdict(set)
+        for _, _, properties in self._export_batches(batch_size, geometry=False):
+            for props in properties:
+                for name, value in props.items():
+                    types = property_types[name]  # Columns of only nulls are kept
+                    if value is not None:
+                        types.add(type(value))
+        reserved = {"key", "geometry"}.intersection(property_types)
+        if reserved:
+            msg = f"Property names {sorted(reserved)} are reserved for columns."
+            raise ValueError(msg)
+        fields = [pa.field("key", pa.string()), pa.field("geometry", pa.binary())]
+        json_properties = []
+        for name, types in property_types.items():
+            arrow_type, is_json = self._arrow_property_type(types)
+            fields.append(pa.field(name, arrow_type))
+            if is_json:
+                json_properties.append(name)
+        geo_metadata = {
+            "version": "1.0.0",
+            "primary_column": "geometry",
+            "columns": {"geometry": {"encoding": "WKB", "geometry_types": []}},
+        }
+        return pa.schema(
+            fields,
+            metadata={
+                "geo": json.dumps(geo_metadata),
+                "tiatoolbox": json.dumps(
+                    {
+                        "version": tiatoolbox.__version__,
+                        "json_properties": json_properties,
+                    },
+                ),
+            },
+        )
+
+    def to_parquet(
+        self: AnnotationStore,
+        fp: Path | str | IO,
+        batch_size: int = 100_000,
+        compression: str = "zstd",
+    ) -> None:
+        """Write the annotations to a GeoParquet file.
+
+        The geometry is stored as WKB in a "geometry" column and the
+        key in a "key" column. Each property is stored in a column of
+        its own with a type inferred from the values (bool, int64,
+        float64, or string). Lists, dictionaries, and properties with
+        values of mixed types are stored as JSON strings and decoded
+        again by :meth:`from_parquet`. Missing properties are null.
+
+        Annotations are read and written in row groups of `batch_size`
+        annotations, so memory use does not grow with the size of the
+        store. The properties are read twice, once to find the column
+        types and once to write them.
+
+        For more information on the GeoParquet format see:
+        - GeoParquet Specification: https://geoparquet.org
+
+        Args:
+            fp (Path or str or IO):
+                The file path or handle to write to.
+            batch_size (int):
+                The number of annotations in each row group. Defaults
+                to 100,000.
+            compression (str):
+                The Parquet compression codec. Defaults to "zstd".
+
+        Raises:
+            ImportError:
+                If pyarrow is not installed.
+
+        Example:
+            >>> from tiatoolbox.annotation.storage import SQLiteStore
+            >>> store = SQLiteStore("nuclei.db")
+            >>> store.to_parquet("nuclei.parquet")
+            >>> store = SQLiteStore.from_parquet("nuclei.parquet")
+
+        """
+        pa, pq = _import_pyarrow()
+        schema = self._parquet_schema(batch_size)
+        json_properties = set(
+            json.loads(schema.metadata[b"tiatoolbox"])["json_properties"],
+        )
+        with pq.ParquetWriter(fp, schema, compression=compression) as writer:
+            for keys, wkb, properties in self._export_batches(batch_size):
+                columns = [pa.array(keys, pa.string()), pa.array(wkb, pa.binary())]
+                for arrow_field in list(schema)[2:]:
+                    values = [props.get(arrow_field.name) for props in properties]
+                    if arrow_field.name in json_properties:
+                        values = [
+                            None if value is None else json.dumps(value)
+                            for value in values
+                        ]
+                    columns.append(pa.array(values, arrow_field.type))
+                writer.write_table(
+                    pa.Table.from_arrays(columns, schema=schema),
+                    row_group_size=batch_size,
+                )
+
+    @classmethod
+    def from_parquet(
+        cls: type[AnnotationStore],
+        fp: Path | str | IO,
+        batch_size: int = 100_000,
+    ) -> AnnotationStore:
+        """Create a new store with annotations loaded from a GeoParquet file.
+
+        Args:
+            fp (Path or str or IO):
+                The file path or handle to load from.
+            batch_size (int):
+                The number of annotations to read at once. Defaults to
+                100,000.
+
+        Returns:
+            AnnotationStore:
+                A new annotation store with the annotations loaded from
+                the file.
+
+        Raises:
+            ImportError:
+                If pyarrow is not installed.
+
+        """
+        _import_pyarrow()
+        store = cls()
+        store.add_from_parquet(fp, batch_size)
+        return store
+
+    def add_from_parquet(
+        self: AnnotationStore,
+        fp: Path | str | IO,
+        batch_size: int = 100_000,
+    ) -> None:
+        """Add annotations from a GeoParquet file to an existing store.
+
+        The file may be one written by :meth:`to_parquet` or any
+        GeoParquet file with a WKB encoded primary geometry column. A
+        "key" column is used for the annotation keys if present,
+        otherwise new keys are generated. All other columns are loaded
+        as properties. Null values are not added to the properties.
+
+        Args:
+            fp (Path or str or IO):
+                The file path or handle to load from.
+            batch_size (int):
+                The number of annotations to read and add at once.
+                Defaults to 100,000.
+
+        Raises:
+            ImportError:
+                If pyarrow is not installed.
+
+        """
+        _, pq = _import_pyarrow()
+        parquet_file = pq.ParquetFile(fp)
+        metadata = parquet_file.schema_arrow.metadata or {}
+        geo_metadata = json.loads(metadata.get(b"geo", b"{}"))
+        geometry_column = geo_metadata.get("primary_column", "geometry")
+        encoding = (
+            geo_metadata.get("columns", {})
+            .get(geometry_column, {})
+            .get("encoding", "WKB")
+        )
+        if encoding.upper() != "WKB":
+            msg = f"Unsupported GeoParquet geometry encoding: {encoding}."
+            raise ValueError(msg)
+        json_properties = set(
+            json.loads(metadata.get(b"tiatoolbox", b"{}")).get("json_properties", []),
+        )
+        for batch in parquet_file.iter_batches(batch_size=batch_size):
+            columns = batch.to_pydict()
+            geometries = shapely.from_wkb(columns.pop(geometry_column))
+            keys = columns.pop("key", None)
+            properties = [
+                {
+                    name: json.loads(value) if name in json_properties else value
+                    for name, value in zip(columns, row)
+                    if value is not None
+                }
+                for row in zip(*columns.values())
+            ] or [{} for _ in geometries]
+            self.append_geometries(geometries, properties, keys=keys)
+
     def transform(
         self: AnnotationStore,
-        transform: Callable[[Geometry], Geometry],
+        transform: Callable[[Geometry], Geometry] | np.ndarray,
     ) -> None:
         """Transform all annotations in the store using provided function.
 
         Useful for transforming coordinates from slide space into
         patch/tile/core space, or to a different resolution, for example.
 
+        An affine transformation, e.g. the result of registration used
+        by :class:`AffineWSITransformer`, may instead be given as a
+        matrix. This is applied to the coordinates of all geometries at
+        once, which is much faster than calling a function for each
+        geometry.
+
         Args:
-            transform (Callable[Geometry, Geometry]):
+            transform (Callable[Geometry, Geometry] or np.ndarray):
                 A function that takes a geometry and returns a new
-                transformed geometry.
+                transformed geometry, or a 3x3 (or 2x3) affine
+                transformation matrix acting on homogeneous (x, y, 1)
+                coordinates.
+
+        Examples:
+            >>> # Scale by 2 and translate by (100, 50)
+            >>> store.transform(np.array([[2, 0, 100], [0, 2, 50], [0, 0, 1]]))
 
         """
+        if isinstance(transform, np.ndarray):
+            self._transform_affine(*self._affine_parts(transform))
+            return
         transformed_geoms = {
             key: transform(annotation.geometry) for key, annotation in self.items()
         }
         self.patch_many(transformed_geoms.keys(), transformed_geoms.values())
 
+    @staticmethod
+    def _affine_parts(matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Split an affine transformation matrix into its parts.
+
+        Args:
+            matrix (np.ndarray):
+                A 3x3 or 2x3 affine transformation matrix.
+
+        Returns:
+            tuple:
+                The 2x2 linear part and the translation of length 2.
+
+        Raises:
+            ValueError:
+                If the matrix is not an affine transformation matrix.
+
+        """
+        matrix = np.asarray(matrix, dtype=float)
+        if matrix.shape not in ((2, 3), (3, 3)):
+            msg = f"Expected a 3x3 or 2x3 matrix, got shape {matrix.shape}."
+            raise ValueError(msg)
+        if matrix.shape == (3, 3) and not np.allclose(matrix[2], [0, 0, 1]):
+            msg = "The transformation matrix is not affine."
+            raise ValueError(msg)
+        return matrix[:2, :2], matrix[:2, 2]
+
+    def _transform_affine(
+        self: AnnotationStore,
+        linear: np.ndarray,
+        offset: np.ndarray,
+    ) -> None:
+        """Apply an affine transformation to all annotations.
+
+        The coordinates of all geometries are transformed at once with
+        :func:`shapely.transform`. This can be overridden by back ends
+        which can do this more efficiently.
+
+        Args:
+            linear (np.ndarray):
+                The 2x2 linear part of the transformation.
+            offset (np.ndarray):
+                The translation of the transformation.
+
+        """
+        items = list(self.items())
+        if not items:
+            return
+        keys, annotations = zip(*items)
+        geometries = shapely.transform(
+            np.array([annotation.geometry for annotation in annotations]),
+            lambda coords: coords @ linear.T + offset,
+        )
+        self.patch_many(keys, geometries.tolist())
+
     def __del__(self: AnnotationStore) -> None:
         """Implements destructor method.
 
@@ -2109,11 +3239,221 @@ class SQLiteMetadata(MutableMapping):
         return cursor.fetchone()[0]
 
 
+class SQLiteConnectionPool:
+    """A pool of SQLite connections with one connection per thread.
+
+    Behaves like a single :class:`sqlite3.Connection`. Attribute access
+    (e.g. `execute` or `cursor`) is forwarded to the connection of the
+    calling thread, which is created on first use. This allows one
+    :class:`SQLiteStore` to be used from many threads at once. The
+    connections of threads which have exited are closed whenever a new
+    connection is opened, so a server with a thread per request only
+    holds as many connections as it has live threads.
+
+    The connections must be opened with `check_same_thread=False`, so
+    that they can be closed from another thread.
+
+    Attributes:
+        connect (Callable):
+            A function which opens and sets up a new connection.
+
+    """
+
+    def __init__(
+        self: SQLiteConnectionPool,
+        connect: Callable[[], sqlite3.Connection],
+    ) -> None:
+        """Initialize :class:`SQLiteConnectionPool`."""
+        self.connect = connect
+        self._local = threading.local()
+        self._connections: dict[threading.Thread, sqlite3.Connection] = {}
+        self._lock = threading.Lock()
+
+    def connection(self: SQLiteConnectionPool) -> sqlite3.Connection:
+        """Return the connection of the calling thread."""
+        con = getattr(self._local, "con", None)
+        if con is None:
+            con = self.connect()
+            self._local.con = con
+            with self._lock:
+                for thread in [t for t in self._connections if not t.is_alive()]:
+                    self._connections.pop(thread).close()
+                self._connections[threading.current_thread()] = con
+        return con
+
+    def __getattr__(self: SQLiteConnectionPool, name: str) -> object:
+        """Get an attribute of the connection of the calling thread."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.connection(), name)
+
+    def close(self: SQLiteConnectionPool) -> None:
+        """Close the connections of all threads."""
+        with self._lock:
+            for con in self._connections.values():
+                con.close()
+            self._connections = {}
+            self._local = threading.local()
+
+
+class QueryResultCache:
+    """A least recently used cache of query results with a size budget.
+
+    Results are cached along with the write generation of the store
+    when they were queried. Looking up a result from an older
+    generation (i.e. from before the store was modified) clears the
+    cache. The cache is thread safe.
+
+    Attributes:
+        max_bytes (int):
+            The budget for the (approximate) total size of the cached
+            results in bytes.
+        hits (int):
+            The number of lookups which returned a cached result.
+        misses (int):
+            The number of lookups which did not.
+
+    """
+
+    def __init__(self: QueryResultCache, max_bytes: int) -> None:
+        """Initialize :class:`QueryResultCache`."""
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._results: OrderedDict[Hashable, tuple[dict, int]] = OrderedDict()
+        self._nbytes = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self: QueryResultCache,
+        key: Hashable,
+        generation: int,
+    ) -> dict[str, Annotation] | None:
+        """Get a cached result.
+
+        Args:
+            key (Hashable):
+                The normalised query arguments.
+            generation (int):
+                The current write generation of the store.
+
+        Returns:
+            dict:
+                A copy of the cached result, or None if not cached.
+
+        """
+        with self._lock:
+            if generation != self._generation:
+                self._clear(generation)
+            if key not in self._results:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._results.move_to_end(key)
+            return dict(self._results[key][0])
+
+    def put(
+        self: QueryResultCache,
+        key: Hashable,
+        generation: int,
+        result: dict[str, Annotation],
+        nbytes: int,
+    ) -> None:
+        """Cache a result, evicting the least recently used results.
+
+        Args:
+            key (Hashable):
+                The normalised query arguments.
+            generation (int):
+                The write generation of the store when queried.
+            result (dict):
+                The query result.
+            nbytes (int):
+                The approximate size of the result in bytes. Results
+                larger than the budget are not cached.
+
+        """
+        with self._lock:
+            if generation != self._generation:
+                self._clear(generation)
+            if nbytes > self.max_bytes or key in self._results:
+                return
+            self._results[key] = (dict(result), nbytes)
+            self._nbytes += nbytes
+            while self._nbytes > self.max_bytes:
+                _, (_, evicted_nbytes) = self._results.popitem(last=False)
+                self._nbytes -= evicted_nbytes
+
+    def _clear(self: QueryResultCache, generation: int) -> None:
+        """Remove all results and set the generation."""
+        self._results.clear()
+        self._nbytes = 0
+        self._generation = generation
+
+    def info(self: QueryResultCache) -> dict[str, int]:
+        """Return the statistics of the cache.
+
+        Returns:
+            dict:
+                The number of "hits" and "misses", the number of cached
+                "results", their approximate size in "bytes" and the
+                budget "max_bytes".
+
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "results": len(self._results),
+                "bytes": self._nbytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
 class SQLiteStore(AnnotationStore):
     """SQLite backed annotation store.
 
     Uses and rtree index for fast spatial queries.
 
+    Args:
+        connection (Path or str or IO):
+            The path of the database file, or ":memory:" (default) for
+            an in-memory database.
+        compression (str):
+            The compression applied to geometry blobs. One of "zlib"
+            (default), "zstd", "lz4" or None. "zstd" and "lz4" are
+            available if numcodecs is built with them, see
+            :meth:`compression_methods`. They decompress several times
+            faster than "zlib", which speeds up queries.
+        compression_level (int):
+            The compression level. For "lz4" this is the acceleration,
+            where higher values are faster but compress less. Defaults
+            to the default level of the compression method (9 for
+            "zlib", 3 for "zstd" and 1 for "lz4").
+        auto_commit (bool):
+            Whether to commit after each modification.
+        read_only (bool):
+            Open an existing database file for reading only. Each
+            thread gets its own read-only connection (see
+            :class:`SQLiteConnectionPool`), so the store can be queried
+            from many threads at once, e.g. to render tiles in parallel.
+            The database file is never modified. Defaults to False.
+        wal (bool):
+            Switch the database file to write-ahead logging (WAL), so
+            that reads by other connections (e.g. a read-only store)
+            are not blocked while this store writes to the file. The
+            journal mode is stored in the file, so it persists. Ignored
+            for read-only stores. Defaults to False.
+        query_cache_size (int):
+            The budget in bytes for caching the results of `query` (see
+            :class:`QueryResultCache`), e.g. for tiles which are
+            rendered repeatedly. The cache is invalidated whenever the
+            store is modified through this object and, for read-only
+            stores, whenever another connection commits changes to the
+            file. Results are shared between calls, so their
+            annotations must not be modified. Defaults to 0 (no cache).
+
     Version History:
         1.0.0:
             Initial version.
@@ -2122,18 +3462,26 @@ class SQLiteStore(AnnotationStore):
 
     """
 
+    # number of geometries serialised at once by `append_geometries`
+    bulk_chunk_size = 100_000
+    # size of the page cache during `append_geometries`
+    bulk_cache_size_kib = 256 * 1024
+
     @classmethod
     def open(cls: type[SQLiteStore], fp: Path | str) -> SQLiteStore:
         """Opens :class:`SQLiteStore` from file pointer or path."""
         return SQLiteStore(fp)
 
-    def __init__(  # noqa: PLR0915
+    def __init__(
         self: SQLiteStore,
         connection: Path | str | IO = ":memory:",
         compression: str = "zlib",
-        compression_level: int = 9,
+        compression_level: int | None = None,
         *,
         auto_commit: bool = True,
+        read_only: bool = False,
+        wal: bool = False,
+        query_cache_size: int = 0,
     ) -> None:
         """Initialize :class:`SQLiteStore`."""
         super().__init__()
@@ -2178,19 +3526,94 @@ class SQLiteStore(AnnotationStore):
             self.path.is_file()
             and self.path.stat().st_size > 0
         )
-        self.con = sqlite3.connect(str(self.path), isolation_level="DEFERRED")
-        self.con.execute("BEGIN")
+        self.read_only = read_only
+        # Incremented by each modification to invalidate cached queries
+        self.generation = 0
+        # The generation and the largest density grid count of each level
+        self._max_densities: tuple[int, dict[int, int]] = (0, {})
+        self.query_cache = (
+            QueryResultCache(query_cache_size) if query_cache_size > 0 else None
+        )
+        if read_only:
+            self._open_read_only(exists=exists)
+        else:
+            self.con = sqlite3.connect(str(self.path), isolation_level="DEFERRED")
+            if wal:
+                self._enable_wal()
+            self.con.execute("BEGIN")
 
         # Set up metadata
         self.metadata = SQLiteMetadata(self.con)
         if not exists:
             self.metadata["version"] = "1.0.1"
             self.metadata["compression"] = compression
-            self.metadata["compression_level"] = compression_level
+            self.metadata["compression_level"] = (
+                DEFAULT_COMPRESSION_LEVELS.get(compression)
+                if compression_level is None
+                else compression_level
+            )
 
         # store locally as constantly fetching from db in (de)serialization is slow
         self.compression = self.metadata["compression"]
         self.compression_level = self.metadata["compression_level"]
+        self._check_compression(self.compression)
+        self._codec = self._get_codec(self.compression, self.compression_level)
+        self.simplified_tolerances = (
+            self.metadata["simplified_tolerances"]
+            if "simplified_tolerances" in self.metadata
+            else []
+        )
+        self.density_grid = (
+            self.metadata["density_grid"] if "density_grid" in self.metadata else None
+        )
+
+        if not read_only:
+            self._register_custom_functions(self.con)
+
+        if exists:
+            self.table_columns = self._get_table_columns()
+            return
+
+        # Create tables for geometry and RTree index
+        self.con.execute(
+            """
+            CREATE VIRTUAL TABLE rtree USING rtree(
+                id,                      -- Integer primary key
+                min_x, max_x,            -- 1st dimension min, max
+                min_y, max_y             -- 2nd dimension min, max
+            )
+            """,
+        )
+        self.con.execute(
+            """
+            CREATE TABLE annotations(
+                id INTEGER PRIMARY KEY,  -- Integer primary key
+                key TEXT UNIQUE,         -- Unique identifier (UUID)
+                objtype TEXT,            -- Object type
+                cx FLOAT NOT NULL,       -- X of centroid/representative point
+                cy FLOAT NOT NULL,       -- Y of centroid/representative point
+                geometry BLOB,           -- Detailed geometry
+                properties TEXT,         -- JSON properties
+                area FLOAT NOT NULL      -- Area (for ordering)
+            )
+
+            """,
+        )
+        if self.auto_commit:
+            self.con.commit()
+        self.table_columns = self._get_table_columns()
+
+    def _register_custom_functions(
+        self: SQLiteStore,
+        con: sqlite3.Connection,
+    ) -> None:
+        """Register the custom functions used in queries with a connection.
+
+        Args:
+            con (sqlite3.Connection):
+                The connection to register the functions with.
+
+        """
 
         # Register predicate functions as custom SQLite functions
         def wkb_predicate(
@@ -2244,9 +3667,9 @@ class SQLiteStore(AnnotationStore):
 
             """
             try:
-                self.con.create_function(name, nargs, fn, deterministic=deterministic)
+                con.create_function(name, nargs, fn, deterministic=deterministic)
             except TypeError:
-                self.con.create_function(name, nargs, fn)
+                con.create_function(name, nargs, fn)
 
         register_custom_function(
             "geometry_predicate",
@@ -2266,38 +3689,90 @@ class SQLiteStore(AnnotationStore):
         register_custom_function("CONTAINS", 1, json_contains)
         register_custom_function("get_area", 3, get_area)
 
-        if exists:
-            self.table_columns = self._get_table_columns()
-            return
+    def _open_read_only(self: SQLiteStore, *, exists: bool) -> None:
+        """Set up the connections of a read-only store.
 
-        # Create tables for geometry and RTree index
-        self.con.execute(
-            """
-            CREATE VIRTUAL TABLE rtree USING rtree(
-                id,                      -- Integer primary key
-                min_x, max_x,            -- 1st dimension min, max
-                min_y, max_y             -- 2nd dimension min, max
-            )
-            """,
-        )
-        self.con.execute(
-            """
-            CREATE TABLE annotations(
-                id INTEGER PRIMARY KEY,  -- Integer primary key
-                key TEXT UNIQUE,         -- Unique identifier (UUID)
-                objtype TEXT,            -- Object type
-                cx FLOAT NOT NULL,       -- X of centroid/representative point
-                cy FLOAT NOT NULL,       -- Y of centroid/representative point
-                geometry BLOB,           -- Detailed geometry
-                properties TEXT,         -- JSON properties
-                area FLOAT NOT NULL      -- Area (for ordering)
-            )
+        Args:
+            exists (bool):
+                Whether the database file exists and is not empty.
 
-            """,
+        Raises:
+            ValueError:
+                If the database file does not exist.
+
+        """
+        if not exists:
+            msg = "A read-only store must be opened from an existing database file."
+            raise ValueError(msg)
+        self.con = SQLiteConnectionPool(self._connect_read_only)
+        # Connection used only to detect changes by other connections
+        self._data_version_con: sqlite3.Connection | None = None
+        self._data_version: int | None = None
+        self._data_version_lock = threading.Lock()
+
+    def _connect_read_only(self: SQLiteStore) -> sqlite3.Connection:
+        """Open a new read-only connection to the database file.
+
+        The connection does not hold a transaction open between
+        statements (autocommit), so each query reads the latest
+        committed state of the database.
+
+        Returns:
+            sqlite3.Connection:
+                The connection with custom functions registered.
+
+        """
+        con = sqlite3.connect(
+            f"{self.path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            isolation_level=None,
+            check_same_thread=False,
         )
-        if self.auto_commit:
-            self.con.commit()
-        self.table_columns = self._get_table_columns()
+        self._register_custom_functions(con)
+        return con
+
+    def _check_data_version(self: SQLiteStore) -> None:
+        """Invalidate cached results if the file was changed by another connection.
+
+        Read-only stores are typically opened while another process (or
+        store) writes to the same file. The `data_version` of a single
+        connection changes whenever another connection commits, so it
+        is checked on one dedicated connection and `generation` is
+        incremented when it changes. Writable stores hold a transaction
+        open and do not see changes by other connections, so they are
+        not checked.
+
+        """
+        if not self.read_only:
+            return
+        with self._data_version_lock:
+            if self._data_version_con is None:
+                self._data_version_con = self._connect_read_only()
+            (data_version,) = self._data_version_con.execute(
+                "PRAGMA data_version",
+            ).fetchone()
+            if self._data_version is not None and data_version != self._data_version:
+                self.generation += 1
+            self._data_version = data_version
+
+    def _enable_wal(self: SQLiteStore) -> None:
+        """Switch the database file to write-ahead logging (WAL).
+
+        With WAL, readers do not block the writer and the writer does
+        not block readers. The journal mode is stored in the database
+        file, so it also applies to other connections. This must be
+        called outside of a transaction.
+
+        """
+        try:
+            self.con.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.OperationalError as error:
+            logger.warning(
+                "Could not enable WAL for %s: %s. "
+                "Reads may block while the database is written to.",
+                self.path,
+                error,
+            )
 
     def serialise_geometry(  # skipcq: PYL-W0221
         self: SQLiteStore,
@@ -2309,19 +3784,38 @@ class SQLiteStore(AnnotationStore):
         applies optional compression.
 
         Args:
-            geometry(Geometry):
-                The Shapely geometry to be serialised.
+            geometry(Geometry):
+                The Shapely geometry to be serialised.
+
+        Returns:
+            bytes or str:
+                The serialised geometry.
+
+        """
+        return self._compress_data(geometry.wkb)
+
+    def _compress_data(self: SQLiteStore, data: bytes) -> bytes:
+        """Compresses geometry data.
+
+        Args:
+            data (bytes):
+                The data to be compressed.
 
         Returns:
-            bytes or str:
-                The serialised geometry.
+            bytes:
+                The compressed data.
+
+        Raises:
+            ValueError:
+                If the compression method is unsupported.
 
         """
-        data = geometry.wkb
         if self.compression is None:
             return data
         if self.compression == "zlib":
             return zlib.compress(data, level=self.compression_level)
+        if self._codec is not None:
+            return self._codec.encode(data)
         msg = "Unsupported compression method."
         raise ValueError(msg)
 
@@ -2365,6 +3859,39 @@ class SQLiteStore(AnnotationStore):
             else WKB_POINT_STRUCT.pack(1, GeometryType.POINT, cx, cy)
         )
 
+    def _geometries_from_columns(
+        self: SQLiteStore,
+        cxs: Iterable[float],
+        cys: Iterable[float],
+        blobs: Iterable[bytes | None],
+    ) -> np.ndarray:
+        """Create geometries from the cx, cy and geometry columns of rows.
+
+        Points have no geometry blob and are created directly from
+        their coordinate columns, without packing and parsing WKB.
+
+        Args:
+            cxs (iter(float)):
+                The centroid x coordinates of the rows.
+            cys (iter(float)):
+                The centroid y coordinates of the rows.
+            blobs (iter(bytes)):
+                The serialised geometries of the rows, None for points.
+
+        Returns:
+            np.ndarray:
+                An array of the geometries of the rows.
+
+        """
+        blobs = np.array(list(blobs), dtype=object)
+        is_point = np.equal(blobs, None)
+        geometries = shapely.points(np.array(cxs), np.array(cys))
+        if not is_point.all():
+            geometries[~is_point] = shapely.from_wkb(
+                [self._decompress_data(blob) for blob in blobs[~is_point]],
+            )
+        return geometries
+
     def deserialize_geometry(  # skipcq: PYL-W0221
         self: SQLiteStore,
         data: str | bytes,
@@ -2403,11 +3930,76 @@ class SQLiteStore(AnnotationStore):
         """
         if self.compression == "zlib":
             data = zlib.decompress(data)
+        elif self._codec is not None:
+            data = self._codec.decode(data)
         elif self.compression is not None:
             msg = "Unsupported compression method."
             raise ValueError(msg)
         return data
 
+    @staticmethod
+    def _get_codec(
+        compression: str | None,
+        compression_level: int,
+    ) -> numcodecs.abc.Codec | None:
+        """Get the numcodecs codec for a compression method.
+
+        Args:
+            compression (str):
+                The compression method.
+            compression_level (int):
+                The compression level.
+
+        Returns:
+            numcodecs.abc.Codec:
+                The codec, or None if the compression method is not
+                handled by numcodecs or is unavailable.
+
+        """
+        if compression == "zstd" and hasattr(numcodecs, "Zstd"):
+            return numcodecs.Zstd(level=compression_level)
+        if compression == "lz4" and hasattr(numcodecs, "LZ4"):
+            return numcodecs.LZ4(acceleration=compression_level)
+        return None
+
+    @staticmethod
+    def _check_compression(compression: str | None) -> None:
+        """Check that a compression method is available.
+
+        Args:
+            compression (str):
+                The compression method.
+
+        Raises:
+            ValueError:
+                If the compression method is unsupported or unavailable.
+
+        """
+        if compression is not None and compression not in (
+            SQLiteStore.compression_methods()
+        ):
+            msg = (
+                f"Unsupported compression method: {compression}. "
+                f"Available methods are: {SQLiteStore.compression_methods()}."
+            )
+            raise ValueError(msg)
+
+    @staticmethod
+    def compression_methods() -> list[str]:
+        """Get the list of available compression methods.
+
+        Returns:
+            list(str):
+                The names of the available compression methods, to use
+                as `compression` when creating a store.
+
+        """
+        return [
+            method
+            for method in ["zlib", "zstd", "lz4"]
+            if method == "zlib" or SQLiteStore._get_codec(method, 1) is not None
+        ]
+
     @staticmethod
     def compile_options() -> list[str]:
         """Get the list of options that sqlite3 was compiled with.
@@ -2449,6 +4041,13 @@ class SQLiteStore(AnnotationStore):
 
     def close(self: SQLiteStore) -> None:
         """Closes :class:`SQLiteStore` from file pointer or path."""
+        if self.read_only:
+            self.con.close()
+            with self._data_version_lock:
+                if self._data_version_con is not None:
+                    self._data_version_con.close()
+                    self._data_version_con = None
+            return
         if self.auto_commit:
             self.con.commit()
         self.optimize(vacuum=False, limit=1000)
@@ -2483,18 +4082,173 @@ class SQLiteStore(AnnotationStore):
     ) -> list[str]:
         """Appends new annotations to specified keys."""
         annotations = list(annotations)
-        keys = list(keys) if keys else [str(uuid.uuid4()) for _ in annotations]
-        self._validate_equal_lengths(keys, annotations)
+        return self.append_geometries(
+            [annotation.geometry for annotation in annotations],
+            [annotation.properties for annotation in annotations],
+            keys,
+        )
+
+    def append_geometries(
+        self: SQLiteStore,
+        geometries: Iterable[Geometry],
+        properties: Iterable[Properties] | dict[str, Iterable] | None = None,
+        keys: Iterable[str] | None = None,
+    ) -> list[str]:
+        """Bulk append of geometries and their properties.
+
+        The geometries are serialised, measured and inserted in
+        vectorised chunks. The rtree index is populated once all rows
+        are inserted, in Z-order of the geometry centroids, which gives
+        a better packed index than inserting in arbitrary order. The
+        page cache is enlarged for the duration of the load.
+
+        Args:
+            geometries (iter(Geometry)):
+                An iterable or array of geometries.
+            properties (iter(dict) or dict):
+                The properties of each geometry. Either an iterable of
+                dictionaries or a dictionary of columns, each with one
+                value per geometry. If None, each geometry has empty
+                properties.
+            keys (iter(str)):
+                An iterable of unique keys associated with each geometry being
+                inserted. If None, a new UUID4 is generated for each geometry.
+
+        Returns:
+            list(str):
+                A list of unique keys for the inserted geometries.
+
+        """
+        geometries = np.array(list(geometries), dtype=object)
+        properties = self._properties_to_records(properties, len(geometries))
+        keys = list(keys) if keys else [str(uuid.uuid4()) for _ in geometries]
+        self._validate_equal_lengths(keys, geometries)
+        encode_properties = json.JSONEncoder(separators=(",", ":")).encode
+        columns = ["id", "[key]", "objtype", "cx", "cy", "geometry", "properties"]
+        has_area = "area" in self.table_columns
+        if has_area:
+            columns.append("area")
+        insert_string = (
+            f"INSERT INTO annotations({', '.join(columns)}) "
+            f"VALUES({', '.join('?' for _ in columns)})"
+        )
+
         cur = self.con.cursor()
         if self.auto_commit:
             cur.execute("BEGIN")
-        result = []
-        for annotation, key in zip(annotations, keys):
-            self._append(key, annotation, cur)
-            result.append(key)
+        with self._bulk_load_pragmas():
+            (max_id,) = cur.execute("SELECT MAX(id) FROM annotations").fetchone()
+            row_ids = np.arange(len(geometries)) + (max_id or 0) + 1
+            centroids = np.empty((len(geometries), 2))
+            bounds = np.empty((len(geometries), 4))
+            for start in range(0, len(geometries), self.bulk_chunk_size):
+                chunk = slice(start, start + self.bulk_chunk_size)
+                geometries_chunk = geometries[chunk]
+                type_ids = shapely.get_type_id(geometries_chunk)
+                # points are stored only as their centroid
+                serialised_geometries = np.full(len(type_ids), None, dtype=object)
+                is_point = type_ids == shapely.GeometryType.POINT
+                serialised_geometries[~is_point] = self._compress_many(
+                    shapely.to_wkb(geometries_chunk[~is_point]).tolist(),
+                )
+                centroids[chunk] = shapely.get_coordinates(
+                    shapely.centroid(geometries_chunk),
+                )
+                bounds[chunk] = shapely.bounds(geometries_chunk)
+                values = [
+                    row_ids[chunk].tolist(),
+                    keys[chunk],
+                    SHAPELY_GEOMETRY_TYPES[type_ids].tolist(),
+                    centroids[chunk, 0].tolist(),
+                    centroids[chunk, 1].tolist(),
+                    serialised_geometries.tolist(),
+                    map(encode_properties, properties[chunk]),
+                ]
+                if has_area:
+                    values.append(shapely.area(geometries_chunk).tolist())
+                cur.executemany(insert_string, zip(*values))
+            order = self._z_order(centroids)
+            cur.executemany(
+                "INSERT INTO rtree VALUES(?, ?, ?, ?, ?)",
+                zip(
+                    row_ids[order].tolist(),
+                    bounds[order, 0].tolist(),
+                    bounds[order, 2].tolist(),
+                    bounds[order, 1].tolist(),
+                    bounds[order, 3].tolist(),
+                ),
+            )
+        self.generation += 1
         if self.auto_commit:
             self.con.commit()
-        return result
+        return keys
+
+    def _compress_many(self: SQLiteStore, data: list[bytes]) -> list[bytes]:
+        """Compresses many geometries, split across threads.
+
+        Compression releases the GIL, so this scales with the number of
+        CPUs.
+
+        Args:
+            data (list(bytes)):
+                The data to be compressed.
+
+        Returns:
+            list(bytes):
+                The compressed data, in the same order.
+
+        """
+        if self.compression is None or len(data) == 0:
+            return data
+        num_parts = min(os.cpu_count() or 1, len(data))
+        part_size = -(-len(data) // num_parts)  # ceil division
+        parts = [data[i : i + part_size] for i in range(0, len(data), part_size)]
+        with ThreadPoolExecutor(max_workers=num_parts) as executor:
+            compressed = executor.map(
+                lambda part: [self._compress_data(v) for v in part],
+                parts,
+            )
+            return list(itertools.chain.from_iterable(compressed))
+
+    @contextlib.contextmanager
+    def _bulk_load_pragmas(self: SQLiteStore) -> Iterator[None]:
+        """Context manager to tune the connection for a bulk load."""
+        (cache_size,) = self.con.execute("PRAGMA cache_size").fetchone()
+        # Cannot use parameterized statements with PRAGMA!
+        self.con.execute(f"PRAGMA cache_size = {-int(self.bulk_cache_size_kib)}")
+        try:
+            yield
+        finally:
+            self.con.execute(f"PRAGMA cache_size = {int(cache_size)}")
+
+    @staticmethod
+    def _z_order(points: np.ndarray) -> np.ndarray:
+        """Return the order of points along a Z-order (Morton) curve.
+
+        Args:
+            points (np.ndarray):
+                An Nx2 array of point coordinates.
+
+        Returns:
+            np.ndarray:
+                The indices which sort the points.
+
+        """
+        if len(points) == 0:
+            return np.zeros(0, dtype=int)
+        # quantise to 16 bits per dimension
+        low = np.nanmin(points, axis=0)
+        extent = np.maximum(np.nanmax(points, axis=0) - low, np.finfo(float).eps)
+        quantised = np.nan_to_num((points - low) / extent * 0xFFFF).astype(np.uint32)
+        # spread the bits so that those of x and y can be interleaved
+        for shift, mask in [
+            (8, 0x00FF00FF),
+            (4, 0x0F0F0F0F),
+            (2, 0x33333333),
+            (1, 0x55555555),
+        ]:
+            quantised = (quantised | (quantised << shift)) & mask
+        return np.argsort(quantised[:, 0] | (quantised[:, 1] << 1), kind="stable")
 
     def _append(
         self: SQLiteStore,
@@ -2519,7 +4273,9 @@ class SQLiteStore(AnnotationStore):
         )
         cur.execute(
             """
-                INSERT INTO annotations VALUES(
+                INSERT INTO annotations(
+                    id, [key], objtype, cx, cy, geometry, properties, area
+                ) VALUES(
                     NULL, :key, :geom_type,
                     :cx, :cy, :geometry, :properties, :area
                 )
@@ -2590,25 +4346,9 @@ class SQLiteStore(AnnotationStore):
                     "max_x": max_x,
                     "min_y": min_y,
                     "max_y": max_y,
-                    "geometry_predicate": geometry_predicate,
-                    "query_geometry": query_geometry.wkb,
                 },
             )
 
-            # The query is a full intersection check, not a simple bounds
-            # check only.
-            if geometry_predicate is not None and geometry_predicate not in (
-                "bbox_intersects",
-                "centers_within_k",
-            ):
-                query_string += (
-                    "\nAND geometry_predicate("
-                    ":geometry_predicate, :query_geometry, geometry, cx, cy"
-                    ") "
-                )
-                query_parameters["geometry_predicate"] = geometry_predicate
-                query_parameters["query_geometry"] = query_geometry.wkb
-
         # Predicate is pickled function
         if isinstance(where, bytes):
             query_string += "\nAND pickle_expression(:where, properties)"
@@ -2624,7 +4364,51 @@ class SQLiteStore(AnnotationStore):
 
         return query_string, query_parameters
 
-    def _query(  # noqa: PLR0913
+    def _geometry_predicate_ids(
+        self: SQLiteStore,
+        candidates_string: str,
+        query_parameters: dict[str, object],
+        geometry_predicate: str,
+        query_geometry: Geometry,
+    ) -> list[int]:
+        """Find the candidates of a query for which a geometry predicate holds.
+
+        The predicate is evaluated for batches of candidate geometries
+        at once with the vectorised shapely predicates and a prepared
+        query geometry, which is much faster than evaluating it row by
+        row in SQL with a custom function.
+
+        Args:
+            candidates_string (str):
+                The query selecting the id, cx, cy and geometry columns
+                of the candidates.
+            query_parameters (dict):
+                The parameters of the query.
+            geometry_predicate (str):
+                The name of the shapely binary predicate.
+            query_geometry (Geometry):
+                The query geometry, which is the first argument of the
+                predicate.
+
+        Returns:
+            list(int):
+                The ids of the candidates for which the predicate holds.
+
+        """
+        predicate = getattr(shapely, geometry_predicate)
+        # Prepare a copy to leave the caller's geometry unchanged
+        query_geometry = copy.copy(query_geometry)
+        shapely.prepare(query_geometry)
+        cur = self.con.execute(candidates_string, query_parameters)
+        ids = []
+        while rows := cur.fetchmany(self.bulk_chunk_size):
+            row_ids, cxs, cys, blobs = zip(*rows)
+            geometries = self._geometries_from_columns(cxs, cys, blobs)
+            matches = predicate(query_geometry, geometries)
+            ids.extend(np.array(row_ids)[matches].tolist())
+        return ids
+
+    def _query(  # noqa: PLR0912, PLR0913
         self: SQLiteStore,
         columns: str,
         geometry: Geometry | None = None,
@@ -2637,6 +4421,7 @@ class SQLiteStore(AnnotationStore):
         unique: bool = False,
         no_constraints_ok: bool = False,
         index_warning: bool = False,
+        group_by: str | None = None,
     ) -> sqlite3.Cursor:
         """Common query construction logic for `query` and `iquery`.
 
@@ -2675,6 +4460,9 @@ class SQLiteStore(AnnotationStore):
             distance (float):
                 Distance used when performing a distance based query.
                 E.g. "centers_within_k" geometry predicate.
+            group_by (str):
+                An optional SQL expression to group the results by, for
+                aggregate `columns`. Defaults to None.
 
         Returns:
             sqlite3.Cursor:
@@ -2717,8 +4505,9 @@ class SQLiteStore(AnnotationStore):
         )
 
         # Add area column constraint to query if min_area is specified
+        area_constraint = ""
         if min_area is not None and "area" in self.table_columns:
-            query_string += f"\nAND area > {min_area}"
+            area_constraint = f"\nAND area > {min_area}"
         elif min_area is not None:
             msg = (
                 "Cannot use `min_area` without an area column.\n"
@@ -2727,6 +4516,33 @@ class SQLiteStore(AnnotationStore):
             raise ValueError(
                 msg,
             )
+        query_string += area_constraint
+
+        # The query is a full geometry predicate, not a simple bounds
+        # check only. Evaluate it for the candidates in the bounds and
+        # restrict the query to those which match.
+        if query_geometry is not None and geometry_predicate not in (
+            "bbox_intersects",
+            "centers_within_k",
+        ):
+            candidates_string, _ = self._initialize_query_string_parameters(
+                query_geometry,
+                {},
+                geometry_predicate,
+                "annotations.id, cx, cy, geometry",
+                where,
+            )
+            query_parameters["ids"] = json.dumps(
+                self._geometry_predicate_ids(
+                    candidates_string + area_constraint,
+                    query_parameters,
+                    geometry_predicate,
+                    query_geometry,
+                ),
+            )
+            query_string += (
+                "\nAND annotations.id IN (SELECT value FROM json_each(:ids))"
+            )
 
         if unique:
             query_string = query_string.replace("SELECT", "SELECT DISTINCT")
@@ -2743,12 +4559,57 @@ class SQLiteStore(AnnotationStore):
                     "Consider adding an index to improve performance.",
                     stacklevel=2,
                 )
+        if group_by is not None:
+            query_string += f"\nGROUP BY {group_by}"
         # if area column exists, sort annotations by area
-        if "area" in self.table_columns:
+        elif "area" in self.table_columns:
             query_string += "\nORDER BY area DESC"
         cur.execute(query_string, query_parameters)
         return cur
 
+    def iter_query(
+        self: SQLiteStore,
+        geometry: QueryGeometry | None = None,
+        where: Predicate | None = None,
+        geometry_predicate: str = "intersects",
+        min_area: float | None = None,
+        distance: float = 0,
+        *,
+        chunk_size: int = 10_000,
+        tolerance: float = 0,
+    ) -> Generator[dict[str, Annotation], None, None]:
+        """Query the store for annotations in chunks.
+
+        Rows are fetched from the database cursor one chunk at a time
+        and geometries are only decoded when accessed. See
+        :meth:`AnnotationStore.iter_query`.
+
+        """
+        cur = self._query(
+            columns=f"[key], properties, cx, cy, {self._geometry_column(tolerance)}",
+            geometry=geometry,
+            geometry_predicate=geometry_predicate,
+            where=where,
+            min_area=min_area,
+            distance=distance,
+        )
+        while rows := cur.fetchmany(chunk_size):
+            chunk = {
+                key: Annotation(
+                    properties=json.loads(properties),
+                    wkb=self._unpack_wkb(blob, cx, cy),
+                )
+                for key, properties, cx, cy, blob in rows
+            }
+            if isinstance(where, Callable):
+                chunk = {
+                    key: annotation
+                    for key, annotation in chunk.items()
+                    if where(annotation.properties)
+                }
+            if chunk:
+                yield chunk
+
     def iquery(
         self: SQLiteStore,
         geometry: QueryGeometry | None = None,
@@ -2833,11 +4694,28 @@ class SQLiteStore(AnnotationStore):
         geometry_predicate: str = "intersects",
         min_area: float / None = None,
         distance: float = 0,
+        *,
+        tolerance: float = 0,
     ) -> dict[str, Annotation]:
         """Runs Query."""
+        cache_key = self._query_cache_key(
+            geometry,
+            where,
+            geometry_predicate,
+            min_area,
+            distance,
+            tolerance,
+        )
+        if cache_key is not None:
+            self._check_data_version()
+        generation = self.generation
+        if cache_key is not None:
+            cached = self.query_cache.get(cache_key, generation)
+            if cached is not None:
+                return cached
         query_geometry = geometry
         cur = self._query(
-            columns="[key], properties, cx, cy, geometry",
+            columns=f"[key], properties, cx, cy, {self._geometry_column(tolerance)}",
             geometry=query_geometry,
             geometry_predicate=geometry_predicate,
             where=where,
@@ -2853,13 +4731,362 @@ class SQLiteStore(AnnotationStore):
                 for key, properties, cx, cy, blob in cur.fetchall()
                 if where(json.loads(properties))
             }
-        return {
+        rows = cur.fetchall()
+        result = {
             key: Annotation(
                 properties=json.loads(properties),
                 wkb=self._unpack_wkb(blob, cx, cy),
             )
-            for key, properties, cx, cy, blob in cur.fetchall()
+            for key, properties, cx, cy, blob in rows
         }
+        if cache_key is not None:
+            # Approximate size from the serialised rows plus some overhead
+            nbytes = sum(
+                len(key) + len(properties) + len(blob or b"") + 200
+                for key, properties, _, _, blob in rows
+            )
+            self.query_cache.put(cache_key, generation, result, nbytes)
+        return result
+
+    def _query_cache_key(
+        self: SQLiteStore,
+        geometry: QueryGeometry | None,
+        where: Predicate | None,
+        geometry_predicate: str,
+        min_area: float | None,
+        distance: float,
+        tolerance: float,
+    ) -> Hashable | None:
+        """Normalise the arguments of a query to a key for the cache.
+
+        Rectangular query geometries are normalised to their bounds,
+        so querying a box polygon or its bounds share a cached result.
+
+        Returns:
+            Hashable:
+                The cache key, or None if the query is not cached
+                (there is no cache or `where` is a Callable).
+
+        """
+        if self.query_cache is None or isinstance(where, Callable):
+            return None
+        if isinstance(geometry, Polygon) and geometry.area == shapely.area(
+            shapely.box(*geometry.bounds),
+        ):
+            geometry = geometry.bounds
+        if isinstance(geometry, Iterable):
+            geometry = tuple(float(x) for x in geometry)
+        elif geometry is not None:
+            geometry = geometry.wkb
+        return geometry, where, geometry_predicate, min_area, distance, tolerance
+
+    def query_cache_info(self: SQLiteStore) -> dict[str, int] | None:
+        """Return the statistics of the query cache.
+
+        Returns:
+            dict:
+                The statistics (see :meth:`QueryResultCache.info`), or
+                None if the store has no query cache.
+
+        """
+        if self.query_cache is None:
+            return None
+        return self.query_cache.info()
+
+    def _nquery(
+        self: SQLiteStore,
+        geometry: Geometry | None,
+        where: Predicate | None,
+        n_where: Predicate | None,
+        distance: float,
+        geometry_predicate: str,
+        from_mode: str,
+    ) -> dict[str, dict[str, Annotation]]:
+        """Find the neighbourhoods of all selected annotations at once.
+
+        Candidate pairs of annotations with bounding boxes within the
+        distance are found in one query by joining the R-tree index
+        with itself. The exact neighbourhood checks are then vectorised
+        over all candidate pairs (see
+        :meth:`AnnotationStore._neighbour_mask`).
+
+        """
+        # Select the annotations to search around
+        cur = self._query(
+            "annotations.id, [key], cx, cy, geometry",
+            geometry=geometry,
+            where=where,
+            callable_columns="annotations.id, [key], cx, cy, geometry, properties",
+        )
+        sources = cur.fetchall()
+        if isinstance(where, Callable):
+            sources = [row[:-1] for row in sources if where(json.loads(row[-1]))]
+        if not sources:
+            return {}
+        source_ids, source_keys, *geometry_columns = zip(*sources)
+
+        # Candidate pairs with bounding boxes within the distance
+        tables = "rtree AS sr, rtree AS nr"
+        if isinstance(n_where, (str, bytes)):
+            tables += ", annotations"
+        query_string = f"""
+            SELECT sr.id, nr.id
+              FROM {tables}
+             WHERE sr.id IN (SELECT value FROM json_each(:ids))
+               AND nr.max_x >= sr.min_x - :distance
+               AND nr.min_x <= sr.max_x + :distance
+               AND nr.max_y >= sr.min_y - :distance
+               AND nr.min_y <= sr.max_y + :distance
+        """  # noqa: S608
+        query_parameters = {"ids": json.dumps(source_ids), "distance": distance}
+        if isinstance(n_where, (str, bytes)):
+            query_string += "\nAND annotations.id = nr.id"
+        if isinstance(n_where, bytes):
+            query_string += "\nAND pickle_expression(:n_where, properties)"
+            query_parameters["n_where"] = n_where
+        elif isinstance(n_where, str):
+            sql_predicate = eval(  # skipcq: PYL-W0123,  # noqa: PGH001, S307
+                n_where,
+                SQL_GLOBALS,
+                {},
+            )
+            query_string += f"\nAND {sql_predicate}"
+        pairs = np.array(
+            self.con.execute(query_string, query_parameters).fetchall(),
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        if len(pairs) == 0:
+            return {}
+
+        # Load each candidate neighbour once
+        neighbour_ids, neighbour_index = np.unique(pairs[:, 1], return_inverse=True)
+        neighbour_keys, neighbour_annotations = zip(
+            *self._load_annotations("id", neighbour_ids.tolist()),
+        )
+        is_candidate = np.array(
+            [
+                not isinstance(n_where, Callable) or n_where(annotation.properties)
+                for annotation in neighbour_annotations
+            ],
+            dtype=bool,
+        )
+
+        order = np.argsort(source_ids)
+        source_index = order[np.searchsorted(source_ids, pairs[:, 0], sorter=order)]
+        keep = is_candidate[neighbour_index]
+        source_index = source_index[keep]
+        neighbour_index = neighbour_index[keep]
+        source_geometries = self._geometries_from_columns(*geometry_columns)
+        neighbour_geometries = np.array(
+            [annotation.geometry for annotation in neighbour_annotations],
+        )
+        is_neighbour = self._neighbour_mask(
+            source_geometries,
+            neighbour_geometries,
+            source_index,
+            neighbour_index,
+            distance,
+            geometry_predicate,
+            from_mode,
+        )
+        return self._group_neighbours(
+            list(source_keys),
+            neighbour_keys,
+            neighbour_annotations,
+            source_index[is_neighbour],
+            neighbour_index[is_neighbour],
+        )
+
+    def spatial_join(
+        self: SQLiteStore,
+        other: AnnotationStore,
+        geometry_predicate: str = "intersects",
+        distance: float = 0.0,
+        where: Predicate | None = None,
+        other_where: Predicate | None = None,
+        *,
+        grouped: bool = False,
+    ) -> list[tuple[str, str]] | dict[str, dict[str, Annotation]]:
+        """Find all pairs of annotations from two stores which satisfy a predicate.
+
+        When `other` is a file backed :class:`SQLiteStore`, its database
+        is attached to this store's connection and the candidate pairs
+        are found in one query joining the two R-tree indexes. The
+        exact predicate is then checked for all candidate pairs at once
+        (see :meth:`AnnotationStore._spatial_join_mask`). Pending
+        changes of both stores are committed first, so that the join
+        sees them. Otherwise, or if either predicate is a Callable, the
+        generic :meth:`AnnotationStore.spatial_join` is used.
+
+        """
+        if (
+            not isinstance(other, SQLiteStore)
+            or other.path == Path(":memory:")
+            or isinstance(where, Callable)
+            or isinstance(other_where, Callable)
+        ):
+            return super().spatial_join(
+                other,
+                geometry_predicate=geometry_predicate,
+                distance=distance,
+                where=where,
+                other_where=other_where,
+                grouped=grouped,
+            )
+        self._validate_spatial_join(geometry_predicate, distance)
+        for store in (self, other):
+            if not store.read_only:
+                store.commit()
+        self.con.execute("ATTACH DATABASE ? AS joined", (str(other.path),))
+        try:
+            pairs = self._rtree_join(distance, where, other_where)
+        finally:
+            self.con.execute("DETACH DATABASE joined")
+        if len(pairs) == 0:
+            return {} if grouped else []
+
+        # Load each geometry of the candidate pairs once
+        source_ids, source_index = np.unique(pairs[:, 0], return_inverse=True)
+        target_ids, target_index = np.unique(pairs[:, 1], return_inverse=True)
+        source_keys, source_geometries = self._load_geometries(source_ids.tolist())
+        target_keys, target_geometries = other._load_geometries(  # noqa: SLF001
+            target_ids.tolist(),
+        )
+        shapely.prepare(source_geometries)
+        is_match = self._spatial_join_mask(
+            source_geometries,
+            target_geometries,
+            source_index,
+            target_index,
+            geometry_predicate,
+            distance,
+        )
+        source_index = source_index[is_match]
+        target_index = target_index[is_match]
+        if grouped:
+            matched, target_index = np.unique(target_index, return_inverse=True)
+            target_annotations = [
+                annotation
+                for _, annotation in other._load_annotations(  # noqa: SLF001
+                    "id",
+                    target_ids[matched].tolist(),
+                )
+            ]
+            return self._group_neighbours(
+                source_keys,
+                [target_keys[i] for i in matched.tolist()],
+                target_annotations,
+                source_index,
+                target_index,
+            )
+        return [
+            (source_keys[i], target_keys[j])
+            for i, j in zip(source_index.tolist(), target_index.tolist())
+        ]
+
+    def _rtree_join(
+        self: SQLiteStore,
+        distance: float,
+        where: str | bytes | None,
+        other_where: str | bytes | None,
+    ) -> np.ndarray:
+        """Find candidate pairs of a spatial join with the attached store.
+
+        The R-tree of this store is joined with the R-tree of the store
+        attached as "joined", looping over the smaller of the two in
+        the outer loop.
+
+        Args:
+            distance (float):
+                The distance to grow the bounding boxes by.
+            where (str or bytes):
+                The predicate to select annotations of this store.
+            other_where (str or bytes):
+                The predicate to select annotations of the attached
+                store.
+
+        Returns:
+            np.ndarray:
+                An array of (id, attached store id) pairs with bounding
+                boxes within the distance of each other.
+
+        """
+        (num_sources,) = self.con.execute(
+            "SELECT COUNT(*) FROM main.annotations",
+        ).fetchone()
+        (num_targets,) = self.con.execute(
+            "SELECT COUNT(*) FROM joined.annotations",
+        ).fetchone()
+        # The inner table is searched with its R-tree for each outer row
+        outer, inner = ("sr", "jr") if num_sources <= num_targets else ("jr", "sr")
+        tables = {"sr": "main.rtree AS sr", "jr": "joined.rtree AS jr"}
+        query_string = f"""
+            SELECT sr.id, jr.id
+              FROM {tables[outer]} CROSS JOIN {tables[inner]}
+             WHERE {inner}.max_x >= {outer}.min_x - :distance
+               AND {inner}.min_x <= {outer}.max_x + :distance
+               AND {inner}.max_y >= {outer}.min_y - :distance
+               AND {inner}.min_y <= {outer}.max_y + :distance
+        """  # noqa: S608
+        query_parameters = {"distance": distance}
+        for alias, database, predicate in (
+            ("sr", "main", where),
+            ("jr", "joined", other_where),
+        ):
+            if isinstance(predicate, bytes):
+                sql_predicate = f"pickle_expression(:{database}_where, properties)"
+                query_parameters[f"{database}_where"] = predicate
+            elif isinstance(predicate, str):
+                sql_predicate = eval(  # skipcq: PYL-W0123,  # noqa: PGH001, S307
+                    predicate,
+                    SQL_GLOBALS,
+                    {},
+                )
+            else:
+                continue
+            # The unary + stops the R-tree being searched by id for this
+            query_string += (
+                f"\nAND +{alias}.id IN "  # noqa: S608
+                f"(SELECT id FROM {database}.annotations WHERE {sql_predicate})"
+            )
+        cur = self.con.execute(query_string, query_parameters)
+        chunks = [np.empty((0, 2), dtype=np.int64)]
+        while rows := cur.fetchmany(self.bulk_chunk_size):
+            chunks.append(np.array(rows, dtype=np.int64))
+        return np.concatenate(chunks)
+
+    def _load_geometries(
+        self: SQLiteStore,
+        ids: list[int],
+    ) -> tuple[list[str], np.ndarray]:
+        """Load the keys and geometries of annotations in batches.
+
+        Args:
+            ids (list(int)):
+                The sorted ids of the annotations to load.
+
+        Returns:
+            tuple:
+                The keys and an array of the geometries of the
+                annotations, in order of id.
+
+        """
+        keys = []
+        geometries = [np.empty(0, dtype=object)]
+        for start in range(0, len(ids), self.bulk_chunk_size):
+            cur = self.con.execute(
+                """
+                SELECT [key], cx, cy, geometry
+                  FROM annotations
+                 WHERE id IN (SELECT value FROM json_each(:ids))
+                 ORDER BY id
+                """,
+                {"ids": json.dumps(ids[start : start + self.bulk_chunk_size])},
+            )
+            chunk_keys, *columns = zip(*cur.fetchall())
+            keys.extend(chunk_keys)
+            geometries.append(self._geometries_from_columns(*columns))
+        return keys, np.concatenate(geometries)
 
     def bquery(
         self: SQLiteStore,
@@ -3263,6 +5490,89 @@ class SQLiteStore(AnnotationStore):
             return result[0]
         return result
 
+    def aggregate(
+        self: SQLiteStore,
+        aggregates: dict[str, tuple[str, str]] | None = None,
+        by: str | None = None,
+        geometry: QueryGeometry | None = None,
+        where: Predicate | None = None,
+        geometry_predicate: str = "intersects",
+        *,
+        bins: Iterable[float] | None = None,
+    ) -> dict[object, dict[str, object]]:
+        """Compute summary statistics of annotations, optionally in groups.
+
+        The statistics are computed in the database with SQL aggregate
+        functions and `GROUP BY`, without loading the annotations. A
+        Callable `where` can not be evaluated in the database, so the
+        annotations are loaded in that case. See
+        :meth:`AnnotationStore.aggregate`.
+
+        """
+        if isinstance(where, Callable):
+            return super().aggregate(
+                aggregates,
+                by,
+                geometry,
+                where,
+                geometry_predicate,
+                bins=bins,
+            )
+        aggregates, bins = self._validate_aggregate(aggregates, by, bins)
+        area = "area" if "area" in self.table_columns else "get_area(geometry, cx, cy)"
+
+        def to_sql(expression: str) -> str:
+            """Convert an aggregate expression to SQL."""
+            if expression in ("*", "area"):
+                return {"*": "*", "area": area}[expression]
+            return str(
+                eval(  # skipcq: PYL-W0123,  # noqa: PGH001, S307
+                    expression,
+                    SQL_GLOBALS,
+                    {},
+                ),
+            )
+
+        group = "NULL" if by is None else to_sql(by)
+        if bins is not None:
+            # Index of the bin containing the value (the last bin
+            # includes its upper edge)
+            cases = " ".join(
+                f"WHEN {group} >= {lower!r} AND {group} < {upper!r} THEN {i}"
+                for i, (lower, upper) in enumerate(zip(bins[:-1], bins[1:]))
+            )
+            group = f"CASE {cases} WHEN {group} = {bins[-1]!r} THEN {len(bins) - 2} END"
+        sql_functions = {
+            "count": "COUNT",
+            "sum": "SUM",
+            "mean": "AVG",
+            "min": "MIN",
+            "max": "MAX",
+        }
+        columns = ", ".join(
+            [group]
+            + [
+                f"{sql_functions[function]}({to_sql(expression)})"
+                for function, expression in aggregates.values()
+            ],
+        )
+        cur = self._query(
+            columns=columns,
+            geometry=geometry,
+            geometry_predicate=geometry_predicate,
+            where=where,
+            no_constraints_ok=True,
+            group_by="1",
+        )
+        result = {}
+        for group_value, *values in cur:
+            if bins is None:
+                result[group_value] = dict(zip(aggregates, values))
+            elif group_value is not None:
+                edges = (bins[group_value], bins[group_value + 1])
+                result[edges] = dict(zip(aggregates, values))
+        return result
+
     def __len__(self: SQLiteStore) -> int:
         """Return number of annotations in the store."""
         cur = self.con.cursor()
@@ -3322,6 +5632,59 @@ class SQLiteStore(AnnotationStore):
                 break
             yield row[0]  # The key
 
+    def values_for(self: SQLiteStore, keys: Iterable[str]) -> Iterator[Annotation]:
+        """Return an iterator of the annotations with the given keys.
+
+        The annotations are fetched in batches of `bulk_chunk_size`
+        keys and their geometries are decoded when accessed. See
+        :meth:`AnnotationStore.values_for`.
+
+        """
+        for _, annotation in self._load_annotations("[key]", keys):
+            yield annotation
+
+    def _load_annotations(
+        self: SQLiteStore,
+        column: str,
+        values: Iterable[object],
+    ) -> Iterator[tuple[str, Annotation]]:
+        """Load the annotations matching values of a unique column in batches.
+
+        Args:
+            column (str):
+                The unique column to look up, "[key]" or "id".
+            values (Iterable):
+                The values of the column to look up.
+
+        Yields:
+            tuple:
+                The key and annotation for each value, in order.
+
+        Raises:
+            KeyError:
+                If a value is not in the store.
+
+        """
+        values = iter(values)
+        while chunk := list(itertools.islice(values, self.bulk_chunk_size)):
+            cur = self.con.execute(
+                f"""
+                SELECT {column}, [key], properties, cx, cy, geometry
+                  FROM annotations
+                 WHERE {column} IN (SELECT value FROM json_each(:values))
+                """,  # noqa: S608
+                {"values": json.dumps(chunk)},
+            )
+            rows = {row[0]: row[1:] for row in cur}
+            for value in chunk:
+                if value not in rows:
+                    raise KeyError(value)
+                key, properties, cx, cy, blob = rows[value]
+                yield key, Annotation(
+                    properties=json.loads(properties),
+                    wkb=self._unpack_wkb(blob, cx, cy),
+                )
+
     def values(self: SQLiteStore) -> Iterable[tuple[int, Annotation]]:
         """Return an iterable of all annotation in the store.
 
@@ -3354,6 +5717,45 @@ class SQLiteStore(AnnotationStore):
             properties = json.loads(serialised_properties)
             yield key, Annotation(geometry, properties)
 
+    def _export_batches(
+        self: SQLiteStore,
+        batch_size: int,
+        *,
+        geometry: bool = True,
+    ) -> Generator[tuple[list[str], list[bytes] | None, list[Properties]], None, None]:
+        """Return batches of annotations for export.
+
+        The WKB of each geometry is read directly from the database
+        without creating Shapely objects.
+
+        Args:
+            batch_size (int):
+                The (maximum) number of annotations in each batch.
+            geometry (bool):
+                Whether to include the geometries. If False, None is
+                returned in place of the geometries.
+
+        Yields:
+            tuple:
+                The keys, WKB geometries, and properties of a batch of
+                annotations.
+
+        """
+        columns = (
+            "[key], properties, cx, cy, geometry" if geometry else "[key], properties"
+        )
+        cur = self.con.cursor()
+        cur.execute(f"SELECT {columns} FROM annotations")  # noqa: S608
+        while rows := cur.fetchmany(batch_size):
+            keys, properties, *geometry_columns = zip(*rows)
+            wkb = None
+            if geometry:
+                wkb = [
+                    self._unpack_wkb(data, cx, cy)
+                    for cx, cy, data in zip(*geometry_columns)
+                ]
+            yield list(keys), wkb, [json.loads(props) for props in properties]
+
     def patch_many(
         self: SQLiteStore,
         keys: Iterable[int],
@@ -3411,6 +5813,7 @@ class SQLiteStore(AnnotationStore):
                         "properties": json.dumps(properties, separators=(",", ":")),
                     },
                 )
+        self.generation += 1
         if self.auto_commit:
             self.con.commit()
 
@@ -3452,15 +5855,147 @@ class SQLiteStore(AnnotationStore):
             """,
             query_parameters,
         )
+        # Simplified geometries are recomputed by add_simplified_geometries
+        clear_simplified = "".join(
+            f", {column} = NULL" for column in self._simplified_columns()
+        )
         cur.execute(
-            """
+            f"""
             UPDATE annotations
-               SET cx = :x, cy = :y, geometry = :geometry
+               SET cx = :x, cy = :y, geometry = :geometry{clear_simplified}
              WHERE [key] = :key
-            """,
+            """,  # noqa: S608
             query_parameters,
         )
 
+    def _transform_affine(
+        self: SQLiteStore,
+        linear: np.ndarray,
+        offset: np.ndarray,
+    ) -> None:
+        """Apply an affine transformation to all annotations in bulk.
+
+        Annotations are read, transformed and written back in chunks
+        with vectorised shapely functions, in one transaction. The
+        rtree index is then rebuilt in Z-order, as in
+        :meth:`append_geometries`.
+
+        Args:
+            linear (np.ndarray):
+                The 2x2 linear part of the transformation.
+            offset (np.ndarray):
+                The translation of the transformation.
+
+        """
+        # Simplified geometries are recomputed by add_simplified_geometries
+        set_columns = "cx = ?, cy = ?, geometry = ?" + "".join(
+            f", {column} = NULL" for column in self._simplified_columns()
+        )
+        has_area = "area" in self.table_columns
+        if has_area:
+            set_columns += ", area = ?"
+        cur = self.con.cursor()
+        if self.auto_commit:
+            cur.execute("BEGIN")
+        try:
+            self._transform_affine_rows(
+                cur,
+                linear,
+                offset,
+                set_columns,
+                has_area=has_area,
+            )
+        except Exception:
+            # Leave the store unchanged and not in a transaction
+            if self.auto_commit:
+                self.con.rollback()
+            raise
+        self.generation += 1
+        if self.auto_commit:
+            self.con.commit()
+
+    def _transform_affine_rows(
+        self: SQLiteStore,
+        cur: sqlite3.Cursor,
+        linear: np.ndarray,
+        offset: np.ndarray,
+        set_columns: str,
+        *,
+        has_area: bool,
+    ) -> None:
+        """Transform and update all rows in chunks, then rebuild the rtree.
+
+        Args:
+            cur (sqlite3.Cursor):
+                The cursor to use for the transaction.
+            linear (np.ndarray):
+                The 2x2 linear part of the transformation.
+            offset (np.ndarray):
+                The translation of the transformation.
+            set_columns (str):
+                The SET clause of the update of each row.
+            has_area (bool):
+                Whether the store has an area column to update.
+
+        """
+        row_ids, centroids, bounds = [], [], []
+        last_id = -1
+        with self._bulk_load_pragmas():
+            while rows := cur.execute(
+                """
+                SELECT id, cx, cy, geometry
+                  FROM annotations
+                 WHERE id > ?
+                 ORDER BY id
+                 LIMIT ?
+                """,
+                (last_id, self.bulk_chunk_size),
+            ).fetchall():
+                ids, cxs, cys, blobs = zip(*rows)
+                last_id = ids[-1]
+                geometries = shapely.transform(
+                    self._geometries_from_columns(cxs, cys, blobs),
+                    lambda coords: coords @ linear.T + offset,
+                )
+                # points are stored only as their centroid
+                serialised_geometries = np.full(len(ids), None, dtype=object)
+                is_point = shapely.get_type_id(geometries) == shapely.GeometryType.POINT
+                serialised_geometries[~is_point] = self._compress_many(
+                    shapely.to_wkb(geometries[~is_point]).tolist(),
+                )
+                chunk_centroids = shapely.get_coordinates(shapely.centroid(geometries))
+                values = [
+                    chunk_centroids[:, 0].tolist(),
+                    chunk_centroids[:, 1].tolist(),
+                    serialised_geometries.tolist(),
+                ]
+                if has_area:
+                    values.append(shapely.area(geometries).tolist())
+                cur.executemany(
+                    f"UPDATE annotations SET {set_columns} WHERE id = ?",  # noqa: S608
+                    zip(*values, ids),
+                )
+                row_ids.extend(ids)
+                centroids.append(chunk_centroids)
+                bounds.append(shapely.bounds(geometries))
+            if not row_ids:
+                return
+            centroids = np.concatenate(centroids)
+            bounds = np.concatenate(bounds)
+            order = self._z_order(centroids)
+            row_ids = np.array(row_ids)
+            cur.execute("DELETE FROM rtree")
+            cur.executemany(
+                "INSERT INTO rtree VALUES(?, ?, ?, ?, ?)",
+                zip(
+                    row_ids[order].tolist(),
+                    bounds[order, 0].tolist(),
+                    bounds[order, 2].tolist(),
+                    bounds[order, 1].tolist(),
+                    bounds[order, 3].tolist(),
+                ),
+            )
+
     def remove_many(self: SQLiteStore, keys: Iterable[str]) -> None:
         """Bulk removal of annotations by keys.
 
@@ -3489,6 +6024,7 @@ class SQLiteStore(AnnotationStore):
                 "DELETE FROM annotations WHERE [key] = ?",
                 (key,),
             )
+        self.generation += 1
         if self.auto_commit:
             self.con.commit()
 
@@ -3523,6 +6059,7 @@ class SQLiteStore(AnnotationStore):
             self.create_index("area", '"area"')
         self.con.commit()
         self.table_columns.append("area")
+        self.generation += 1
 
     def remove_area_column(self: SQLiteStore) -> None:
         """Remove the area column from the store."""
@@ -3537,6 +6074,355 @@ class SQLiteStore(AnnotationStore):
         )
         self.con.commit()
         self.table_columns.remove("area")
+        self.generation += 1
+
+    def add_simplified_geometries(
+        self: SQLiteStore,
+        tolerances: Iterable[float] = (2, 8, 32, 128),
+    ) -> None:
+        """Add columns of simplified geometries for rendering when zoomed out.
+
+        For each tolerance a column is added holding every (non-point)
+        geometry simplified with :func:`shapely.simplify`, i.e. with no
+        point of the simplified geometry further than the tolerance
+        from the original. A query with a `tolerance` then returns the
+        most simplified geometry within that tolerance, which is
+        faster to decompress and draw. Geometry predicates are always
+        evaluated using the full geometry.
+
+        Annotations added after this is called, or whose geometry is
+        patched, use their full geometry until this is called again.
+        Only those annotations are simplified when called again with
+        the same tolerances.
+
+        Args:
+            tolerances (Iterable[float]):
+                The simplification tolerances, in the units of the
+                geometries (e.g. baseline pixels). Defaults to
+                (2, 8, 32, 128).
+
+        Raises:
+            ValueError:
+                If no tolerances are given.
+
+        """
+        tolerances = sorted(float(tolerance) for tolerance in tolerances)
+        if not tolerances:
+            msg = "At least one simplification tolerance must be given."
+            raise ValueError(msg)
+        if tolerances != self.simplified_tolerances:
+            self.remove_simplified_geometries()
+            self.simplified_tolerances = tolerances
+            for column in self._simplified_columns():
+                self.con.execute(f"ALTER TABLE annotations ADD COLUMN {column} BLOB")
+                self.table_columns.append(column)
+            self.metadata["simplified_tolerances"] = tolerances
+        columns = self._simplified_columns()
+        last_id = -1
+        while True:
+            rows = self.con.execute(
+                f"""
+                SELECT id, geometry
+                  FROM annotations
+                 WHERE id > ? AND geometry IS NOT NULL AND {columns[0]} IS NULL
+                 ORDER BY id
+                 LIMIT ?
+                """,  # noqa: S608
+                (last_id, self.bulk_chunk_size),
+            ).fetchall()
+            if not rows:
+                break
+            ids, blobs = zip(*rows)
+            last_id = ids[-1]
+            full_wkb = [self._decompress_data(blob) for blob in blobs]
+            geometries = shapely.from_wkb(full_wkb)
+            simplified_columns = []
+            for tolerance in tolerances:
+                simplified_wkb = shapely.to_wkb(
+                    shapely.simplify(geometries, tolerance),
+                )
+                # Store an empty blob (use the full geometry) if not any
+                # smaller. Unlike NULL, this marks the row as simplified.
+                smaller = [
+                    wkb if len(wkb) < len(full) else b""
+                    for wkb, full in zip(simplified_wkb, full_wkb)
+                ]
+                compressed = iter(self._compress_many([s for s in smaller if s]))
+                simplified_columns.append(
+                    [next(compressed) if wkb else b"" for wkb in smaller],
+                )
+            assignments = ", ".join(f"{column} = ?" for column in columns)
+            self.con.executemany(
+                f"UPDATE annotations SET {assignments} WHERE id = ?",  # noqa: S608
+                zip(*simplified_columns, ids),
+            )
+        self.generation += 1
+        if self.auto_commit:
+            self.con.commit()
+
+    def remove_simplified_geometries(self: SQLiteStore) -> None:
+        """Remove the simplified geometry columns from the store."""
+        for column in self._simplified_columns():
+            self.con.execute(f"ALTER TABLE annotations DROP COLUMN {column}")
+            self.table_columns.remove(column)
+        self.simplified_tolerances = []
+        if "simplified_tolerances" in self.metadata:
+            del self.metadata["simplified_tolerances"]
+        self.generation += 1
+        if self.auto_commit:
+            self.con.commit()
+
+    def _simplified_columns(self: SQLiteStore) -> list[str]:
+        """Return the names of the simplified geometry columns."""
+        return [
+            f"geometry_simplified_{i}" for i in range(len(self.simplified_tolerances))
+        ]
+
+    def _geometry_column(self: SQLiteStore, tolerance: float) -> str:
+        """Return an SQL expression for the geometry within a tolerance.
+
+        Args:
+            tolerance (float):
+                The maximum simplification tolerance.
+
+        Returns:
+            str:
+                The most simplified geometry column with a tolerance
+                no greater than the given tolerance, falling back to the
+                full geometry where it is NULL (not yet simplified) or
+                empty (simplifying did not make it smaller).
+
+        """
+        columns = [
+            column
+            for column, column_tolerance in zip(
+                self._simplified_columns(),
+                self.simplified_tolerances,
+            )
+            if column_tolerance <= tolerance
+        ]
+        if not columns:
+            return "geometry"
+        return f"COALESCE(NULLIF({columns[-1]}, x''), geometry)"
+
+    def add_density_grid(
+        self: SQLiteStore,
+        cell_size: float = 256,
+        levels: int = 6,
+        by: str | None = None,
+    ) -> None:
+        """Add a multi-resolution grid of annotation counts to the store.
+
+        Annotations are counted in square cells by their centroid (or
+        representative point) at each level of a pyramid, with the
+        cell size doubling at each level. Optionally, counts are kept
+        separately for each value of a property, e.g. the class of a
+        cell. The grid is kept up to date by triggers as annotations
+        are added, patched and removed. This allows rendering zoomed
+        out views of a store with many annotations (see
+        :meth:`density`) in time proportional to the number of cells
+        rather than the number of annotations. The triggers slow down
+        writes, so it is faster to add the grid after bulk loading.
+
+        Args:
+            cell_size (float):
+                The cell size at the lowest level of the grid, in the
+                units of the geometries (e.g. baseline pixels).
+                Defaults to 256.
+            levels (int):
+                The number of levels in the grid. Defaults to 6.
+            by (str):
+                An optional property to count annotations by, e.g.
+                "type". Defaults to None.
+
+        """
+        if by is not None and '"' in by:
+            msg = "The property to count annotations by must not contain quotes."
+            raise ValueError(msg)
+        self.remove_density_grid()
+        cell_sizes = [cell_size * 2**level for level in range(levels)]
+        self.con.execute(
+            """
+            CREATE TABLE density_levels(
+                level INTEGER PRIMARY KEY,  -- Level of the grid
+                cell_size FLOAT NOT NULL    -- Cell size at this level
+            )
+            """,
+        )
+        self.con.executemany(
+            "INSERT INTO density_levels VALUES (?, ?)",
+            enumerate(cell_sizes),
+        )
+        self.con.execute(
+            """
+            CREATE TABLE density(
+                level INTEGER,            -- Level of the grid
+                i INTEGER,                -- Cell column
+                j INTEGER,                -- Cell row
+                value TEXT,               -- JSON property value
+                count INTEGER NOT NULL,   -- Number of annotations
+                PRIMARY KEY (level, i, j, value)
+            ) WITHOUT ROWID
+            """,
+        )
+
+        def cells(row: str) -> str:
+            """SQL for the level, cell and value of a row at each level."""
+            value = "'null'"
+            if by is not None:
+                path = f'$."{by}"'.replace("'", "''")
+                value = f"json_quote(json_extract({row}.properties, '{path}'))"
+            # Floor division (without the optional SQLite math functions)
+            i = f"{row}.cx / density_levels.cell_size"
+            j = f"{row}.cy / density_levels.cell_size"
+            return f"""
+                density_levels.level,
+                CAST({i} AS INTEGER) - ({i} < CAST({i} AS INTEGER)),
+                CAST({j} AS INTEGER) - ({j} < CAST({j} AS INTEGER)),
+                {value}
+            """
+
+        self.con.execute(
+            f"""
+            INSERT INTO density
+            SELECT {cells("annotations")}, COUNT(*)
+              FROM annotations, density_levels
+             GROUP BY 1, 2, 3, 4
+            """,  # noqa: S608
+        )
+        insert_new = f"""
+            INSERT INTO density
+            SELECT {cells("new")}, 1
+              FROM density_levels
+             WHERE true
+                ON CONFLICT DO UPDATE SET count = count + 1;
+        """  # noqa: S608
+        old_cells = f"SELECT {cells('old')} FROM density_levels"  # noqa: S608
+        delete_old = f"""
+            UPDATE density
+               SET count = count - 1
+             WHERE (level, i, j, value) IN ({old_cells});
+            DELETE FROM density
+             WHERE count <= 0 AND (level, i, j, value) IN ({old_cells});
+        """  # noqa: S608
+        for trigger, event, statements in (
+            ("density_insert", "INSERT", insert_new),
+            ("density_delete", "DELETE", delete_old),
+            ("density_update", "UPDATE OF cx, cy, properties", delete_old + insert_new),
+        ):
+            self.con.execute(
+                f"""
+                CREATE TRIGGER {trigger} AFTER {event} ON annotations
+                BEGIN {statements} END
+                """,
+            )
+        self.density_grid = {"cell_sizes": cell_sizes, "by": by}
+        self.metadata["density_grid"] = self.density_grid
+        self._max_densities = (self.generation, {})
+        if self.auto_commit:
+            self.con.commit()
+
+    def remove_density_grid(self: SQLiteStore) -> None:
+        """Remove the grid of annotation counts from the store."""
+        for trigger in ("density_insert", "density_delete", "density_update"):
+            self.con.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        self.con.execute("DROP TABLE IF EXISTS density")
+        self.con.execute("DROP TABLE IF EXISTS density_levels")
+        self.density_grid = None
+        self._max_densities = (self.generation, {})
+        if "density_grid" in self.metadata:
+            del self.metadata["density_grid"]
+        if self.auto_commit:
+            self.con.commit()
+
+    def density(
+        self: SQLiteStore,
+        bounds: tuple[float, float, float, float],
+        level: int = 0,
+    ) -> dict[Any, np.ndarray]:
+        """Get the annotation counts in grid cells within some bounds.
+
+        Requires a grid of counts to have been added with
+        :meth:`add_density_grid`.
+
+        Args:
+            bounds (tuple(float)):
+                The bounds (min x, min y, max x, max y) to get the cells
+                within.
+            level (int):
+                The level of the grid. Cells at level `n` have a size of
+                `density_grid["cell_sizes"][n]`. Defaults to 0.
+
+        Returns:
+            dict:
+                A mapping of property value (None if not counting by
+                a property) to an array of cells with annotations of
+                that value. Each row of the array holds the cell column,
+                row and count, such that the cell covers `column *
+                cell_size <= x < (column + 1) * cell_size` (and
+                similarly for y).
+
+        """
+        if self.density_grid is None:
+            msg = "The store has no density grid. See `add_density_grid`."
+            raise ValueError(msg)
+        cell_size = self.density_grid["cell_sizes"][level]
+        min_i, min_j, max_i, max_j = np.floor_divide(bounds, cell_size).astype(int)
+        cur = self.con.execute(
+            """
+            SELECT value, i, j, count
+              FROM density
+             WHERE level = ? AND i BETWEEN ? AND ? AND j BETWEEN ? AND ?
+            """,
+            (level, int(min_i), int(max_i), int(min_j), int(max_j)),
+        )
+        cells = defaultdict(list)
+        for value, i, j, count in cur:
+            cells[value].append((i, j, count))
+        return {
+            json.loads(value): np.array(rows, dtype=np.int64)
+            for value, rows in cells.items()
+        }
+
+    def max_density(self: SQLiteStore, level: int = 0) -> int:
+        """Get the largest total count of any cell in a level of the grid.
+
+        The count is found with a query over the whole level, so it is
+        cached until the store is next modified (see `query_cache_size`
+        for how changes are detected). Rendering many tiles of a level
+        then runs the query once.
+
+        Args:
+            level (int):
+                The level of the grid. Defaults to 0.
+
+        Returns:
+            int:
+                The largest number of annotations in a cell (of any
+                property value), or 0 if there are no annotations.
+
+        """
+        if self.density_grid is None:
+            msg = "The store has no density grid. See `add_density_grid`."
+            raise ValueError(msg)
+        self._check_data_version()
+        generation, max_densities = self._max_densities
+        if generation != self.generation:
+            max_densities = {}
+            self._max_densities = (self.generation, max_densities)
+        if level not in max_densities:
+            (max_count,) = self.con.execute(
+                """
+                SELECT MAX(total)
+                  FROM (SELECT SUM(count) AS total
+                          FROM density
+                         WHERE level = ?
+                         GROUP BY i, j)
+                """,
+                (level,),
+            ).fetchone()
+            max_densities[level] = max_count or 0
+        return max_densities[level]
 
     def to_dataframe(self: SQLiteStore) -> pd.DataFrame:
         """Converts AnnotationStore to :class:`pandas.DataFrame`."""
@@ -3601,6 +6487,7 @@ class SQLiteStore(AnnotationStore):
         cur = self.con.cursor()
         cur.execute("DELETE FROM rtree")
         cur.execute("DELETE FROM annotations")
+        self.generation += 1
         if self.auto_commit:
             self.con.commit()
 
@@ -3690,7 +6577,21 @@ class SQLiteStore(AnnotationStore):
 
 
 class DictionaryStore(AnnotationStore):
-    """Pure python dictionary backed annotation store."""
+    """Pure python dictionary backed annotation store.
+
+    The bounds of each annotation are kept in a numpy array which is
+    updated as annotations are added, changed, or removed. Queries
+    compare the query bounds with all stored bounds at once and only
+    evaluate the geometry predicate for the annotations which may
+    intersect the query.
+
+    String (DSL) where predicates are evaluated over columns of property
+    values (NumPy arrays) instead of once per annotation where possible.
+    The columns are built from the current properties for each query,
+    so changes made to an annotation's properties dictionary in place
+    are seen by later queries.
+
+    """
 
     def __init__(
         self: DictionaryStore,
@@ -3699,6 +6600,16 @@ class DictionaryStore(AnnotationStore):
         """Initialize :class:`DictionaryStore`."""
         super().__init__()
         self._rows = {}
+        # Spatial index of annotation bounds. Removed annotations leave
+        # a NaN row (and a None key) until the index is compacted.
+        self._bounds = np.full((0, 4), np.nan)
+        self._bounds_keys: list[str | None] = []
+        self._bounds_slots: dict[str, int] = {}
+        self._num_removed = 0
+        # Cached index slots and annotations of live annotations,
+        # discarded on any change
+        self._slots: np.ndarray | None = None
+        self._slot_annotations: list[Annotation] | None = None
         self.connection = connection
         self.path = self._connection_to_path(connection)
         if self.connection not in [None, ":memory:"] and self.path.exists():
@@ -3738,6 +6649,7 @@ class DictionaryStore(AnnotationStore):
             raise TypeError(msg)
         key = key or str(uuid.uuid4())
         self._rows[key] = {"annotation": annotation}
+        self._index_bounds(key, annotation.geometry)
         return key
 
     def patch(
@@ -3783,6 +6695,243 @@ class DictionaryStore(AnnotationStore):
 
         """
         del self._rows[key]
+        self._unindex_bounds(key)
+
+    def _index_bounds(self: DictionaryStore, key: str, geometry: Geometry) -> None:
+        """Add or update the bounds of an annotation in the spatial index.
+
+        Args:
+            key (str):
+                The key of the annotation.
+            geometry (Geometry):
+                The geometry of the annotation.
+
+        """
+        slot = self._bounds_slots.get(key)
+        if slot is None:
+            slot = len(self._bounds_keys)
+            if slot == len(self._bounds):
+                # Grow geometrically so that appending is amortised O(1)
+                grown = np.full((max(2 * slot, 1024), 4), np.nan)
+                grown[:slot] = self._bounds
+                self._bounds = grown
+            self._bounds_keys.append(key)
+            self._bounds_slots[key] = slot
+        self._bounds[slot] = geometry.bounds
+        self._slots = self._slot_annotations = None
+
+    def _unindex_bounds(self: DictionaryStore, key: str) -> None:
+        """Remove an annotation from the spatial index.
+
+        Args:
+            key (str):
+                The key of the annotation.
+
+        """
+        slot = self._bounds_slots.pop(key)
+        self._bounds[slot] = np.nan
+        self._bounds_keys[slot] = None
+        self._num_removed += 1
+        self._slots = self._slot_annotations = None
+        if self._num_removed > len(self._bounds_keys) // 2:
+            self._compact_bounds()
+
+    def _compact_bounds(self: DictionaryStore) -> None:
+        """Remove the rows of removed annotations from the spatial index.
+
+        The relative order of the remaining annotations is unchanged.
+
+        """
+        slots = [i for i, key in enumerate(self._bounds_keys) if key is not None]
+        self._bounds = self._bounds[slots]
+        self._bounds_keys = [self._bounds_keys[i] for i in slots]
+        self._bounds_slots = {key: i for i, key in enumerate(self._bounds_keys)}
+        self._num_removed = 0
+
+    def _query_candidates(
+        self: DictionaryStore,
+        query_geometry: Geometry | None,
+        geometry_predicate: str = "intersects",
+        distance: float = 0,
+        where: Predicate | None = None,
+    ) -> tuple[Iterable[tuple[str, Annotation]], Predicate | None]:
+        """Return candidate items for a query using the spatial index.
+
+        Candidates are selected by comparing the query bounds with the
+        bounds of all annotations at once. String (DSL) where predicates
+        are evaluated for columns of the property values of the
+        candidates where possible (see
+        :class:`tiatoolbox.annotation.dsl.ColumnPredicate`), otherwise
+        they are returned to be evaluated per annotation.
+
+        Args:
+            query_geometry (Geometry):
+                The query geometry. If None, there is no geometry
+                constraint.
+            geometry_predicate (str):
+                The name of the geometry predicate to be evaluated.
+            distance (float):
+                Distance used for the "centers_within_k" predicate.
+            where (str or bytes or Callable):
+                The properties predicate of the query.
+
+        Returns:
+            tuple:
+                A generator of key and annotation pairs in insertion
+                order, and the part of the where predicate which must
+                still be evaluated for each of them.
+
+        """
+        mask = None
+        bounds = self._candidate_bounds(query_geometry, geometry_predicate, distance)
+        if bounds is not None:
+            mask = self._bounds_mask(bounds)
+        if isinstance(where, str):
+            slots = None if mask is None else np.flatnonzero(mask)
+            where_mask = self._where_mask(where, slots)
+            if where_mask is not None:
+                mask = where_mask
+                where = None
+        if mask is None:
+            return self.items(), where
+        return self._items_from_mask(mask), where
+
+    def _bounds_mask(
+        self: DictionaryStore,
+        bounds: tuple[float, float, float, float],
+    ) -> np.ndarray:
+        """Return a mask of index slots with bounds intersecting the given bounds.
+
+        Args:
+            bounds (tuple(float)):
+                The bounds (min_x, min_y, max_x, max_y) to intersect.
+
+        Returns:
+            np.ndarray:
+                A boolean mask with one element per index slot.
+
+        """
+        min_x, min_y, max_x, max_y = bounds
+        stored = self._bounds[: len(self._bounds_keys)]
+        # NaN rows (removed annotations) never compare as True
+        return (
+            (stored[:, 0] <= max_x)
+            & (stored[:, 1] <= max_y)
+            & (stored[:, 2] >= min_x)
+            & (stored[:, 3] >= min_y)
+        )
+
+    def _where_mask(
+        self: DictionaryStore,
+        where: str,
+        slots: np.ndarray | None = None,
+    ) -> np.ndarray | None:
+        """Evaluate a where predicate for columns of property values.
+
+        Args:
+            where (str):
+                The predicate string.
+            slots (np.ndarray):
+                The index slots of the annotations to evaluate the
+                predicate for, e.g. the candidates of a spatial query.
+                Defaults to all annotations.
+
+        Returns:
+            np.ndarray or None:
+                A boolean mask with one element per index slot, which
+                is True where the predicate is true for one of the given
+                slots, or None if the predicate can not be evaluated for
+                columns.
+
+        """
+        predicate = column_predicate(where)
+        if predicate is None:
+            return None
+        if slots is None:
+            slots = self._live_slots()
+            annotations = self._live_annotations()
+        else:
+            annotations = [
+                self._rows[self._bounds_keys[slot]]["annotation"]
+                for slot in slots.tolist()
+            ]
+        # Properties are read for every query as they may be changed in place
+        properties = [annotation.properties for annotation in annotations]
+        try:
+            result = predicate(
+                ColumnDictionary(partial(self._property_column, properties)),
+            )
+            result = np.broadcast_to(np.asarray(result), slots.shape)
+            result = result.astype(bool)
+        except (ArithmeticError, KeyError, TypeError, ValueError):
+            # Fall back to evaluating per annotation, which raises the
+            # same errors as evaluating the predicate directly.
+            return None
+        mask = np.zeros(len(self._bounds_keys), dtype=bool)
+        mask[slots] = result
+        return mask
+
+    def _live_slots(self: DictionaryStore) -> np.ndarray:
+        """Return the index slots of annotations which have not been removed."""
+        if self._slots is None:
+            self._slots = np.array(
+                [i for i, key in enumerate(self._bounds_keys) if key is not None],
+                dtype=int,
+            )
+        return self._slots
+
+    def _live_annotations(self: DictionaryStore) -> list[Annotation]:
+        """Return the annotations of the slots in :meth:`_live_slots`."""
+        if self._slot_annotations is None:
+            self._slot_annotations = [
+                self._rows[self._bounds_keys[slot]]["annotation"]
+                for slot in self._live_slots().tolist()
+            ]
+        return self._slot_annotations
+
+    @staticmethod
+    def _property_column(
+        properties: list[Properties],
+        key: str,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the values of a property as a column.
+
+        Args:
+            properties (list(dict)):
+                The properties of the annotations.
+            key (str):
+                The property key.
+
+        Returns:
+            tuple(np.ndarray, np.ndarray):
+                The values of the property (None where the property is
+                missing) and a boolean mask of where it is present.
+
+        """
+        return (
+            to_column([props.get(key) for props in properties]),
+            np.array([key in props for props in properties], dtype=bool),
+        )
+
+    def _items_from_mask(
+        self: DictionaryStore,
+        mask: np.ndarray,
+    ) -> Generator[tuple[str, Annotation], None, None]:
+        """Return the items of the index slots selected by a mask.
+
+        Args:
+            mask (np.ndarray):
+                A boolean mask with one element per index slot.
+
+        Returns:
+            Generator[tuple[str, Annotation]]:
+                A generator of key and annotation pairs in insertion
+                order.
+
+        """
+        for slot in np.flatnonzero(mask):
+            key = self._bounds_keys[slot]
+            yield key, self._rows[key]["annotation"]
 
     def __getitem__(self: DictionaryStore, key: str) -> Annotation:
         """Get an item from the store."""
@@ -3793,6 +6942,7 @@ class DictionaryStore(AnnotationStore):
         if key in self._rows:
             self._rows[key]["annotation"] = annotation
         self._rows[key] = {"annotation": annotation}
+        self._index_bounds(key, annotation.geometry)
 
     def __contains__(self: DictionaryStore, key: str) -> bool:
         """Test whether the object contains the specified object or not."""
@@ -359,3 +359,24 @@ class WSIPatchDataset(dataset_abc.PatchDatasetABC):
         patch = self._preproc(patch)
 
         return {"image": patch, "coords": np.array(coords)}
+
+    def __getitems__(self: WSIPatchDataset, indices: list[int]) -> list[dict]:
+        """Get a batch of items from the dataset.
+
+        Patches are read together with
+        :func:`WSIReader.read_bounds_batch` so that read parameters
+        and decoded tiles are shared within the batch.
+
+        """
+        coords = self.inputs[indices]
+        patches = self.reader.read_bounds_batch(
+            coords,
+            resolution=self.resolution,
+            units=self.units,
+            pad_constant_values=255,
+            coord_space="resolution",
+        )
+        return [
+            {"image": self._preproc(patch), "coords": np.array(coord)}
+            for patch, coord in zip(patches, coords)
+        ]
@@ -241,6 +241,8 @@ class MultiTaskSegmentor(NucleusInstanceSegmentor):
 
     """
 
+    output_types_supported = ("dat",)
+
     def __init__(  # noqa: PLR0913
         self: MultiTaskSegmentor,
         batch_size: int = 8,
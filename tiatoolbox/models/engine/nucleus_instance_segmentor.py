@@ -3,22 +3,27 @@ from __future__ import annotations
 
 import uuid
 from collections import deque
-from typing import Callable
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Callable, Iterator
 
 # replace with the sql database once the PR in place
 import joblib
 import numpy as np
+import shapely
 import torch
 import tqdm
 from shapely.geometry import box as shapely_box
 from shapely.strtree import STRtree
 
+from tiatoolbox.annotation.storage import SQLiteStore
 from tiatoolbox.models.engine.semantic_segmentor import (
     IOSegmentorConfig,
     SemanticSegmentor,
     WSIStreamDataset,
+    _run_pipelined,
 )
 from tiatoolbox.tools.patchextraction import PatchExtractor
+from tiatoolbox.utils.misc import anns_from_hoverdict
 
 
 def _process_instance_predictions(
@@ -324,6 +329,12 @@ class NucleusInstanceSegmentor(SemanticSegmentor):
             # the probabilities of being this nuclei type
             prob: float
 
+    With `output_type="db"` in `predict`, the instances are instead
+    written to a `.db` :class:`SQLiteStore` as soon as they can no
+    longer be removed by the processing of later tiles, in the same
+    format as :func:`tiatoolbox.utils.misc.store_from_dat`. This keeps
+    only the instances around unfinished tiles in memory.
+
     Args:
         model (nn.Module):
             Use externally defined PyTorch model for prediction with.
@@ -355,6 +366,13 @@ class NucleusInstanceSegmentor(SemanticSegmentor):
             To automatically generate tile/WSI tissue mask
           if is not provided.
 
+    Attributes:
+        pipeline_depth (int):
+            As in :class:`SemanticSegmentor`. When positive, this is
+            also the number of inferred tiles which may wait for
+            post-processing. Inference of the next tiles then runs
+            while earlier tiles are post-processed and merged.
+
     Examples:
         >>> # Sample output of a network
         >>> wsis = ['A/wsi.svs', 'B/wsi.svs']
@@ -367,6 +385,8 @@ class NucleusInstanceSegmentor(SemanticSegmentor):
 
     """
 
+    output_types_supported = ("dat", "db")
+
     def __init__(
         self: NucleusInstanceSegmentor,
         batch_size: int = 8,
@@ -400,6 +420,7 @@ class NucleusInstanceSegmentor(SemanticSegmentor):
 
         # adding more runtime placeholder
         self._wsi_inst_info = None
+        self._wsi_inst_store = None
         self._futures = []
 
     @staticmethod
@@ -633,32 +654,13 @@ class NucleusInstanceSegmentor(SemanticSegmentor):
         )
 
         cum_output = []
-        for _, batch_data in enumerate(self._loader):
-            sample_datas, sample_infos = batch_data
-            batch_size = sample_infos.shape[0]
-            # ! depending on the protocol of the output within infer_batch
-            # ! this may change, how to enforce/document/expose this in a
-            # ! sensible way?
-
-            # assume to return a list of L output,
-            # each of shape N x etc. (N=batch size)
-            sample_outputs = self.model.infer_batch(
-                self._model,
-                sample_datas,
-                on_gpu=self._on_gpu,
-            )
-            # repackage so that it's a N list, each contains
-            # L x etc. output
-            sample_outputs = [np.split(v, batch_size, axis=0) for v in sample_outputs]
-            sample_outputs = list(zip(*sample_outputs))
-
-            # tensor to numpy, costly?
-            sample_infos = sample_infos.numpy()
-            sample_infos = np.split(sample_infos, batch_size, axis=0)
 
-            sample_outputs = list(zip(sample_infos, sample_outputs))
-            cum_output.extend(sample_outputs)
+        def process_batch(batch: tuple[torch.Tensor, list]) -> None:
+            """Repackage the model outputs of one batch."""
+            cum_output.extend(self._split_batch_outputs(*batch))
             pbar.update()
+
+        _run_pipelined(self._infer_batches(), process_batch, self.pipeline_depth)
         pbar.close()
         return cum_output
 
@@ -720,40 +722,133 @@ class NucleusInstanceSegmentor(SemanticSegmentor):
         # !     will be deprecated upon finalization of SQL annotation store
         self._wsi_inst_info = {}
         # !
+        self._wsi_inst_store = None
+
+        def infer_tiles() -> Iterator[tuple]:
+            """Run the inference on each tile of each tile set in turn."""
+            for set_idx, (set_bounds, set_flags) in enumerate(tile_info_sets):
+                for tile_bounds, tile_flag in zip(set_bounds, set_flags):
+                    # select any patches that have their output
+                    # within the current tile
+                    sel_box = shapely_box(*tile_bounds)
+                    sel_indices = list(spatial_indexer.query(sel_box))
+
+                    # there is nothing in the tile
+                    # Ignore coverage as the condition is difficult
+                    # to reproduce on travis.
+                    if len(sel_indices) == 0:  # pragma: no cover
+                        continue
+
+                    tile_patch_inputs = patch_inputs[sel_indices]
+                    tile_patch_outputs = patch_outputs[sel_indices]
+                    self._to_shared_space(
+                        wsi_idx,
+                        tile_patch_inputs,
+                        tile_patch_outputs,
+                    )
+
+                    tile_infer_output = self._infer_once()
+                    yield set_idx, tile_bounds, tile_flag, tile_infer_output
+            # mark the end so that the last set is also merged by `process_tile`
+            yield len(tile_info_sets), None, None, None
+
+        # only the tiles at the cross-sections remove existing instances,
+        # there are none if the whole image fits in one tile
+        cross_section_tree = STRtree(
+            [
+                shapely_box(*bounds)
+                for set_bounds, _ in list(tile_info_sets)[3:]
+                for bounds in set_bounds
+            ],
+        )
 
-        for set_idx, (set_bounds, set_flags) in enumerate(tile_info_sets):
-            for tile_idx, tile_bounds in enumerate(set_bounds):
-                tile_flag = set_flags[tile_idx]
+        # tiles within a set are independent, but a set can only be
+        # post-processed once the results of the previous sets are merged
+        current_set_idx = 0
+
+        def process_tile(tile: tuple) -> None:
+            """Dispatch post-processing of a tile, merging finished sets."""
+            nonlocal current_set_idx
+            set_idx, tile_bounds, tile_flag, tile_infer_output = tile
+            if set_idx != current_set_idx:
+                self._merge_post_process_results()
+                if self._output_type == "db":
+                    is_last = set_idx == len(tile_info_sets)
+                    self._save_final_instances(
+                        save_path,
+                        None if is_last else cross_section_tree,
+                    )
+                current_set_idx = set_idx
+            if tile_bounds is None:
+                return
+            self._process_tile_predictions(
+                ioconfig,
+                tile_bounds,
+                tile_flag,
+                set_idx,
+                tile_infer_output,
+            )
+            if self.pipeline_depth > 0:
+                self._wait_for_postproc_workers()
 
-                # select any patches that have their output
-                # within the current tile
-                sel_box = shapely_box(*tile_bounds)
-                sel_indices = list(spatial_indexer.query(sel_box))
+        _run_pipelined(infer_tiles(), process_tile, self.pipeline_depth)
+        if self._output_type == "dat":
+            joblib.dump(self._wsi_inst_info, f"{save_path}.dat")
+        # may need to chain it with parents
+        self._wsi_inst_info = None  # clean up
+
+    def _wait_for_postproc_workers(self: NucleusInstanceSegmentor) -> None:
+        """Limit the number of tiles held by the post-processing workers."""
+        if self._postproc_workers is None:
+            return
+        pending = [future for future in self._futures if not future.done()]
+        if len(pending) > self.num_postproc_workers:
+            wait(pending, return_when=FIRST_COMPLETED)
 
-                # there is nothing in the tile
-                # Ignore coverage as the condition is difficult
-                # to reproduce on travis.
-                if len(sel_indices) == 0:  # pragma: no cover
-                    continue
+    def _save_final_instances(
+        self: NucleusInstanceSegmentor,
+        save_path: str,
+        cross_section_tree: STRtree | None,
+    ) -> None:
+        """Move the instances which are final to the output store.
 
-                tile_patch_inputs = patch_inputs[sel_indices]
-                tile_patch_outputs = patch_outputs[sel_indices]
-                self._to_shared_space(wsi_idx, tile_patch_inputs, tile_patch_outputs)
+        Merged instances can only be removed by the post-processing of
+        the tiles at the cross-sections, so any instance not
+        overlapping these tiles is final. The store is created on the
+        first call and closed once all instances are final.
 
-                tile_infer_output = self._infer_once()
+        Args:
+            save_path (str):
+                Location to save the output store, without the `.db`
+                suffix.
+            cross_section_tree (:class:`STRtree`):
+                Spatial index of the bounds of the tiles at the
+                cross-sections which are yet to be processed. If `None`,
+                all instances are final.
 
-                self._process_tile_predictions(
-                    ioconfig,
-                    tile_bounds,
-                    tile_flag,
-                    set_idx,
-                    tile_infer_output,
-                )
+        """
+        if self._wsi_inst_store is None:
+            self._wsi_inst_store = SQLiteStore(f"{save_path}.db")
+
+        inst_uids = list(self._wsi_inst_info.keys())
+        if cross_section_tree is not None and len(inst_uids) > 0:
+            inst_boxes = np.array([self._wsi_inst_info[v]["box"] for v in inst_uids])
+            pending, _ = cross_section_tree.query(shapely.box(*inst_boxes.T))
+            is_final = np.ones(len(inst_uids), dtype=bool)
+            is_final[pending] = False
+            inst_uids = [v for v, final in zip(inst_uids, is_final) if final]
+
+        if len(inst_uids) > 0:
+            final_inst_info = {v: self._wsi_inst_info.pop(v) for v in inst_uids}
+            props = list(final_inst_info[inst_uids[0]].keys())
+            self._wsi_inst_store.append_many(
+                anns_from_hoverdict(final_inst_info, props, None, (0, 0), (1, 1)),
+                keys=inst_uids,
+            )
 
-            self._merge_post_process_results()
-        joblib.dump(self._wsi_inst_info, f"{save_path}.dat")
-        # may need to chain it with parents
-        self._wsi_inst_info = None  # clean up
+        if cross_section_tree is None:
+            self._wsi_inst_store.close()
+            self._wsi_inst_store = None
 
     def _process_tile_predictions(
         self: NucleusInstanceSegmentor,
@@ -809,3 +904,5 @@ class NucleusInstanceSegmentor(SemanticSegmentor):
             # manually call the callback rather than
             # attaching it when receiving/creating the future
             callback(*result)
+        # results are merged, do not merge them again with the next set
+        self._futures = []
@@ -2,19 +2,24 @@
 from __future__ import annotations
 
 import copy
+import itertools
 import logging
 import shutil
+import threading
 from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable
+from queue import Queue
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
 
 import cv2
 import joblib
+import numcodecs
 import numpy as np
 import torch
 import torch.multiprocessing as torch_mp
 import torch.utils.data as torch_data
 import tqdm
+import zarr
 
 from tiatoolbox import logger
 from tiatoolbox.models.architecture import get_pretrained_model
@@ -109,6 +114,304 @@ def _prepare_save_output(
     return is_on_drive, count_canvas, cum_canvas
 
 
+def _run_pipelined(
+    items: Iterable,
+    process: Callable[[Any], None],
+    max_pending: int,
+) -> None:
+    """Process items on a worker thread while the next items are produced.
+
+    Items are handed to a single worker thread through a queue holding
+    at most `max_pending` items, so production blocks when processing
+    falls behind. Items are processed in order. Exceptions raised
+    while producing or processing are re-raised in the calling thread.
+
+    Args:
+        items (Iterable):
+            Items to process. Iteration happens in the calling thread.
+        process (Callable):
+            Function applied to each item in the worker thread.
+        max_pending (int):
+            Maximum number of items waiting to be processed. If 0 or
+            less, items are processed sequentially in the calling
+            thread.
+
+    """
+    if max_pending <= 0:
+        for item in items:
+            process(item)
+        return
+
+    queue = Queue(maxsize=max_pending)
+    stop = threading.Event()
+    errors = []
+    sentinel = object()
+
+    def worker() -> None:
+        """Process items from the queue until the sentinel is reached."""
+        while (item := queue.get()) is not sentinel:
+            # keep draining the queue so that the producer never blocks
+            if stop.is_set():
+                continue
+            try:
+                process(item)
+            except Exception as error:  # noqa: BLE001
+                errors.append(error)
+                stop.set()
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    try:
+        for item in items:
+            if stop.is_set():
+                break
+            queue.put(item)
+    except BaseException:
+        stop.set()
+        raise
+    finally:
+        queue.put(sentinel)
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+
+def _overlapping_patch_groups(
+    tl: np.ndarray,
+    br: np.ndarray,
+    valid: np.ndarray,
+) -> list[np.ndarray]:
+    """Group patches into horizontal runs of touching patches.
+
+    Patches in a group share the same top and bottom and together
+    cover a contiguous area, so the bounding box of a group is no
+    larger than the total area of its patches.
+
+    Args:
+        tl (:class:`numpy.ndarray`):
+            Nx2 array of the top left (YX) of each patch.
+        br (:class:`numpy.ndarray`):
+            Nx2 array of the bottom right (YX) of each patch.
+        valid (:class:`numpy.ndarray`):
+            Boolean array marking the patches to group.
+
+    Returns:
+        list:
+            List of arrays of the patch indices in each group.
+
+    """
+    indices = np.flatnonzero(valid)
+    if len(indices) == 0:
+        return []
+    order = np.lexsort((tl[indices, 1], br[indices, 0], tl[indices, 0]))
+    indices = indices[order]
+    groups = [[indices[0]]]
+    run_end = br[indices[0], 1]
+    for prev, idx in zip(indices[:-1], indices[1:]):
+        same_row = tl[idx, 0] == tl[prev, 0] and br[idx, 0] == br[prev, 0]
+        # start a new group on a change of row or a gap between patches
+        if not same_row or tl[idx, 1] > run_end:
+            groups.append([])
+            run_end = br[idx, 1]
+        groups[-1].append(idx)
+        run_end = max(run_end, br[idx, 1])
+    return [np.array(group) for group in groups]
+
+
+class ZarrPredictionCanvas:
+    """Merge patch predictions into a chunked and compressed Zarr array.
+
+    Raw sums and counts are only kept in memory for chunks which have
+    been touched by a patch. As soon as every patch touching a chunk
+    has been merged, the chunk is averaged and written to the Zarr
+    array. Chunks which are not touched by any patch are never written
+    and read as zeros.
+
+    Args:
+        save_path (str or Path):
+            Path to save the Zarr array.
+        canvas_shape (:class:`numpy.ndarray`):
+            HW of the assembled image.
+        locations (:class:`numpy.ndarray`):
+            Nx4 array of the locations of all patches, in the order in
+            which they will be merged. Each location is of the form
+            `(top_left_x, top_left_y, bottom_right_x, bottom_right_y)`.
+        chunk_shape (tuple(int)):
+            HW of each chunk. Defaults to (1024, 1024).
+        compressor (:class:`numcodecs.abc.Codec`):
+            Compressor for the chunks. Defaults to Zstd with level 1 as
+            in :func:`tiatoolbox.utils.misc.dict_to_zarr`.
+
+    Attributes:
+        array (:class:`zarr.Array`):
+            The output array. Created on the first call to
+            :func:`merge`, once the number of channels is known.
+
+    Examples:
+        >>> canvas = ZarrPredictionCanvas(
+        ...     "output.zarr",
+        ...     canvas_shape=(4, 4),
+        ...     locations=[[0, 0, 2, 2], [2, 2, 4, 4]],
+        ... )
+        >>> canvas.merge(
+        ...     [np.full((2, 2), 1), np.full((2, 2), 2)],
+        ...     [[0, 0, 2, 2], [2, 2, 4, 4]],
+        ... )
+        >>> canvas.close()[..., 0]
+        array([[1., 1., 0., 0.],
+               [1., 1., 0., 0.],
+               [0., 0., 2., 2.],
+               [0., 0., 2., 2.]], dtype=float32)
+
+    """
+
+    def __init__(
+        self: ZarrPredictionCanvas,
+        save_path: str | Path,
+        canvas_shape: tuple[int, int] | np.ndarray,
+        locations: np.ndarray,
+        chunk_shape: tuple[int, int] = (1024, 1024),
+        compressor: numcodecs.abc.Codec | None = None,
+    ) -> None:
+        """Initialize :class:`ZarrPredictionCanvas`."""
+        self.save_path = Path(save_path)
+        self.canvas_shape = np.array(canvas_shape)
+        self.chunk_shape = np.array(chunk_shape)
+        self.compressor = compressor or numcodecs.Zstd(level=1)
+        self.array = None
+        # raw sum and count of chunks which are not yet finalised
+        self._pending = {}
+        self._num_merged = 0
+
+        # index of the last patch to touch each chunk
+        self._last_patch = {}
+        for idx, location in enumerate(np.reshape(locations, (-1, 4))):
+            for chunk in self._chunks(*self._clip(location)):
+                self._last_patch[chunk] = idx
+        self._finalise_order = sorted(self._last_patch, key=self._last_patch.get)
+        self._num_finalised = 0
+
+    def _clip(self: ZarrPredictionCanvas, location: np.ndarray) -> tuple:
+        """Convert an XY location to YX and clip it to the canvas."""
+        tl = np.maximum(np.array(location[1::-1]), 0)
+        br = np.minimum(np.array(location[:1:-1]), self.canvas_shape)
+        return tl, br
+
+    def _chunks(
+        self: ZarrPredictionCanvas,
+        tl: np.ndarray,
+        br: np.ndarray,
+    ) -> Iterator[tuple[int, int]]:
+        """Iterate over the indices of the chunks touched by a region."""
+        if np.any(br <= tl):
+            return iter(())
+        start = tl // self.chunk_shape
+        stop = (br - 1) // self.chunk_shape + 1
+        return itertools.product(range(start[0], stop[0]), range(start[1], stop[1]))
+
+    def _chunk_bounds(
+        self: ZarrPredictionCanvas,
+        chunk: tuple[int, int],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the YX top left and bottom right of a chunk."""
+        chunk_tl = np.array(chunk) * self.chunk_shape
+        chunk_br = np.minimum(chunk_tl + self.chunk_shape, self.canvas_shape)
+        return chunk_tl, chunk_br
+
+    def merge(
+        self: ZarrPredictionCanvas,
+        predictions: list[np.ndarray],
+        locations: np.ndarray,
+    ) -> None:
+        """Merge the next patch predictions onto the canvas.
+
+        Args:
+            predictions (list):
+                List of :class:`np.ndarray`, each item is a patch
+                prediction of shape HW or HWC.
+            locations (:class:`numpy.ndarray`):
+                Nx4 array of the location of each prediction. These
+                must follow on from the previously merged locations in
+                the order given at initialisation.
+
+        """
+        for prediction, location in zip(predictions, np.reshape(locations, (-1, 4))):
+            tl_in_wsi = np.array(location[1::-1])
+            patch_shape = tuple(np.array(location[:1:-1]) - tl_in_wsi)
+            # conversion to make cv2 happy
+            prediction = prediction.astype(np.float32, copy=False)  # noqa: PLW2901
+            if prediction.shape[:2] != patch_shape:
+                prediction = cv2.resize(prediction, patch_shape[::-1])  # noqa: PLW2901
+            if prediction.ndim == 2:  # noqa: PLR2004
+                prediction = prediction[..., None]  # noqa: PLW2901
+            if self.array is None:
+                self.array = zarr.open(
+                    str(self.save_path),
+                    mode="w",
+                    shape=(*self.canvas_shape, prediction.shape[-1]),
+                    chunks=(*self.chunk_shape, prediction.shape[-1]),
+                    dtype=np.float32,
+                    compressor=self.compressor,
+                    fill_value=0,
+                )
+            tl, br = self._clip(location)
+            for chunk in self._chunks(tl, br):
+                chunk_tl, chunk_br = self._chunk_bounds(chunk)
+                if chunk not in self._pending:
+                    self._pending[chunk] = (
+                        np.zeros(
+                            (*(chunk_br - chunk_tl), prediction.shape[-1]),
+                            dtype=np.float32,
+                        ),
+                        np.zeros((*(chunk_br - chunk_tl), 1), dtype=np.float32),
+                    )
+                cum_sum, count = self._pending[chunk]
+                # the region of the patch within this chunk
+                sub_tl = np.maximum(tl, chunk_tl)
+                sub_br = np.minimum(br, chunk_br)
+                in_chunk = tuple(
+                    slice(start, stop)
+                    for start, stop in zip(sub_tl - chunk_tl, sub_br - chunk_tl)
+                )
+                in_patch = tuple(
+                    slice(start, stop)
+                    for start, stop in zip(sub_tl - tl_in_wsi, sub_br - tl_in_wsi)
+                )
+                cum_sum[in_chunk] += prediction[in_patch]
+                count[in_chunk] += 1
+        self._num_merged += len(predictions)
+
+        # finalise the chunks which no remaining patch can touch
+        while self._num_finalised < len(self._finalise_order):
+            chunk = self._finalise_order[self._num_finalised]
+            if self._last_patch[chunk] >= self._num_merged:
+                break
+            self._finalise(chunk)
+            self._num_finalised += 1
+
+    def _finalise(self: ZarrPredictionCanvas, chunk: tuple[int, int]) -> None:
+        """Average a pending chunk and write it to the array."""
+        if chunk not in self._pending:
+            return
+        cum_sum, count = self._pending.pop(chunk)
+        np.divide(cum_sum, count, out=cum_sum, where=count > 0)
+        chunk_tl, chunk_br = self._chunk_bounds(chunk)
+        self.array[chunk_tl[0] : chunk_br[0], chunk_tl[1] : chunk_br[1]] = cum_sum
+
+    def close(self: ZarrPredictionCanvas) -> zarr.Array | None:
+        """Finalise all remaining chunks.
+
+        Returns:
+            :class:`zarr.Array`:
+                The output array, or None if nothing was merged.
+
+        """
+        for chunk in list(self._pending):
+            self._finalise(chunk)
+        return self.array
+
+
 class IOSegmentorConfig(IOConfigABC):
     """Contain semantic segmentor input and output information.
 
@@ -429,6 +732,47 @@ class WSIStreamDataset(torch_data.Dataset):
         bound = self.mp_shared_space.patch_outputs[idx]
         return patch_data_, bound
 
+    def __getitems__(self: WSIStreamDataset, indices: list[int]) -> list[tuple]:
+        """Get a batch of items from the dataset.
+
+        Patches are read together with
+        :func:`WSIReader.read_bounds_batch` so that read parameters
+        and decoded tiles are shared within the batch.
+
+        """
+        if self.wsi_idx != self.mp_shared_space.wsi_idx:
+            self.wsi_idx = int(self.mp_shared_space.wsi_idx.item())
+            self.reader = self._get_reader(self.wsi_paths[self.wsi_idx])
+
+        bounds = self.mp_shared_space.patch_inputs[indices].numpy()
+        scale_factors = self.ioconfig.scale_to_highest(
+            self.ioconfig.input_resolutions,
+            self.ioconfig.resolution_unit,
+        )
+        # one array of patches per input resolution
+        batch_data = []
+        for idy, resolution in enumerate(self.ioconfig.input_resolutions):
+            resolution_bounds = np.round(bounds * scale_factors[idy])
+            batch_data.append(
+                self.reader.read_bounds_batch(
+                    resolution_bounds.astype(np.int32),
+                    coord_space="resolution",
+                    pad_constant_values=0,
+                    **resolution,
+                ),
+            )
+
+        items = []
+        for idx, patches in zip(indices, zip(*batch_data)):
+            patch_data_ = list(patches)
+            if self.preproc is not None:
+                patch_data_ = [self.preproc(patch.copy()) for patch in patch_data_]
+            if len(patch_data_) == 1:
+                patch_data_ = patch_data_[0]
+            bound = self.mp_shared_space.patch_outputs[idx]
+            items.append((patch_data_, bound))
+        return items
+
 
 class SemanticSegmentor:
     """Pixel-wise segmentation predictor.
@@ -502,6 +846,12 @@ class SemanticSegmentor:
             A flag to denote whether post-processing for inference
             output is applied after each batch or after finishing an entire
             tile or WSI.
+        pipeline_depth (int):
+            Number of model output batches which may wait for
+            post-processing while the model runs on the next batch.
+            Post-processing then runs on a separate thread. Default is
+            0, which runs each batch to completion before loading the
+            next one.
 
     Examples:
         >>> # Sample output of a network
@@ -515,6 +865,9 @@ class SemanticSegmentor:
 
     """
 
+    # supported values of `output_type` in `predict`, the first is the default
+    output_types_supported = ("npy", "zarr")
+
     def __init__(
         self: SemanticSegmentor,
         batch_size: int = 8,
@@ -547,6 +900,7 @@ class SemanticSegmentor:
         # local variables for flagging mode within class,
         # subclass should have overwritten to alter some specific behavior
         self.process_prediction_per_batch = True
+        self.pipeline_depth = 0
 
         # for runtime, such as after wrapping with nn.DataParallel
         self._cache_dir = None
@@ -558,6 +912,8 @@ class SemanticSegmentor:
         self.num_postproc_workers = num_postproc_workers
         self._futures = None
         self._outputs = []
+        self._output_type = "npy"
+        self._zarr_canvases = None
         self.imgs = None
         self.masks = None
 
@@ -779,6 +1135,15 @@ class SemanticSegmentor:
             patch_outputs = patch_outputs[sel]
             patch_inputs = patch_inputs[sel]
 
+        if self._output_type == "zarr":
+            self._zarr_canvases = [
+                ZarrPredictionCanvas(
+                    f"{save_path}.raw.{index}.zarr",
+                    *self._merge_params(wsi_reader, ioconfig, index, patch_outputs),
+                )
+                for index in range(len(ioconfig.output_resolutions))
+            ]
+
         # modify the shared space so that we can update worker info
         # without needing to re-create the worker. There should be no
         # race-condition because only the following enumerate loop
@@ -801,30 +1166,10 @@ class SemanticSegmentor:
         )
 
         cum_output = []
-        for _, batch_data in enumerate(self._loader):
-            sample_datas, sample_infos = batch_data
-            batch_size = sample_infos.shape[0]
-            # ! depending on the protocol of the output within infer_batch
-            # ! this may change, how to enforce/document/expose this in a
-            # ! sensible way?
-
-            # assume to return a list of L output,
-            # each of shape N x etc. (N=batch size)
-            sample_outputs = self.model.infer_batch(
-                self._model,
-                sample_datas,
-                on_gpu=self._on_gpu,
-            )
-            # repackage so that it's an N list, each contains
-            # L x etc. output
-            sample_outputs = [np.split(v, batch_size, axis=0) for v in sample_outputs]
-            sample_outputs = list(zip(*sample_outputs))
 
-            # tensor to numpy, costly?
-            sample_infos = sample_infos.numpy()
-            sample_infos = np.split(sample_infos, batch_size, axis=0)
-
-            sample_outputs = list(zip(sample_infos, sample_outputs))
+        def process_batch(batch: tuple[torch.Tensor, list]) -> None:
+            """Post-process the model outputs of one batch."""
+            sample_outputs = self._split_batch_outputs(*batch)
             if self.process_prediction_per_batch:
                 self._process_predictions(
                     sample_outputs,
@@ -836,6 +1181,8 @@ class SemanticSegmentor:
             else:
                 cum_output.extend(sample_outputs)
             pbar.update()
+
+        _run_pipelined(self._infer_batches(), process_batch, self.pipeline_depth)
         pbar.close()
 
         self._process_predictions(
@@ -846,9 +1193,70 @@ class SemanticSegmentor:
             cache_dir,
         )
 
+        if self._zarr_canvases is not None:
+            for canvas in self._zarr_canvases:
+                canvas.close()
+            self._zarr_canvases = None
+
         # clean up the cache directories
         shutil.rmtree(cache_dir)
 
+    def _infer_batches(self: SemanticSegmentor) -> Iterator[tuple]:
+        """Run the model on each batch of the currently active dataloader.
+
+        Yields:
+            tuple:
+                The sample information of the batch and the list of
+                model outputs, each of shape N x etc. (N=batch size).
+
+        """
+        for sample_datas, sample_infos in self._loader:
+            # ! depending on the protocol of the output within infer_batch
+            # ! this may change, how to enforce/document/expose this in a
+            # ! sensible way?
+
+            # assume to return a list of L output,
+            # each of shape N x etc. (N=batch size)
+            sample_outputs = self.model.infer_batch(
+                self._model,
+                sample_datas,
+                on_gpu=self._on_gpu,
+            )
+            yield sample_infos, sample_outputs
+
+    @staticmethod
+    def _split_batch_outputs(
+        sample_infos: torch.Tensor,
+        sample_outputs: list,
+    ) -> list[tuple]:
+        """Repackage the model outputs of a batch per sample.
+
+        Args:
+            sample_infos (:class:`torch.Tensor`):
+                Sample information of the batch, as returned by the
+                dataloader.
+            sample_outputs (list):
+                List of L model outputs, each of shape N x etc.
+                (N=batch size).
+
+        Returns:
+            list:
+                N list of `(sample_info, outputs)` where `outputs`
+                contains the L outputs of the sample.
+
+        """
+        batch_size = sample_infos.shape[0]
+        # repackage so that it's an N list, each contains
+        # L x etc. output
+        sample_outputs = [np.split(v, batch_size, axis=0) for v in sample_outputs]
+        sample_outputs = list(zip(*sample_outputs))
+
+        # tensor to numpy, costly?
+        sample_infos = sample_infos.numpy()
+        sample_infos = np.split(sample_infos, batch_size, axis=0)
+
+        return list(zip(sample_infos, sample_outputs))
+
     def _process_predictions(
         self: SemanticSegmentor,
         cum_batch_predictions: list,
@@ -887,30 +1295,70 @@ class SemanticSegmentor:
         # output patch this can exceed the image bound at the requested
         # resolution remove singleton due to split.
         locations = np.array([v[0] for v in locations])
-        for index, output_resolution in enumerate(ioconfig.output_resolutions):
+        for index in range(len(ioconfig.output_resolutions)):
             # assume resolution index to be in the same order as L
-            merged_resolution = ioconfig.highest_input_resolution
-            merged_locations = locations
-            # ! location is w.r.t the highest resolution, hence still need conversion
-            if ioconfig.save_resolution is not None:
-                merged_resolution = ioconfig.save_resolution
-                output_shape = wsi_reader.slide_dimensions(**output_resolution)
-                merged_shape = wsi_reader.slide_dimensions(**merged_resolution)
-                fx = merged_shape[0] / output_shape[0]
-                merged_locations = np.ceil(locations * fx).astype(np.int64)
-            merged_shape = wsi_reader.slide_dimensions(**merged_resolution)
+            merged_shape, merged_locations = self._merge_params(
+                wsi_reader,
+                ioconfig,
+                index,
+                locations,
+            )
             # 0 idx is to remove singleton without removing other axes singleton
             to_merge_predictions = [v[index][0] for v in predictions]
+            if self._zarr_canvases is not None:
+                self._zarr_canvases[index].merge(to_merge_predictions, merged_locations)
+                continue
             sub_save_path = f"{save_path}.raw.{index}.npy"
             sub_count_path = f"{cache_dir}/count.{index}.npy"
             self.merge_prediction(
-                merged_shape[::-1],  # XY to YX
+                merged_shape,
                 to_merge_predictions,
                 merged_locations,
                 save_path=sub_save_path,
                 cache_count_path=sub_count_path,
             )
 
+    @staticmethod
+    def _merge_params(
+        wsi_reader: WSIReader,
+        ioconfig: IOSegmentorConfig,
+        index: int,
+        locations: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the canvas shape and patch locations to merge an output head.
+
+        Args:
+            wsi_reader (:class:`WSIReader`):
+                A reader for the image where the predictions come from.
+            ioconfig (:class:`IOSegmentorConfig`):
+                A configuration object contains input and output
+                information.
+            index (int):
+                Index of the output head.
+            locations (:class:`numpy.ndarray`):
+                Nx4 locations of the output patches at the highest
+                input resolution.
+
+        Returns:
+            tuple:
+                HW of the merged canvas and the locations of the
+                patches within it.
+
+        """
+        merged_resolution = ioconfig.highest_input_resolution
+        merged_locations = locations
+        # ! location is w.r.t the highest resolution, hence still need conversion
+        if ioconfig.save_resolution is not None:
+            merged_resolution = ioconfig.save_resolution
+            output_shape = wsi_reader.slide_dimensions(
+                **ioconfig.output_resolutions[index],
+            )
+            merged_shape = wsi_reader.slide_dimensions(**merged_resolution)
+            fx = merged_shape[0] / output_shape[0]
+            merged_locations = np.ceil(locations * fx).astype(np.int64)
+        merged_shape = wsi_reader.slide_dimensions(**merged_resolution)
+        return merged_shape[::-1], merged_locations  # XY to YX
+
     @staticmethod
     def merge_prediction(
         canvas_shape: tuple[int] | list[int] | np.ndarray,
@@ -928,6 +1376,11 @@ class SemanticSegmentor:
         `save_path` is `None`, the function will perform the
         accumulation using CPU-RAM as storage.
 
+        Predictions are only resized if their shape differs from their
+        location. When saving to the drive, the raw predictions of each
+        run of touching patches are summed in memory and the average on
+        the drive is updated once per run rather than once per patch.
+
         Args:
             canvas_shape (:class:`numpy.ndarray`):
                 HW of the supposed assembled image.
@@ -988,62 +1441,69 @@ class SemanticSegmentor:
             canvas_count_shape_,
         )
 
-        def index(arr: np.ndarray, tl: np.ndarray, br: np.ndarray) -> np.ndarray:
-            """Helper to shorten indexing."""
-            return arr[tl[0] : br[0], tl[1] : br[1]]
-
-        patch_infos = list(zip(locations, predictions))
-        for _, patch_info in enumerate(patch_infos):
-            # position is assumed to be in XY coordinate
-            (bound_in_wsi, prediction) = patch_info
-            # convert to XY to YX, and in tl, br
-            tl_in_wsi = np.array(bound_in_wsi[:2][::-1])
-            br_in_wsi = np.array(bound_in_wsi[2:][::-1])
-            old_tl_in_wsi = tl_in_wsi.copy()
-
-            # need to do conversion
-            patch_shape_in_wsi = tuple(br_in_wsi - tl_in_wsi)
+        # convert XY to YX, and in tl, br
+        locations = np.asarray(locations, dtype=np.int64).reshape(-1, 4)
+        tl_in_wsi = locations[:, [1, 0]]
+        br_in_wsi = locations[:, [3, 2]]
+        patch_shapes_in_wsi = br_in_wsi - tl_in_wsi
+        # clip to the canvas, patches may pass the image bound
+        tl_in_canvas = np.maximum(tl_in_wsi, 0)
+        br_in_canvas = np.minimum(br_in_wsi, canvas_shape)
+        tl_in_patch = tl_in_canvas - tl_in_wsi
+        br_in_patch = br_in_canvas - tl_in_wsi
+        valid = np.all(tl_in_canvas < canvas_shape, axis=1) & np.all(
+            br_in_canvas > tl_in_canvas,
+            axis=1,
+        )
+
+        def patch_prediction(idx: int) -> np.ndarray:
+            """Resize a patch prediction to its location and crop to canvas."""
             # conversion to make cv2 happy
-            prediction = prediction.astype(np.float32)
-            prediction = cv2.resize(prediction, patch_shape_in_wsi[::-1])
+            prediction = predictions[idx].astype(np.float32, copy=False)
+            patch_shape = tuple(patch_shapes_in_wsi[idx])
+            if prediction.shape[:2] != patch_shape:
+                prediction = cv2.resize(prediction, patch_shape[::-1])
             # ! cv2 resize will remove singleton !
-            if add_singleton_dim:
+            if add_singleton_dim and prediction.ndim == 2:  # noqa: PLR2004
                 prediction = prediction[..., None]
-
-            sel = tl_in_wsi < 0
-            tl_in_wsi[sel] = 0
-
-            if np.any(tl_in_wsi >= canvas_shape):
-                continue
-
-            sel = br_in_wsi > canvas_shape
-            br_in_wsi[sel] = canvas_shape[sel]
-
-            # re-calibrate the position in case patch passing the image bound
-            br_in_patch = br_in_wsi - old_tl_in_wsi
-            patch_actual_shape = br_in_wsi - tl_in_wsi
-            tl_in_patch = br_in_patch - patch_actual_shape
-
-            # now cropping the prediction region
-            patch_pred = prediction[
-                tl_in_patch[0] : br_in_patch[0],
-                tl_in_patch[1] : br_in_patch[1],
+            return prediction[
+                tl_in_patch[idx][0] : br_in_patch[idx][0],
+                tl_in_patch[idx][1] : br_in_patch[idx][1],
             ]
 
-            patch_count = np.ones(patch_pred.shape[:2])[..., None]
+        for group in _overlapping_patch_groups(tl_in_canvas, br_in_canvas, valid):
+            group_tl = tl_in_canvas[group].min(axis=0)
+            group_br = br_in_canvas[group].max(axis=0)
+            region = (
+                slice(group_tl[0], group_br[0]),
+                slice(group_tl[1], group_br[1]),
+            )
             if not is_on_drive:
-                index(cum_canvas, tl_in_wsi, br_in_wsi)[:] += patch_pred
-                index(count_canvas, tl_in_wsi, br_in_wsi)[:] += patch_count
+                # accumulate directly onto the canvas
+                cum_sum, count = cum_canvas[region], count_canvas[region]
             else:
-                old_avg_pred = np.array(index(cum_canvas, tl_in_wsi, br_in_wsi))
-                old_count = np.array(index(count_canvas, tl_in_wsi, br_in_wsi))
-                # ! there will be precision error, but we have to live with this
-                new_count = old_count + patch_count
+                # accumulate raw sums of the group in memory, then
+                # update the average on the drive once per group
+                cum_sum = np.zeros(
+                    (*(group_br - group_tl), cum_canvas.shape[-1]),
+                    dtype=np.float32,
+                )
+                count = np.zeros((*(group_br - group_tl), 1), dtype=np.float32)
+            for idx in group:
+                tl = tl_in_canvas[idx] - group_tl
+                br = br_in_canvas[idx] - group_tl
+                cum_sum[tl[0] : br[0], tl[1] : br[1]] += patch_prediction(idx)
+                count[tl[0] : br[0], tl[1] : br[1]] += 1
+            if is_on_drive:
+                old_avg_pred = np.array(cum_canvas[region])
+                old_count = np.array(count_canvas[region], dtype=np.float32)
+                new_count = old_count + count
                 # retrieve old raw probabilities after summation
-                old_raw_pred = old_avg_pred * old_count
-                new_avg_pred = (old_raw_pred + patch_pred) / new_count
-                index(cum_canvas, tl_in_wsi, br_in_wsi)[:] = new_avg_pred
-                index(count_canvas, tl_in_wsi, br_in_wsi)[:] = new_count
+                # ! there will be precision error, but we have to live with this
+                cum_sum += old_avg_pred * old_count
+                np.divide(cum_sum, new_count, out=old_avg_pred, where=count > 0)
+                cum_canvas[region] = old_avg_pred
+                count_canvas[region] = new_count
         if not is_on_drive:
             cum_canvas /= count_canvas + 1.0e-6
         return cum_canvas
@@ -1166,6 +1626,7 @@ class SemanticSegmentor:
         self._on_gpu = None
         self._futures = None
         self._mp_shared_space = None
+        self._zarr_canvases = None
         if self._postproc_workers is not None:
             self._postproc_workers.shutdown()
         self._postproc_workers = None
@@ -1264,6 +1725,7 @@ class SemanticSegmentor:
         *,
         on_gpu: bool = True,
         crash_on_exception: bool = False,
+        output_type: str | None = None,
     ) -> list[tuple[Path, Path]]:
         """Make a prediction for a list of input data.
 
@@ -1326,6 +1788,14 @@ class SemanticSegmentor:
                 If `True`, the running loop will crash if there is any
                 error during processing a WSI. Otherwise, the loop will
                 move on to the next wsi for processing.
+            output_type (str):
+                Format of the merged output of each head. Either
+                `"npy"` (default) for a dense `.raw.{i}.npy` array, or
+                `"zarr"` for a chunked and compressed `.raw.{i}.zarr`
+                array in which only the chunks touched by patches are
+                stored. See :class:`ZarrPredictionCanvas`. Subclasses
+                may support other formats, listed in
+                `output_types_supported`.
 
         Returns:
             list:
@@ -1347,6 +1817,15 @@ class SemanticSegmentor:
         if mode not in ["wsi", "tile"]:
             msg = f"{mode} is not a valid mode. Use either `tile` or `wsi`."
             raise ValueError(msg)
+        if output_type is None:
+            output_type = self.output_types_supported[0]
+        if output_type not in self.output_types_supported:
+            msg = (
+                f"{output_type} is not a valid output type. "
+                f"Use one of {self.output_types_supported}."
+            )
+            raise ValueError(msg)
+        self._output_type = output_type
 
         save_dir, self._cache_dir = self._prepare_save_dir(save_dir)
 
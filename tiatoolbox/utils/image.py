@@ -7,7 +7,7 @@ import numpy as np
 from PIL import Image
 
 from tiatoolbox import logger
-from tiatoolbox.utils.misc import conv_out_size
+from tiatoolbox.utils.misc import conv_out_size, copy_to_out
 from tiatoolbox.utils.transforms import (
     bounds2locsize,
     bounds2slices,
@@ -282,6 +282,32 @@ def crop_and_pad_edges(
     return np.pad(crop, padding, mode=pad_mode)
 
 
+def _pad_constant_into(
+    region: np.ndarray,
+    pad_width: list[tuple[int, int]],
+    constant_value: float,
+    out: np.ndarray,
+) -> np.ndarray:
+    """Write a region into `out` with constant padding around it.
+
+    Equivalent to `out[...] = np.pad(region, pad_width)` without the
+    intermediate padded copy.
+
+    """
+    (top, bottom), (left, right) = pad_width[:2]
+    padded_shape = (
+        region.shape[0] + top + bottom,
+        region.shape[1] + left + right,
+        *region.shape[2:],
+    )
+    if out.shape != padded_shape:
+        msg = f"Output shape {out.shape} does not match shape {padded_shape}."
+        raise ValueError(msg)
+    out[...] = constant_value
+    out[top : top + region.shape[0], left : left + region.shape[1]] = region
+    return out
+
+
 def safe_padded_read(
     image: np.ndarray,
     bounds: IntBounds,
@@ -290,6 +316,7 @@ def safe_padded_read(
     pad_mode: str = "constant",
     pad_constant_values: int | tuple[int, int] = 0,
     pad_kwargs: dict | None = None,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """Read a region of a numpy array with padding applied to edges.
 
@@ -329,6 +356,11 @@ def safe_padded_read(
         pad_kwargs (dict):
             Arbitrary keyword arguments passed through to the padding
             function :func:`numpy.pad`.
+        out (:class:`numpy.ndarray`):
+            Optional array to write the padded region into. With
+            constant padding, the region is written directly into
+            `out` without an intermediate padded copy. Defaults to
+            None, in which case a new array is returned.
 
     Returns:
         :class:`numpy.ndarray`:
@@ -389,7 +421,7 @@ def safe_padded_read(
     # If all padded coords are within the image then read normally
     if not any(padded_over | padded_under):
         left, top, right, bottom = padded_bounds
-        return image[top:bottom:y_stride, left:right:x_stride, ...]
+        return copy_to_out(image[top:bottom:y_stride, left:right:x_stride, ...], out)
     # Else find the closest coordinates which are inside the image
     clamped_bounds = np.max([np.min([padded_bounds, hw_limits], axis=0), zeros], axis=0)
     clamped_bounds = np.round(clamped_bounds).astype(int)
@@ -405,7 +437,7 @@ def safe_padded_read(
 
     # Return without padding if pad_mode is none
     if pad_mode in ["none", None]:
-        return region
+        return copy_to_out(region, out)
 
     # Find how much padding needs to be applied to fill the edge gaps
     before_padding = np.min([[0, 0], padded_bounds[2:]], axis=0)
@@ -418,12 +450,21 @@ def safe_padded_read(
     pad_width = [(top, bottom), (left, right)]
     if len(region.shape) == 3:  # noqa: PLR2004
         pad_width += [(0, 0)]
+    if (
+        out is not None
+        and pad_mode == "constant"
+        and np.ndim(pad_kwargs["constant_values"]) == 0
+    ):
+        return _pad_constant_into(region, pad_width, pad_kwargs["constant_values"], out)
     # Pad the image region at the edges
-    return np.pad(
-        region,
-        pad_width,
-        mode=pad_mode,
-        **pad_kwargs,
+    return copy_to_out(
+        np.pad(
+            region,
+            pad_width,
+            mode=pad_mode,
+            **pad_kwargs,
+        ),
+        out,
     )
 
 
@@ -440,6 +481,7 @@ def sub_pixel_read(  # noqa: C901, PLR0912, PLR0913, PLR0915
     pad_constant_values: int | tuple[int, int] = 0,
     read_kwargs: dict | None = None,
     pad_kwargs: dict | None = None,
+    out: np.ndarray | None = None,
     *,
     pad_at_baseline: bool,
 ) -> np.ndarray:
@@ -499,6 +541,9 @@ def sub_pixel_read(  # noqa: C901, PLR0912, PLR0913, PLR0915
         pad_kwargs (dict):
             Arbitrary keyword arguments passed through to the padding
             function :func:`numpy.pad`.
+        out (:class:`numpy.ndarray`):
+            Optional array to write the output region into. Defaults
+            to None, in which case a new array is returned.
 
     Returns:
         :class:`numpy.ndimage`:
@@ -688,10 +733,11 @@ def sub_pixel_read(  # noqa: C901, PLR0912, PLR0913, PLR0915
                 region,
                 output_size=tuple(output_size),
                 interpolation=interpolation,
+                out=None if fliplr or flipud else out,
             )
     # 5 Apply flips to account for negative bounds
     if fliplr:
         region = np.flipud(region)
     if flipud:
         region = np.fliplr(region)
-    return region
+    return copy_to_out(region, out)
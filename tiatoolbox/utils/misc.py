@@ -590,6 +590,41 @@ def conv_out_size(
     return (np.floor((in_size - kernel_size + (2 * padding)) / stride) + 1).astype(int)
 
 
+def copy_to_out(array: np.ndarray, out: np.ndarray | None) -> np.ndarray:
+    """Copy an array into a preallocated output array.
+
+    Args:
+        array (np.ndarray):
+            The array to copy.
+        out (np.ndarray or None):
+            Array to copy into. Must have the same shape as `array`. If
+            None, `array` is returned unchanged.
+
+    Returns:
+        np.ndarray:
+            `out` if given, otherwise `array`.
+
+    Raises:
+        ValueError:
+            If the shape of `out` does not match the shape of `array`.
+
+    Examples:
+        >>> from tiatoolbox import utils
+        >>> import numpy as np
+        >>> out = np.empty((2, 2), dtype=np.uint8)
+        >>> utils.misc.copy_to_out(np.ones((2, 2)), out) is out
+        True
+
+    """
+    if out is None or array is out:
+        return array
+    if out.shape != array.shape:
+        msg = f"Output shape {out.shape} does not match shape {array.shape}."
+        raise ValueError(msg)
+    out[...] = array
+    return out
+
+
 def parse_cv2_interpolaton(interpolation: str | int) -> int:
     """Convert a string to a OpenCV (cv2) interpolation enum.
 
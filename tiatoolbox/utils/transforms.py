@@ -5,7 +5,11 @@ import cv2
 import numpy as np
 from PIL import Image
 
-from tiatoolbox.utils.misc import parse_cv2_interpolaton, select_cv2_interpolation
+from tiatoolbox.utils.misc import (
+    copy_to_out,
+    parse_cv2_interpolaton,
+    select_cv2_interpolation,
+)
 
 
 def background_composite(
@@ -13,6 +17,7 @@ def background_composite(
     fill: int = 255,
     *,
     alpha: bool,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """Image composite with specified background.
 
@@ -23,6 +28,9 @@ def background_composite(
             Fill value for the background, defaults to 255.
         alpha (bool):
             True if alpha channel is required.
+        out (ndarray):
+            Optional array to write the output into. Defaults to None,
+            in which case a new array is returned.
 
     Returns:
         :class:`numpy.ndarray`:
@@ -42,6 +50,18 @@ def background_composite(
         >>> plt.show()
 
     """
+    if (
+        not alpha
+        and isinstance(image, np.ndarray)
+        and image.dtype == np.uint8
+        and image.ndim == 3  # noqa: PLR2004
+        and image.shape[-1] == 3  # noqa: PLR2004
+    ):
+        # An opaque RGB image is unchanged by compositing
+        if out is None:
+            return image.copy()
+        return copy_to_out(image, out)
+
     if not isinstance(image, Image.Image):
         image = Image.fromarray(image)
 
@@ -52,9 +72,9 @@ def background_composite(
     )
     composite.alpha_composite(image)
     if not alpha:
-        return np.asarray(composite.convert("RGB"))
+        return copy_to_out(np.asarray(composite.convert("RGB")), out)
 
-    return np.asarray(composite)
+    return copy_to_out(np.asarray(composite), out)
 
 
 def _convert_scalar_to_width_height(array: np.ndarray) -> np.ndarray:
@@ -95,6 +115,7 @@ def imresize(
     scale_factor: float | tuple[float, float] | None = None,
     output_size: int | tuple[int, int] | None = None,
     interpolation: str = "optimise",
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """Resize input image.
 
@@ -111,6 +132,10 @@ def imresize(
             <https://docs.opencv.org/3.4/da/d54/group__imgproc__transform.html>`_
             default='optimise', uses cv2.INTER_AREA for scale_factor
             <1.0 otherwise uses cv2.INTER_CUBIC.
+        out (:class:`numpy.ndarray`):
+            Optional array to write the resized image into. If it has
+            the dtype used for resizing, cv2 writes into it directly.
+            Defaults to None, in which case a new array is returned.
 
     Returns:
         :class:`numpy.ndarray`: Resized image. The image may be of different `np.dtype`
@@ -141,7 +166,7 @@ def imresize(
 
     # Return original if scale factor is 1
     if np.all(scale_factor_array == 1.0):  # noqa: PLR2004
-        return img
+        return copy_to_out(img, out)
 
     # Get appropriate cv2 interpolation enum
     if interpolation == "optimise":
@@ -175,14 +200,17 @@ def imresize(
         )
 
     converted_dtype = dtype_mapping[source_dtypes.index(original_dtype)][1]
-    img = img.astype(converted_dtype)
+    img = img.astype(converted_dtype, copy=False)
 
     cv2_interpolation = parse_cv2_interpolaton(interpolation)
 
     # Resize the image
     # Handle case for 1x1 images which cv2 v4.5.4 no longer handles
     if img.shape[0] == img.shape[1] == 1:
-        return img.repeat(output_size_array[1], 0).repeat(output_size_array[0], 1)
+        return copy_to_out(
+            img.repeat(output_size_array[1], 0).repeat(output_size_array[0], 1),
+            out,
+        )
 
     if len(img.shape) == 3 and img.shape[-1] > 4:  # noqa: PLR2004
         img_channels = [
@@ -196,9 +224,20 @@ def imresize(
             ]
             for ch in range(img.shape[-1])
         ]
-        return np.concatenate(img_channels, axis=-1)
-
-    return cv2.resize(src=img, dsize=output_size_array, interpolation=cv2_interpolation)
+        return copy_to_out(np.concatenate(img_channels, axis=-1), out)
+
+    dst = None
+    if out is not None and out.dtype == img.dtype and out.flags.c_contiguous:
+        dst = out
+    return copy_to_out(
+        cv2.resize(
+            src=img,
+            dsize=output_size_array,
+            dst=dst,
+            interpolation=cv2_interpolation,
+        ),
+        out,
+    )
 
 
 def rgb2od(img: np.ndarray) -> np.ndarray:
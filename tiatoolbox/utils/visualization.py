@@ -11,16 +11,17 @@ import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib import colormaps
 from PIL import Image, ImageFilter, ImageOps
-from shapely.geometry import Polygon
+from shapely.geometry import Point, Polygon
 
 from tiatoolbox import DuplicateFilter, logger
+from tiatoolbox.annotation import Annotation
 from tiatoolbox.enums import GeometryType
 
 if TYPE_CHECKING:  # pragma: no cover
     from matplotlib.axes import Axes
     from numpy.typing import ArrayLike
 
-    from tiatoolbox.annotation import Annotation, AnnotationStore
+    from tiatoolbox.annotation import AnnotationStore
 
 
 def random_colors(num_colors: int, *, bright: bool) -> list:
@@ -571,7 +572,10 @@ class AnnotationRenderer:
             strategy to use when rendering zoomed out tiles at
             a level above max_scale.  Can be one of 'decimate', 'scale', or a number
             which defines the minimum area an abject has to cover to be rendered
-            while zoomed out above max_scale.
+            while zoomed out above max_scale. Alternatively 'density' renders
+            a heatmap of annotation counts from the density grid of the store
+            (see `SQLiteStore.add_density_grid`), falling back to 'scale' for
+            stores without one.
         thickness (int):
             line thickness of rendered contours. -1 will render filled
             contours.
@@ -935,11 +939,18 @@ class AnnotationRenderer:
                 bound_geom,
                 self.where,
                 geometry_predicate="bbox_intersects",
+                tolerance=scale / res,
             )
 
             for ann in anns.values():
                 self.render_by_type(tile, ann, top_left, scale / res)
 
+        elif (
+            self.zoomed_out_strat == "density"
+            and getattr(store, "density_grid", None) is not None
+        ):
+            self.render_density(tile, store, top_left, scale / res)
+
         elif self.zoomed_out_strat == "decimate":
             # do decimation on small annotations
             decimate = int(scale / self.max_scale) + 1
@@ -949,11 +960,13 @@ class AnnotationRenderer:
                 self.where,
             )
 
-            for i, (key, box) in enumerate(bounding_boxes.items()):
-                area = (box[0] - box[2]) * (box[1] - box[3])
-                if area > min_area or i % decimate == 0:
-                    ann = store[key]
-                    self.render_by_type(tile, ann, top_left, scale / res)
+            keys = [
+                key
+                for i, (key, box) in enumerate(bounding_boxes.items())
+                if (box[0] - box[2]) * (box[1] - box[3]) > min_area or i % decimate == 0
+            ]
+            for ann in store.values_for(keys):
+                self.render_by_type(tile, ann, top_left, scale / res)
         else:
             # Get only annotations > min_area. Plot them all
             anns = store.query(
@@ -961,6 +974,7 @@ class AnnotationRenderer:
                 self.where,
                 min_area=min_area,
                 geometry_predicate="bbox_intersects",
+                tolerance=scale / res,
             )
 
             for ann in anns.values():
@@ -973,6 +987,70 @@ class AnnotationRenderer:
             ImageOps.crop(Image.fromarray(tile).filter(self.blur), border * res),
         )
 
+    def render_density(
+        self: AnnotationRenderer,
+        tile: np.ndarray,
+        store: AnnotationStore,
+        top_left: tuple[float, float],
+        scale: float,
+    ) -> None:
+        """Render the density grid of a store as a heatmap onto a tile.
+
+        The finest level of the grid with cells at least four pixels
+        wide is used. Each cell is colored according to the most common
+        property value in the cell (if the grid counts annotations by
+        the property used to color annotations), with an opacity
+        proportional to the log of the number of annotations in it.
+
+        Args:
+            tile (ndarray):
+                The rgb(a) tile image to render onto.
+            store (SQLiteStore):
+                The annotation store with a density grid to render.
+            top_left (tuple):
+                The top left corner of the tile in wsi.
+            scale (float):
+                The zoom scale at which we are rendering.
+
+        """
+        cell_sizes = store.density_grid["cell_sizes"]
+        level = next(
+            (i for i, size in enumerate(cell_sizes) if size >= 4 * scale),
+            len(cell_sizes) - 1,
+        )
+        cell_size = cell_sizes[level]
+        bounds = (
+            *top_left,
+            top_left[0] + tile.shape[1] * scale,
+            top_left[1] + tile.shape[0] * scale,
+        )
+        cells = store.density(bounds, level)
+        if not cells:
+            return
+        min_i, min_j, max_i, max_j = np.floor_divide(bounds, cell_size).astype(int)
+        counts = np.zeros((len(cells), max_j - min_j + 1, max_i - min_i + 1))
+        for value_counts, rows in zip(counts, cells.values()):
+            value_counts[rows[:, 1] - min_j, rows[:, 0] - min_i] = rows[:, 2]
+        by = store.density_grid["by"]
+        colors = np.array(
+            [
+                # Colors without an alpha channel are opaque
+                (*self.get_color(Annotation(Point(), {by: value}), edge=False), 255)[:4]
+                if by is not None and (by == self.score_prop or self.function_mapper)
+                else (0, 255, 0, 255)
+                for value in cells
+            ],
+        )
+        total = counts.sum(axis=0)
+        grid = colors[counts.argmax(axis=0)].astype(float)
+        grid[..., 3] *= np.log1p(total) / np.log1p(store.max_density(level))
+        # Index of the cell at the centre of each tile pixel
+        x = top_left[0] + (np.arange(tile.shape[1]) + 0.5) * scale
+        y = top_left[1] + (np.arange(tile.shape[0]) + 0.5) * scale
+        i = (x // cell_size).astype(int) - min_i
+        j = (y // cell_size).astype(int) - min_j
+        tile[:] = grid[j[:, None], i[None, :]].astype(np.uint8)
+
     def render_by_type(
         self: AnnotationRenderer,
         tile: np.ndarray,
@@ -7,10 +7,13 @@ import logging
 import math
 import os
 import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
 from numbers import Number
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Callable, Hashable, Iterable, Iterator
 
 import numpy as np
 import openslide
@@ -40,6 +43,10 @@ pixman_warning()
 MIN_NGFF_VERSION = Version("0.4")
 MAX_NGFF_VERSION = Version("0.4")
 
+# The tile cache and read parameter memo of the batched reads in
+# progress in each thread, by reader id (see `WSIReader._batch_read`)
+_BATCH_READS = threading.local()
+
 
 def is_dicom(path: Path) -> bool:
     """Check if the input is a DICOM file.
@@ -211,6 +218,11 @@ class WSIReader:
     Attributes:
         input_path (Path):
             Input path to WSI file.
+        tile_cache (:class:`TileCache` or None):
+            Optional cache of decoded tiles. If set, supported backends
+            read pixel data tile by tile via the cache. The same cache
+            may be shared between several readers. Defaults to None (no
+            caching).
 
     Args:
         input_img (str, :obj:`Path`, :obj:`ndarray` or :obj:`.WSIReader`):
@@ -225,7 +237,7 @@ class WSIReader:
     """
 
     @staticmethod
-    def open(  # noqa: A003, PLR0911
+    def open(  # noqa: A003, PLR0911, PLR0912
         input_img: str | Path | np.ndarray | WSIReader,
         mpp: tuple[Number, Number] | None = None,
         power: Number | None = None,
@@ -248,7 +260,8 @@ class WSIReader:
             power (float):
                 Objective power of the input image.
             kwargs (dict):
-                Key-word arguments.
+                Key-word arguments. A :class:`TileCache` may be given
+                as `tile_cache` to cache decoded tiles.
 
         Returns:
             WSIReader:
@@ -259,6 +272,12 @@ class WSIReader:
             >>> wsi = WSIReader.open(input_img="./sample.svs")
 
         """
+        tile_cache = kwargs.pop("tile_cache", None)
+        if tile_cache is not None:
+            wsi = WSIReader.open(input_img, mpp=mpp, power=power, **kwargs)
+            wsi.tile_cache = tile_cache
+            return wsi
+
         # Validate inputs
         if not isinstance(input_img, (WSIReader, np.ndarray, str, Path)):
             msg = "Invalid input: Must be a WSIRead, numpy array, string or Path"
@@ -380,6 +399,7 @@ class WSIReader:
                 msg = f"Input path does not exist: {self.input_path}"
                 raise FileNotFoundError(msg)
         self._m_info = None
+        self.tile_cache: TileCache | None = None
 
         # Set a manual mpp value
         if mpp and isinstance(mpp, Number):
@@ -442,6 +462,63 @@ class WSIReader:
         """
         raise NotImplementedError
 
+    def _tile_cached(
+        self: WSIReader,
+        image: np.ndarray | ArrayView | glymur.Jp2k | ReadRegionView,
+        level: int,
+        tile_shape: IntPair | None = None,
+    ) -> np.ndarray | ArrayView | glymur.Jp2k | ReadRegionView | CachedTileView:
+        """Wrap an image to read via `tile_cache` if a cache is set.
+
+        Args:
+            image (array-like):
+                The image (pyramid level) to read from.
+            level (int):
+                The pyramid level of the image. Used to identify the
+                tiles of the image in the cache (see
+                :func:`_tile_cache_key`).
+            tile_shape (IntPair):
+                The (height, width) of the cached tiles. Defaults to the
+                chunk shape of the image if it has one, otherwise (512,
+                512).
+
+        Returns:
+            array-like:
+                A :class:`CachedTileView` of the image, or the image
+                itself if `tile_cache` is None.
+
+        """
+        tile_cache, _ = self._batch_state()
+        if tile_cache is None:
+            return image
+        if tile_shape is None:
+            tile_shape = getattr(image, "chunks", None) or (512, 512)
+        return CachedTileView(
+            image,
+            cache=tile_cache,
+            key=self._tile_cache_key(level),
+            tile_shape=tile_shape,
+        )
+
+    def _tile_cache_key(self: WSIReader, level: int) -> Hashable:
+        """Identify the tiles of a pyramid level in a shared tile cache.
+
+        Readers of the same file with different backends may decode
+        different images (e.g. RGBA or RGB), so the key includes the
+        reader class as well as the input path.
+
+        Args:
+            level (int):
+                The pyramid level.
+
+        Returns:
+            Hashable:
+                The key of the level.
+
+        """
+        slide = str(self.input_path) if self.input_path else id(self)
+        return type(self).__name__, slide, level
+
     def _find_optimal_level_and_downsample(
         self: WSIReader,
         resolution: Resolution,
@@ -474,6 +551,10 @@ class WSIReader:
                 - :class:`numpy.ndarray` - Scale factor in X and Y.
 
         """
+        _, memo = self._batch_state()
+        memo_key = (tuple(np.ravel(resolution).tolist()), units, precision)
+        if memo is not None and memo_key in memo:
+            return memo[memo_key]
         level_scales = self.info.relative_level_scales(resolution, units)
         level_resolution_sufficient = [
             all(np.round(x, decimals=precision) <= 1) for x in level_scales
@@ -500,6 +581,8 @@ class WSIReader:
                 " than the WSI baseline (maximum encoded resolution)."
                 " Interpolation of read regions may occur.",
             )
+        if memo is not None:
+            memo[memo_key] = (level, scale)
         return level, scale
 
     def find_read_rect_params(
@@ -1062,6 +1145,7 @@ class WSIReader:
         pad_mode: str = "constant",
         pad_constant_values: Number | Iterable[NumPair] = 0,
         coord_space: str = "baseline",
+        out: np.ndarray | None = None,
         **kwargs: dict,
     ) -> np.ndarray:
         """Read a region of the whole slide image at a location and size.
@@ -1117,6 +1201,10 @@ class WSIReader:
                 the input `bounds` is in the baseline coordinate system
                 ("baseline") or is in the requested resolution system
                 ("resolution").
+            out (np.ndarray):
+                Optional array to write the output region into. Must
+                have the shape of the output. Defaults to None, in
+                which case a new array is returned.
             **kwargs (dict):
                 Extra key-word arguments for reader specific parameters.
                 Currently only used by VirtualWSIReader. See class
@@ -1255,6 +1343,7 @@ class WSIReader:
         pad_mode: str = "constant",
         pad_constant_values: Number | Iterable[NumPair] = 0,
         coord_space: str = "baseline",
+        out: np.ndarray | None = None,
         **kwargs: dict,
     ) -> np.ndarray:
         """Read a region of the whole slide image within given bounds.
@@ -1311,6 +1400,10 @@ class WSIReader:
                 the input `bounds` is in the baseline coordinate system
                 ("baseline") or is in the requested resolution system
                 ("resolution").
+            out (np.ndarray):
+                Optional array to write the output region into. Must
+                have the shape of the output. Defaults to None, in
+                which case a new array is returned.
             **kwargs (dict):
                 Extra key-word arguments for reader specific parameters.
                 Currently only used by :obj:`VirtualWSIReader`. See
@@ -1359,6 +1452,276 @@ class WSIReader:
         """
         raise NotImplementedError
 
+    @contextmanager
+    def _batch_read(self: WSIReader) -> Iterator[None]:
+        """Share read parameters and decoded tiles between batched reads.
+
+        Within the context, the optimal read level and scale for a
+        resolution are computed once and reused, and if no
+        `tile_cache` is set a temporary one is used so that each tile
+        is decoded at most once. The temporary state is kept per
+        thread, so concurrent batched reads with the same reader do not
+        interfere.
+
+        """
+        readers = getattr(_BATCH_READS, "readers", None)
+        if readers is None:
+            readers = _BATCH_READS.readers = {}
+        if id(self) in readers:
+            # Nested batch, reuse the state of the outer one
+            yield
+            return
+        tile_cache = TileCache() if self.tile_cache is None else self.tile_cache
+        readers[id(self)] = (tile_cache, {})
+        try:
+            yield
+        finally:
+            del readers[id(self)]
+
+    def _batch_state(self: WSIReader) -> tuple[TileCache | None, dict | None]:
+        """Return the tile cache and read parameter memo of the calling thread.
+
+        Returns:
+            tuple:
+                The temporary tile cache and memo of a batched read in
+                progress in the calling thread (see :func:`_batch_read`),
+                otherwise `tile_cache` and None.
+
+        """
+        readers = getattr(_BATCH_READS, "readers", {})
+        return readers.get(id(self), (self.tile_cache, None))
+
+    @staticmethod
+    def _stack_reads(
+        read: Callable[[int, np.ndarray | None], np.ndarray],
+        order: np.ndarray,
+        out: np.ndarray | None,
+        probe: Callable[[], np.ndarray],
+    ) -> np.ndarray:
+        """Stack regions read in a given order into an (N, H, W, C) array.
+
+        Args:
+            read (Callable):
+                Function which reads the region with a given index,
+                writing it into the array given as the second argument
+                if not None.
+            order (np.ndarray):
+                The index in the output of each region, in read order.
+            out (np.ndarray or None):
+                Optional array to write the regions into. If None, it
+                is allocated from the shape of the first region.
+            probe (Callable):
+                Function which reads an example region, to find the
+                shape and dtype of an empty output.
+
+        Returns:
+            np.ndarray:
+                The stacked regions.
+
+        """
+        if len(order) == 0 and out is None:
+            region = probe()
+            return np.empty((0, *region.shape), dtype=region.dtype)
+        for i in order:
+            if out is None:
+                region = read(i, None)
+                out = np.empty((len(order), *region.shape), dtype=region.dtype)
+                out[i] = region
+            else:
+                read(i, out[i])
+        return out
+
+    def read_bounds_batch(
+        self: WSIReader,
+        bounds: np.ndarray,
+        resolution: Resolution = 0,
+        units: Units = "level",
+        interpolation: str = "optimise",
+        pad_mode: str = "constant",
+        pad_constant_values: Number | Iterable[NumPair] = 0,
+        coord_space: str = "baseline",
+        out: np.ndarray | None = None,
+        **kwargs: dict,
+    ) -> np.ndarray:
+        """Read many regions of the whole slide image within given bounds.
+
+        This is equivalent to calling :func:`read_bounds` for each row
+        of `bounds` and stacking the results, but the optimal read
+        parameters are found once for the batch and regions are read
+        in raster order via a tile cache so that tiles shared between
+        regions are only decoded once. All regions must give outputs of
+        the same shape.
+
+        Args:
+            bounds (np.ndarray):
+                An (N, 4) array of (start_x, start_y, end_x, end_y)
+                bounds. See :func:`read_bounds`.
+            resolution (Resolution):
+                Resolution at which to read the image, default = 0.
+            units (Units):
+                Units of resolution, default="level".
+            interpolation (str):
+                Method to use when resampling the output image.
+            pad_mode (str):
+                Method to use when padding at the edges of the image.
+            pad_constant_values (int, tuple(int)):
+                Constant values to use when padding with constant pad mode.
+            coord_space (str):
+                Coordinate system of `bounds`, "baseline" or
+                "resolution".
+            out (np.ndarray):
+                Optional (N, H, W, C) array to write the regions into.
+                Defaults to None, in which case a new array is
+                allocated.
+            **kwargs (dict):
+                Extra key-word arguments passed to :func:`read_bounds`.
+
+        Returns:
+            :class:`numpy.ndarray`:
+                Array of size NxHxWxC.
+
+        Examples:
+            >>> from tiatoolbox.wsicore.wsireader import WSIReader
+            >>> wsi = WSIReader.open(input_img="./CMU-1.ndpi")
+            >>> bounds = [[0, 0, 256, 256], [128, 0, 384, 256]]
+            >>> patches = wsi.read_bounds_batch(bounds)
+            >>> patches.shape
+            (2, 256, 256, 3)
+
+        """
+        bounds = np.asarray(bounds)
+        if bounds.ndim != 2 or bounds.shape[1] != 4:  # noqa: PLR2004
+            msg = f"Expected bounds of shape (N, 4), got {bounds.shape}."
+            raise ValueError(msg)
+        if out is not None and len(out) != len(bounds):
+            msg = "Output must have the same length as bounds."
+            raise ValueError(msg)
+        # Read in raster order to maximise reuse of cached tiles
+        order = np.lexsort((bounds[:, 0], bounds[:, 1]))
+        with self._batch_read():
+            return self._stack_reads(
+                lambda i, region_out: self.read_bounds(
+                    bounds[i],
+                    resolution=resolution,
+                    units=units,
+                    interpolation=interpolation,
+                    pad_mode=pad_mode,
+                    pad_constant_values=pad_constant_values,
+                    coord_space=coord_space,
+                    out=region_out,
+                    **kwargs,
+                ),
+                order,
+                out,
+                # The region size of an empty batch of bounds is undefined
+                lambda: self.read_bounds(
+                    (0, 0, 1, 1),
+                    resolution=resolution,
+                    units=units,
+                    interpolation=interpolation,
+                    pad_mode=pad_mode,
+                    pad_constant_values=pad_constant_values,
+                    coord_space="resolution",
+                    **kwargs,
+                )[:0, :0],
+            )
+
+    def read_rects_batch(
+        self: WSIReader,
+        locations: np.ndarray,
+        size: IntPair,
+        resolution: Resolution = 0,
+        units: Units = "level",
+        interpolation: str = "optimise",
+        pad_mode: str = "constant",
+        pad_constant_values: Number | Iterable[NumPair] = 0,
+        coord_space: str = "baseline",
+        out: np.ndarray | None = None,
+        **kwargs: dict,
+    ) -> np.ndarray:
+        """Read many regions of the same size from the whole slide image.
+
+        This is equivalent to calling :func:`read_rect` for each
+        location and stacking the results. See
+        :func:`read_bounds_batch`.
+
+        Args:
+            locations (np.ndarray):
+                An (N, 2) array of (x, y) locations of the top left
+                pixel of the regions. See :func:`read_rect`.
+            size (IntPair):
+                (width, height) of the regions at the requested
+                resolution.
+            resolution (Resolution):
+                Resolution at which to read the image, default = 0.
+            units (Units):
+                Units of resolution, default="level".
+            interpolation (str):
+                Method to use when resampling the output image.
+            pad_mode (str):
+                Method to use when padding at the edges of the image.
+            pad_constant_values (int, tuple(int)):
+                Constant values to use when padding with constant pad mode.
+            coord_space (str):
+                Coordinate system of `locations`, "baseline" or
+                "resolution".
+            out (np.ndarray):
+                Optional (N, H, W, C) array to write the regions into.
+                Defaults to None, in which case a new array is
+                allocated.
+            **kwargs (dict):
+                Extra key-word arguments passed to :func:`read_rect`.
+
+        Returns:
+            :class:`numpy.ndarray`:
+                Array of size NxHxWxC.
+
+        Examples:
+            >>> from tiatoolbox.wsicore.wsireader import WSIReader
+            >>> wsi = WSIReader.open(input_img="./CMU-1.ndpi")
+            >>> locations = [[0, 0], [128, 0]]
+            >>> patches = wsi.read_rects_batch(locations, (256, 256))
+            >>> patches.shape
+            (2, 256, 256, 3)
+
+        """
+        locations = np.asarray(locations)
+        if locations.ndim != 2 or locations.shape[1] != 2:  # noqa: PLR2004
+            msg = f"Expected locations of shape (N, 2), got {locations.shape}."
+            raise ValueError(msg)
+        if out is not None and len(out) != len(locations):
+            msg = "Output must have the same length as locations."
+            raise ValueError(msg)
+        order = np.lexsort((locations[:, 0], locations[:, 1]))
+        with self._batch_read():
+            return self._stack_reads(
+                lambda i, region_out: self.read_rect(
+                    locations[i],
+                    size,
+                    resolution=resolution,
+                    units=units,
+                    interpolation=interpolation,
+                    pad_mode=pad_mode,
+                    pad_constant_values=pad_constant_values,
+                    coord_space=coord_space,
+                    out=region_out,
+                    **kwargs,
+                ),
+                order,
+                out,
+                lambda: self.read_rect(
+                    (0, 0),
+                    size,
+                    resolution=resolution,
+                    units=units,
+                    interpolation=interpolation,
+                    pad_mode=pad_mode,
+                    pad_constant_values=pad_constant_values,
+                    coord_space=coord_space,
+                    **kwargs,
+                ),
+            )
+
     def read_region(
         self: WSIReader,
         location: IntPair,
@@ -1651,6 +2014,53 @@ class OpenSlideWSIReader(WSIReader):
         super().__init__(input_img=input_img, mpp=mpp, power=power)
         self.openslide_wsi = openslide.OpenSlide(filename=str(self.input_path))
 
+    def _read_level_region(
+        self: OpenSlideWSIReader,
+        location: IntPair,
+        level: int,
+        bounds_at_level: IntBounds,
+    ) -> np.ndarray:
+        """Read an RGBA region at a pyramid level.
+
+        If `tile_cache` is set, the region is assembled from cached
+        tiles which are aligned to the level pixel grid. Otherwise, it
+        is read directly with OpenSlide.
+
+        Args:
+            location (IntPair):
+                Location of the top left of the region at baseline.
+            level (int):
+                The pyramid level to read from.
+            bounds_at_level (IntBounds):
+                Bounds of the region at the pyramid level.
+
+        Returns:
+            np.ndarray:
+                The RGBA region. Areas outside the slide are transparent.
+
+        """
+        _, size_at_level = utils.transforms.bounds2locsize(bounds_at_level)
+        if self._batch_state()[0] is None:
+            return np.array(
+                self.openslide_wsi.read_region(location, level, size_at_level),
+            )
+        width, height = self.info.level_dimensions[level]
+        properties = self.openslide_wsi.properties
+        tile_shape = (
+            int(properties.get(f"openslide.level[{level}].tile-height", 512)),
+            int(properties.get(f"openslide.level[{level}].tile-width", 512)),
+        )
+        level_view = ReadRegionView(
+            self.openslide_wsi.read_region,
+            level=level,
+            shape=(height, width, 4),
+            downsample=self.info.level_downsamples[level],
+        )
+        return utils.image.safe_padded_read(
+            image=self._tile_cached(level_view, level, tile_shape),
+            bounds=np.array(bounds_at_level).astype(int),
+        )
+
     def read_rect(
         self: OpenSlideWSIReader,
         location: IntPair,
@@ -1661,6 +2071,7 @@ class OpenSlideWSIReader(WSIReader):
         pad_mode: str = "constant",
         pad_constant_values: int | IntPair = 0,
         coord_space: str = "baseline",
+        out: np.ndarray | None = None,
         **kwargs: dict,  # noqa: ARG002
     ) -> np.ndarray:
         """Read a region of the whole slide image at a location and size.
@@ -1716,6 +2127,10 @@ class OpenSlideWSIReader(WSIReader):
                 the input `bounds` is in the baseline coordinate system
                 ("baseline") or is in the requested resolution system
                 ("resolution").
+            out (np.ndarray):
+                Optional array to write the output region into. Must
+                have the shape of the output. Defaults to None, in
+                which case a new array is returned.
             **kwargs (dict):
                 Extra key-word arguments for reader specific parameters.
                 Currently only used by VirtualWSIReader. See class
@@ -1852,6 +2267,7 @@ class OpenSlideWSIReader(WSIReader):
                 interpolation=interpolation,
                 pad_mode=pad_mode,
                 pad_constant_values=pad_constant_values,
+                out=out,
             )
 
         # Find parameters for optimal read
@@ -1868,11 +2284,12 @@ class OpenSlideWSIReader(WSIReader):
             units=units,
         )
 
-        wsi = self.openslide_wsi
-
         # Read at optimal level and corrected read size
-        im_region = wsi.read_region(location, read_level, level_size)
-        im_region = np.array(im_region)
+        im_region = self._read_level_region(
+            location,
+            read_level,
+            utils.transforms.locsize2bounds(level_location, level_size),
+        )
 
         # Apply padding outside the slide area
         im_region = utils.image.crop_and_pad_edges(
@@ -1891,7 +2308,11 @@ class OpenSlideWSIReader(WSIReader):
             interpolation=interpolation,
         )
 
-        return utils.transforms.background_composite(image=im_region, alpha=False)
+        return utils.transforms.background_composite(
+            image=im_region,
+            alpha=False,
+            out=out,
+        )
 
     def read_bounds(
         self: OpenSlideWSIReader,
@@ -1902,6 +2323,7 @@ class OpenSlideWSIReader(WSIReader):
         pad_mode: str = "constant",
         pad_constant_values: int | IntPair = 0,
         coord_space: str = "baseline",
+        out: np.ndarray | None = None,
         **kwargs: dict,  # noqa: ARG002
     ) -> np.ndarray:
         """Read a region of the whole slide image within given bounds.
@@ -1958,6 +2380,10 @@ class OpenSlideWSIReader(WSIReader):
                 the input `bounds` is in the baseline coordinate system
                 ("baseline") or is in the requested resolution system
                 ("resolution").
+            out (np.ndarray):
+                Optional array to write the output region into. Must
+                have the shape of the output. Defaults to None, in
+                which case a new array is returned.
             **kwargs (dict):
                 Extra key-word arguments for reader specific parameters.
                 Currently only used by :obj:`VirtualWSIReader`. See
@@ -2040,17 +2466,13 @@ class OpenSlideWSIReader(WSIReader):
                 units=units,
             )
 
-        wsi = self.openslide_wsi
-
         # Read at optimal level and corrected read size
         location_at_baseline = bounds_at_baseline[:2]
-        _, size_at_read_level = utils.transforms.bounds2locsize(bounds_at_read_level)
-        im_region = wsi.read_region(
-            location=location_at_baseline,
-            level=read_level,
-            size=size_at_read_level,
+        im_region = self._read_level_region(
+            location_at_baseline,
+            read_level,
+            bounds_at_read_level,
         )
-        im_region = np.array(im_region)
 
         # Apply padding outside the slide area
         im_region = utils.image.crop_and_pad_edges(
@@ -2076,7 +2498,11 @@ class OpenSlideWSIReader(WSIReader):
                 interpolation=interpolation,
             )
 
-        return utils.transforms.background_composite(image=im_region, alpha=False)
+        return utils.transforms.background_composite(
+            image=im_region,
+            alpha=False,
+            out=out,
+        )
 
     @staticmethod
     def _estimate_mpp(props: openslide.OpenSlide.properties) -> tuple:
@@ -2202,6 +2628,7 @@ class JP2WSIReader(WSIReader):
         pad_mode: str = "constant",
         pad_constant_values: int | IntPair = 0,
         coord_space: str = "baseline",
+        out: np.ndarray | None = None,
         **kwargs: dict,  # noqa: ARG002
     ) -> np.ndarray:
         """Read a region of the whole slide image at a location and size.
@@ -2257,6 +2684,10 @@ class JP2WSIReader(WSIReader):
                 the input `bounds` is in the baseline coordinate system
                 ("baseline") or is in the requested resolution system
                 ("resolution").
+            out (np.ndarray):
+                Optional array to write the output region into. Must
+                have the shape of the output. Defaults to None, in
+                which case a new array is returned.
             **kwargs (dict):
                 Extra key-word arguments for reader specific parameters.
                 Currently only used by VirtualWSIReader. See class
@@ -2393,6 +2824,7 @@ class JP2WSIReader(WSIReader):
                 interpolation=interpolation,
                 pad_mode=pad_mode,
                 pad_constant_values=pad_constant_values,
+                out=out,
             )
 
         # Find parameters for optimal read
@@ -2416,7 +2848,7 @@ class JP2WSIReader(WSIReader):
             size=baseline_read_size,
         )
         im_region = utils.image.safe_padded_read(
-            image=glymur_wsi,
+            image=self._tile_cached(glymur_wsi, level=0),
             bounds=bounds,
             stride=stride,
             pad_mode=pad_mode,
@@ -2430,7 +2862,11 @@ class JP2WSIReader(WSIReader):
             interpolation=interpolation,
         )
 
-        return utils.transforms.background_composite(image=im_region, alpha=False)
+        return utils.transforms.background_composite(
+            image=im_region,
+            alpha=False,
+            out=out,
+        )
 
     def read_bounds(
         self: JP2WSIReader,
@@ -2441,6 +2877,7 @@ class JP2WSIReader(WSIReader):
         pad_mode: str = "constant",
         pad_constant_values: int | IntPair = 0,
         coord_space: str = "baseline",
+        out: np.ndarray | None = None,
         **kwargs: dict,  # noqa: ARG002
     ) -> np.ndarray:
         """Read a region of the whole slide image within given bounds.
@@ -2497,6 +2934,10 @@ class JP2WSIReader(WSIReader):
                 the input `bounds` is in the baseline coordinate system
                 ("baseline") or is in the requested resolution system
                 ("resolution").
+            out (np.ndarray):
+                Optional array to write the output region into. Must
+                have the shape of the output. Defaults to None, in
+                which case a new array is returned.
             **kwargs (dict):
                 Extra key-word arguments for reader specific parameters.
                 Currently only used by :obj:`VirtualWSIReader`. See
@@ -2582,7 +3023,7 @@ class JP2WSIReader(WSIReader):
         stride = 2**read_level
 
         im_region = utils.image.safe_padded_read(
-            image=glymur_wsi,
+            image=self._tile_cached(glymur_wsi, level=0),
             bounds=bounds_at_baseline,
             stride=stride,
             pad_mode=pad_mode,
@@ -2604,7 +3045,11 @@ class JP2WSIReader(WSIReader):
                 interpolation=interpolation,
             )
 
-        return utils.transforms.background_composite(image=im_region, alpha=False)
+        return utils.transforms.background_composite(
+            image=im_region,
+            alpha=False,
+            out=out,
+        )
 
     @staticmethod
     def _get_jp2_boxes(
@@ -2888,6 +3333,7 @@ class VirtualWSIReader(WSIReader):
         pad_mode: str = "constant",
         pad_constant_values: int | IntPair = 0,
         coord_space: str = "baseline",
+        out: np.ndarray | None = None,
         **kwargs: dict,
     ) -> np.ndarray:
         """Read a region of the whole slide image at a location and size.
@@ -2943,6 +3389,10 @@ class VirtualWSIReader(WSIReader):
                 the input `bounds` is in the baseline coordinate system
                 ("baseline") or is in the requested resolution system
                 ("resolution").
+            out (np.ndarray):
+                Optional array to write the output region into. Must
+                have the shape of the output. Defaults to None, in
+                which case a new array is returned.
             **kwargs (dict):
                 Extra key-word arguments for reader specific parameters.
                 Currently, only used by VirtualWSIReader. See class
@@ -3079,6 +3529,7 @@ class VirtualWSIReader(WSIReader):
                 interpolation=interpolation,
                 pad_mode=pad_mode,
                 pad_constant_values=pad_constant_values,
+                out=out,
             )
 
         # Find parameters for optimal read
@@ -3118,8 +3569,12 @@ class VirtualWSIReader(WSIReader):
         )
 
         if self.mode == "rgb":
-            return utils.transforms.background_composite(image=im_region, alpha=False)
-        return im_region
+            return utils.transforms.background_composite(
+                image=im_region,
+                alpha=False,
+                out=out,
+            )
+        return utils.misc.copy_to_out(im_region, out)
 
     def read_bounds(
         self: VirtualWSIReader,
@@ -3130,6 +3585,7 @@ class VirtualWSIReader(WSIReader):
         pad_mode: str = "constant",
         pad_constant_values: int | IntPair = 0,
         coord_space: str = "baseline",
+        out: np.ndarray | None = None,
         **kwargs: dict,
     ) -> np.ndarray:
         """Read a region of the whole slide image within given bounds.
@@ -3186,6 +3642,10 @@ class VirtualWSIReader(WSIReader):
                 the input `bounds` is in the baseline coordinate system
                 ("baseline") or is in the requested resolution system
                 ("resolution").
+            out (np.ndarray):
+                Optional array to write the output region into. Must
+                have the shape of the output. Defaults to None, in
+                which case a new array is returned.
             **kwargs (dict):
                 Extra key-word arguments for reader specific parameters.
                 Currently only used by :obj:`VirtualWSIReader`. See
@@ -3292,8 +3752,12 @@ class VirtualWSIReader(WSIReader):
             )
 
         if self.mode == "rgb":
-            return utils.transforms.background_composite(image=im_region, alpha=False)
-        return im_region
+            return utils.transforms.background_composite(
+                image=im_region,
+                alpha=False,
+                out=out,
+            )
+        return utils.misc.copy_to_out(im_region, out)
 
 
 class ArrayView:
@@ -3345,6 +3809,297 @@ class ArrayView:
         msg = f"Unsupported axes `{self.axes}`."
         raise ValueError(msg)
 
+    @property
+    def chunks(self: ArrayView) -> IntPair:
+        """Return the (height, width) of the underlying array chunks."""
+        chunks = dict(zip(self.axes, self.array.chunks))
+        return chunks["Y"], chunks["X"]
+
+
+class TileCache:
+    """A least recently used (LRU) cache of decoded image tiles.
+
+    Tiles are keyed by (slide, level, tile index). This allows a single
+    cache to be shared between many :class:`WSIReader` instances, of
+    any backend, with a single memory budget. When the total size of
+    the cached tiles exceeds `max_bytes`, the least recently used tiles
+    are evicted. The cache is thread safe.
+
+    Attributes:
+        max_bytes (int):
+            Maximum total size of cached tiles in bytes.
+        nbytes (int):
+            Current total size of cached tiles in bytes.
+        hits (int):
+            Number of tile lookups which were found in the cache.
+        misses (int):
+            Number of tile lookups which were not found in the cache.
+
+    Examples:
+        >>> from tiatoolbox.wsicore.wsireader import TileCache, WSIReader
+        >>> cache = TileCache(max_bytes=2**30)
+        >>> wsi = WSIReader.open("sample.svs", tile_cache=cache)
+        >>> img = wsi.read_rect((0, 0), (256, 256))
+        >>> img = wsi.read_rect((128, 128), (256, 256))
+        >>> cache.hits, cache.misses
+
+    """
+
+    def __init__(self: TileCache, max_bytes: int = 2**28) -> None:
+        """Initialise the cache.
+
+        Args:
+            max_bytes (int):
+                Maximum total size of cached tiles in bytes. Defaults to
+                2**28 (256 MiB).
+
+        """
+        if max_bytes < 0:
+            msg = "`max_bytes` must be >= 0."
+            raise ValueError(msg)
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._tiles: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self: TileCache) -> int:
+        """Return the number of cached tiles."""
+        return len(self._tiles)
+
+    def __contains__(self: TileCache, key: Hashable) -> bool:
+        """Return True if a tile is cached for the key."""
+        return key in self._tiles
+
+    def get(self: TileCache, key: Hashable) -> np.ndarray | None:
+        """Get a tile from the cache.
+
+        Args:
+            key (Hashable):
+                The tile key.
+
+        Returns:
+            np.ndarray:
+                The cached tile or None if the tile is not cached.
+
+        """
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is None:
+                self.misses += 1
+                return None
+            self._tiles.move_to_end(key)
+            self.hits += 1
+            return tile
+
+    def put(self: TileCache, key: Hashable, tile: np.ndarray) -> None:
+        """Add a tile to the cache, evicting old tiles if required.
+
+        Tiles larger than `max_bytes` are not cached. Cached tiles are
+        made read-only as they are shared between reads.
+
+        Args:
+            key (Hashable):
+                The tile key.
+            tile (np.ndarray):
+                The decoded tile.
+
+        """
+        if tile.nbytes > self.max_bytes:
+            return
+        tile.flags.writeable = False
+        with self._lock:
+            previous = self._tiles.pop(key, None)
+            if previous is not None:
+                self.nbytes -= previous.nbytes
+            self._tiles[key] = tile
+            self.nbytes += tile.nbytes
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._tiles.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+
+    def clear(self: TileCache) -> None:
+        """Remove all tiles from the cache and reset the counters."""
+        with self._lock:
+            self._tiles.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+
+class CachedTileView:
+    """An array-like view of an image which reads tiles via a TileCache.
+
+    Reads are split into a regular grid of tiles. Each tile is read
+    (decoded) from the underlying image once and is then served from
+    the cache until it is evicted.
+
+    Strided reads (e.g. `view[::4, ::4]`) are treated as reads from a
+    reduced resolution version of the image, as is the case for JPEG
+    2000 images read via glymur. A region from `start` to `stop` with a
+    stride `s` covers the reduced resolution pixels from `ceil(start /
+    s)` to `ceil(stop / s)`. Tiles for each stride are cached
+    separately.
+
+    """
+
+    def __init__(
+        self: CachedTileView,
+        image: np.ndarray | ArrayView | glymur.Jp2k | ReadRegionView,
+        cache: TileCache,
+        key: Hashable,
+        tile_shape: IntPair = (512, 512),
+    ) -> None:
+        """Initialise the view object.
+
+        Args:
+            image (array-like):
+                Image to read from. Must have a `shape` attribute and
+                support slicing along the first two (Y, X) axes.
+            cache (TileCache):
+                The cache to store decoded tiles in.
+            key (Hashable):
+                A key which uniquely identifies the image, e.g. the
+                slide path and pyramid level.
+            tile_shape (IntPair):
+                The (height, width) of the tiles. Ideally this matches
+                the native tile size of the image. Defaults to (512,
+                512).
+
+        """
+        self.image = image
+        self.cache = cache
+        self.key = key
+        self.tile_shape = tuple(int(x) for x in tile_shape)
+
+    @property
+    def shape(self: CachedTileView) -> tuple:
+        """Return the shape of the underlying image."""
+        return tuple(self.image.shape)
+
+    def _tile(self: CachedTileView, stride: int, row: int, col: int) -> np.ndarray:
+        """Get a tile from the cache, reading it if not found."""
+        key = (self.key, stride, row, col)
+        tile = self.cache.get(key)
+        if tile is not None:
+            return tile
+        height, width = self.shape[:2]
+        tile_height, tile_width = self.tile_shape
+        tile = np.asarray(
+            self.image[
+                row
+                * tile_height
+                * stride : min(
+                    (row + 1) * tile_height * stride,
+                    height,
+                ) : stride,
+                col
+                * tile_width
+                * stride : min(
+                    (col + 1) * tile_width * stride,
+                    width,
+                ) : stride,
+            ],
+        )
+        self.cache.put(key, tile)
+        return tile
+
+    def __getitem__(self: CachedTileView, index: tuple | slice) -> np.ndarray:
+        """Read a region of the image via the tile cache."""
+        if not isinstance(index, tuple):
+            index = (index,)
+        index = tuple(i for i in index if i is not Ellipsis)
+        while len(index) < 2:  # noqa: PLR2004
+            index = (*index, slice(None))
+        rows, cols, *channels = index
+        if not isinstance(rows, slice) or not isinstance(cols, slice):
+            msg = "Only slice indexing is supported for the first two axes."
+            raise TypeError(msg)
+        stride = rows.step or 1
+        if (cols.step or 1) != stride:
+            msg = "Row and column strides must be equal."
+            raise ValueError(msg)
+
+        # Find the region in (reduced resolution) coordinates
+        height, width = self.shape[:2]
+        top, bottom, _ = slice(rows.start, rows.stop).indices(height)
+        left, right, _ = slice(cols.start, cols.stop).indices(width)
+        top, bottom, left, right = (-(-x // stride) for x in (top, bottom, left, right))
+        if bottom <= top or right <= left:
+            return np.asarray(self.image[rows, cols])[(..., *channels)]
+
+        # Copy the overlapping part of each tile into the output
+        tile_height, tile_width = self.tile_shape
+        output = None
+        for row in range(top // tile_height, -(-bottom // tile_height)):
+            for col in range(left // tile_width, -(-right // tile_width)):
+                tile = self._tile(stride, row, col)
+                if output is None:
+                    output = np.empty(
+                        (bottom - top, right - left, *tile.shape[2:]),
+                        dtype=tile.dtype,
+                    )
+                tile_top, tile_left = row * tile_height, col * tile_width
+                y0, y1 = max(top, tile_top), min(bottom, tile_top + tile.shape[0])
+                x0, x1 = max(left, tile_left), min(right, tile_left + tile.shape[1])
+                output[y0 - top : y1 - top, x0 - left : x1 - left] = tile[
+                    y0 - tile_top : y1 - tile_top,
+                    x0 - tile_left : x1 - tile_left,
+                ]
+        return output[(slice(None), slice(None), *channels)]
+
+
+class ReadRegionView:
+    """An array-like view of one level of a region reading slide backend.
+
+    Adapts backends which read regions with a call such as
+    `read_region(location, level, size)`, where `location` is in
+    baseline (level 0) coordinates, so that a level can be read by
+    slicing in level coordinates. This is used to read tiles from
+    OpenSlide and DICOM images via a :class:`TileCache`.
+
+    """
+
+    def __init__(
+        self: ReadRegionView,
+        read_region: Callable[[IntPair, int, IntPair], Image.Image | np.ndarray],
+        level: int,
+        shape: tuple[int, ...],
+        downsample: float,
+    ) -> None:
+        """Initialise the view object.
+
+        Args:
+            read_region (Callable):
+                Function to read a region, taking a location at
+                baseline, a level and a size at the level.
+            level (int):
+                The level passed to `read_region`.
+            shape (tuple(int)):
+                The (height, width, channels) shape of the level.
+            downsample (float):
+                The downsample of the level relative to the baseline.
+
+        """
+        self.read_region = read_region
+        self.level = level
+        self.shape = tuple(shape)
+        self.downsample = downsample
+
+    def __getitem__(self: ReadRegionView, index: tuple) -> np.ndarray:
+        """Read a region of the level."""
+        rows, cols = index[:2]
+        height, width = self.shape[:2]
+        top, bottom, _ = rows.indices(height)
+        left, right, _ = cols.indices(width)
+        location = (
+            int(round(left * self.downsample)),
+            int(round(top * self.downsample)),
+        )
+        size = (max(right - left, 0), max(bottom - top, 0))
+        return np.array(self.read_region(location, self.level, size))
+
 
 class TIFFWSIReader(WSIReader):
     """Define Tiff WSI Reader."""
@@ -3406,6 +4161,20 @@ class TIFFWSIReader(WSIReader):
             for key, array in self._zarr_group.items()
         }
 
+    def _tile_cache_key(self: TIFFWSIReader, level: int) -> Hashable:
+        """Identify the tiles of a pyramid level of the series in a tile cache.
+
+        Args:
+            level (int):
+                The pyramid level.
+
+        Returns:
+            Hashable:
+                The key of the level.
+
+        """
+        return type(self).__name__, str(self.input_path), int(self.series_n), level
+
     def _canonical_shape(self: TIFFWSIReader, shape: IntPair) -> tuple:
         """Make a level shape tuple in YXS order.
 
@@ -3709,6 +4478,7 @@ class TIFFWSIReader(WSIReader):
         pad_mode: str = "constant",
         pad_constant_values: int | IntPair = 0,
         coord_space: str = "baseline",
+        out: np.ndarray | None = None,
         **kwargs: dict,  # noqa: ARG002
     ) -> np.ndarray:
         """Read a region of the whole slide image at a location and size.
@@ -3764,6 +4534,10 @@ class TIFFWSIReader(WSIReader):
                 the input `bounds` is in the baseline coordinate system
                 ("baseline") or is in the requested resolution system
                 ("resolution").
+            out (np.ndarray):
+                Optional array to write the output region into. Must
+                have the shape of the output. Defaults to None, in
+                which case a new array is returned.
             **kwargs (dict):
                 Extra key-word arguments for reader specific parameters.
                 Currently only used by VirtualWSIReader. See class
@@ -3901,7 +4675,11 @@ class TIFFWSIReader(WSIReader):
                 pad_mode=pad_mode,
                 pad_constant_values=pad_constant_values,
             )
-            return utils.transforms.background_composite(im_region, alpha=False)
+            return utils.transforms.background_composite(
+                im_region,
+                alpha=False,
+                out=out,
+            )
 
         # Find parameters for optimal read
         (
@@ -3922,7 +4700,7 @@ class TIFFWSIReader(WSIReader):
             size=baseline_read_size,
         )
         im_region = utils.image.safe_padded_read(
-            image=self.level_arrays[read_level],
+            image=self._tile_cached(self.level_arrays[read_level], read_level),
             bounds=bounds,
             pad_mode=pad_mode,
             pad_constant_values=pad_constant_values,
@@ -3935,7 +4713,11 @@ class TIFFWSIReader(WSIReader):
             interpolation=interpolation,
         )
 
-        return utils.transforms.background_composite(image=im_region, alpha=False)
+        return utils.transforms.background_composite(
+            image=im_region,
+            alpha=False,
+            out=out,
+        )
 
     def read_bounds(
         self: TIFFWSIReader,
@@ -3946,6 +4728,7 @@ class TIFFWSIReader(WSIReader):
         pad_mode: str = "constant",
         pad_constant_values: int | IntPair = 0,
         coord_space: str = "baseline",
+        out: np.ndarray | None = None,
         **kwargs: dict,
     ) -> np.ndarray:
         """Read a region of the whole slide image within given bounds.
@@ -4002,6 +4785,10 @@ class TIFFWSIReader(WSIReader):
                 the input `bounds` is in the baseline coordinate system
                 ("baseline") or is in the requested resolution system
                 ("resolution").
+            out (np.ndarray):
+                Optional array to write the output region into. Must
+                have the shape of the output. Defaults to None, in
+                which case a new array is returned.
             **kwargs (dict):
                 Extra key-word arguments for reader specific parameters.
                 Currently only used by :obj:`VirtualWSIReader`. See
@@ -4084,7 +4871,7 @@ class TIFFWSIReader(WSIReader):
             )
 
         im_region = utils.image.sub_pixel_read(
-            image=self.level_arrays[read_level],
+            image=self._tile_cached(self.level_arrays[read_level], read_level),
             bounds=bounds_at_baseline,
             output_size=size_at_requested,
             interpolation=interpolation,
@@ -4099,15 +4886,17 @@ class TIFFWSIReader(WSIReader):
             im_region = utils.transforms.imresize(
                 img=im_region,
                 output_size=size_at_requested,
+                out=out,
             )
         else:
             im_region = utils.transforms.imresize(
                 img=im_region,
                 scale_factor=post_read_scale,
                 output_size=size_at_requested,
+                out=out,
             )
 
-        return im_region
+        return utils.misc.copy_to_out(im_region, out)
 
 
 class DICOMWSIReader(WSIReader):
@@ -4127,6 +4916,58 @@ class DICOMWSIReader(WSIReader):
         super().__init__(input_img, mpp, power)
         self.wsi = WsiDicom.open(input_img)
 
+    def _read_level_region(
+        self: DICOMWSIReader,
+        location: IntPair,
+        level: int,
+        bounds_at_level: IntBounds,
+    ) -> np.ndarray:
+        """Read a region at a pyramid level.
+
+        If `tile_cache` is set, the region is assembled from cached
+        tiles which are aligned to the level pixel grid and the whole
+        region is returned with zeros outside the slide. Otherwise, only
+        the part of the region which overlaps the slide is read.
+
+        Args:
+            location (IntPair):
+                Location of the top left of the region at baseline.
+            level (int):
+                The pyramid level to read from.
+            bounds_at_level (IntBounds):
+                Bounds of the region at the pyramid level.
+
+        Returns:
+            np.ndarray:
+                The image region.
+
+        """
+        dicom_level = self.wsi.levels[level].level
+        level_size = self.info.level_dimensions[level]
+        if self._batch_state()[0] is None:
+            read_bounds = utils.image.find_overlap(
+                *utils.transforms.bounds2locsize(bounds_at_level),
+                level_size,
+            )
+            _, read_size = utils.transforms.bounds2locsize(read_bounds)
+            return np.array(self.wsi.read_region(location, dicom_level, read_size))
+        width, height = level_size
+        tile_size = self.wsi.levels[level].tile_size
+        level_view = ReadRegionView(
+            self.wsi.read_region,
+            level=dicom_level,
+            shape=(height, width, 3),
+            downsample=self.info.level_downsamples[level],
+        )
+        return utils.image.safe_padded_read(
+            image=self._tile_cached(
+                level_view,
+                level,
+                (tile_size.height, tile_size.width),
+            ),
+            bounds=np.array(bounds_at_level).astype(int),
+        )
+
     def _info(self: DICOMWSIReader) -> WSIMeta:
         """WSI metadata constructor.
 
@@ -4172,6 +5013,7 @@ class DICOMWSIReader(WSIReader):
         pad_mode: str = "constant",
         pad_constant_values: int | IntPair = 0,
         coord_space: str = "baseline",
+        out: np.ndarray | None = None,
         **kwargs: dict,  # noqa: ARG002
     ) -> np.ndarray:
         """Read a region of the whole slide image at a location and size.
@@ -4227,6 +5069,10 @@ class DICOMWSIReader(WSIReader):
                 the input `bounds` is in the baseline coordinate system
                 ("baseline") or is in the requested resolution system
                 ("resolution").
+            out (np.ndarray):
+                Optional array to write the output region into. Must
+                have the shape of the output. Defaults to None, in
+                which case a new array is returned.
             **kwargs (dict):
                 Extra key-word arguments for reader specific parameters.
                 Currently only used by VirtualWSIReader. See class
@@ -4363,6 +5209,7 @@ class DICOMWSIReader(WSIReader):
                 interpolation=interpolation,
                 pad_mode=pad_mode,
                 pad_constant_values=pad_constant_values,
+                out=out,
             )
 
         # Find parameters for optimal read
@@ -4379,27 +5226,19 @@ class DICOMWSIReader(WSIReader):
             units=units,
         )
 
-        wsi = self.wsi
-
         # Read at optimal level and corrected read size
         level_size = self.info.level_dimensions[read_level]
-        constrained_read_bounds = utils.image.find_overlap(
-            read_location=level_location,
-            read_size=level_read_size,
-            image_size=level_size,
-        )
-        _, constrained_read_size = utils.transforms.bounds2locsize(
-            constrained_read_bounds,
-        )
-        dicom_level = wsi.levels[read_level].level
-        im_region = wsi.read_region(location, dicom_level, constrained_read_size)
-        im_region = np.array(im_region)
-
-        # Apply padding outside the slide area
         level_read_bounds = utils.transforms.locsize2bounds(
             level_location,
             level_read_size,
         )
+        im_region = self._read_level_region(
+            location,
+            read_level,
+            level_read_bounds,
+        )
+
+        # Apply padding outside the slide area
         im_region = utils.image.crop_and_pad_edges(
             bounds=level_read_bounds,
             max_dimensions=level_size,
@@ -4416,7 +5255,11 @@ class DICOMWSIReader(WSIReader):
             interpolation=interpolation,
         )
 
-        return utils.transforms.background_composite(image=im_region, alpha=False)
+        return utils.transforms.background_composite(
+            image=im_region,
+            alpha=False,
+            out=out,
+        )
 
     def read_bounds(
         self: DICOMWSIReader,
@@ -4427,6 +5270,7 @@ class DICOMWSIReader(WSIReader):
         pad_mode: str = "constant",
         pad_constant_values: int | IntPair = 0,
         coord_space: str = "baseline",
+        out: np.ndarray | None = None,
         **kwargs: dict,  # noqa: ARG002
     ) -> np.ndarray:
         """Read a region of the whole slide image within given bounds.
@@ -4483,6 +5327,10 @@ class DICOMWSIReader(WSIReader):
                 the input `bounds` is in the baseline coordinate system
                 ("baseline") or is in the requested resolution system
                 ("resolution").
+            out (np.ndarray):
+                Optional array to write the output region into. Must
+                have the shape of the output. Defaults to None, in
+                which case a new array is returned.
             **kwargs (dict):
                 Extra key-word arguments for reader specific parameters.
                 Currently only used by :obj:`VirtualWSIReader`. See
@@ -4565,27 +5413,13 @@ class DICOMWSIReader(WSIReader):
                 units=units,
             )
 
-        wsi = self.wsi
-
         # Read at optimal level and corrected read size
         location_at_baseline = bounds_at_baseline[:2]
-        level_location, size_at_read_level = utils.transforms.bounds2locsize(
+        im_region = self._read_level_region(
+            location_at_baseline,
+            read_level,
             bounds_at_read_level,
         )
-        level_size = self.info.level_dimensions[read_level]
-        read_bounds = utils.image.find_overlap(
-            level_location,
-            size_at_read_level,
-            level_size,
-        )
-        _, read_size = utils.transforms.bounds2locsize(read_bounds)
-        dicom_level = wsi.levels[read_level].level
-        im_region = wsi.read_region(
-            location=location_at_baseline,
-            level=dicom_level,
-            size=read_size,
-        )
-        im_region = np.array(im_region)
 
         # Apply padding outside the slide area
         im_region = utils.image.crop_and_pad_edges(
@@ -4611,7 +5445,11 @@ class DICOMWSIReader(WSIReader):
                 interpolation=interpolation,
             )
 
-        return utils.transforms.background_composite(image=im_region, alpha=False)
+        return utils.transforms.background_composite(
+            image=im_region,
+            alpha=False,
+            out=out,
+        )
 
 
 class NGFFWSIReader(WSIReader):
@@ -4742,6 +5580,7 @@ class NGFFWSIReader(WSIReader):
         pad_mode: str = "constant",
         pad_constant_values: int | IntPair = 0,
         coord_space: str = "baseline",
+        out: np.ndarray | None = None,
         **kwargs: dict,  # noqa: ARG002
     ) -> np.ndarray:
         """Read a region of the whole slide image at a location and size.
@@ -4797,6 +5636,10 @@ class NGFFWSIReader(WSIReader):
                 the input `bounds` is in the baseline coordinate system
                 ("baseline") or is in the requested resolution system
                 ("resolution").
+            out (np.ndarray):
+                Optional array to write the output region into. Must
+                have the shape of the output. Defaults to None, in
+                which case a new array is returned.
             **kwargs (dict):
                 Extra key-word arguments for reader specific parameters.
                 Currently only used by VirtualWSIReader. See class
@@ -4934,7 +5777,11 @@ class NGFFWSIReader(WSIReader):
                 pad_mode=pad_mode,
                 pad_constant_values=pad_constant_values,
             )
-            return utils.transforms.background_composite(image=im_region, alpha=False)
+            return utils.transforms.background_composite(
+                image=im_region,
+                alpha=False,
+                out=out,
+            )
 
         # Find parameters for optimal read
         (
@@ -4955,7 +5802,7 @@ class NGFFWSIReader(WSIReader):
             size=baseline_read_size,
         )
         im_region = utils.image.safe_padded_read(
-            image=self.level_arrays[read_level],
+            image=self._tile_cached(self.level_arrays[read_level], read_level),
             bounds=bounds,
             pad_mode=pad_mode,
             pad_constant_values=pad_constant_values,
@@ -4968,7 +5815,11 @@ class NGFFWSIReader(WSIReader):
             interpolation=interpolation,
         )
 
-        return utils.transforms.background_composite(image=im_region, alpha=False)
+        return utils.transforms.background_composite(
+            image=im_region,
+            alpha=False,
+            out=out,
+        )
 
     def read_bounds(
         self: NGFFWSIReader,
@@ -4979,6 +5830,7 @@ class NGFFWSIReader(WSIReader):
         pad_mode: str = "constant",
         pad_constant_values: int | IntPair = 0,
         coord_space: str = "baseline",
+        out: np.ndarray | None = None,
         **kwargs: dict,
     ) -> np.ndarray:
         """Read a region of the whole slide image within given bounds.
@@ -5035,6 +5887,10 @@ class NGFFWSIReader(WSIReader):
                 the input `bounds` is in the baseline coordinate system
                 ("baseline") or is in the requested resolution system
                 ("resolution").
+            out (np.ndarray):
+                Optional array to write the output region into. Must
+                have the shape of the output. Defaults to None, in
+                which case a new array is returned.
             **kwargs (dict):
                 Extra key-word arguments for reader specific parameters.
                 Currently only used by :obj:`VirtualWSIReader`. See
@@ -5117,7 +5973,7 @@ class NGFFWSIReader(WSIReader):
             )
 
         im_region = utils.image.sub_pixel_read(
-            image=self.level_arrays[read_level],
+            image=self._tile_cached(self.level_arrays[read_level], read_level),
             bounds=bounds_at_baseline,
             output_size=size_at_requested,
             interpolation=interpolation,
@@ -5132,15 +5988,17 @@ class NGFFWSIReader(WSIReader):
             im_region = utils.transforms.imresize(
                 img=im_region,
                 output_size=size_at_requested,
+                out=out,
             )
         else:
             im_region = utils.transforms.imresize(
                 img=im_region,
                 scale_factor=post_read_scale,
                 output_size=size_at_requested,
+                out=out,
             )
 
-        return im_region
+        return utils.misc.copy_to_out(im_region, out)
 
 
 class AnnotationStoreReader(WSIReader):
@@ -5238,6 +6096,7 @@ class AnnotationStoreReader(WSIReader):
         pad_mode: str = "constant",
         pad_constant_values: int | tuple[int, int] = 0,
         coord_space: str = "baseline",
+        out: np.ndarray | None = None,
         **kwargs: dict,
     ) -> np.ndarray:
         """Read a region using start location and size (width, height).
@@ -5296,6 +6155,10 @@ class AnnotationStoreReader(WSIReader):
                 the input `bounds` is in the baseline coordinate system
                 ("baseline") or is in the requested resolution system
                 ("resolution").
+            out (np.ndarray):
+                Optional array to write the output region into. Must
+                have the shape of the output. Defaults to None, in
+                which case a new array is returned.
             **kwargs (dict):
                 Extra key-word arguments for reader specific parameters.
                 Currently only used by VirtualWSIReader. See class
@@ -5459,6 +6322,7 @@ class AnnotationStoreReader(WSIReader):
                 interpolation=interpolation,
                 pad_mode=pad_mode,
                 pad_constant_values=pad_constant_values,
+                out=out,
             )
 
         # Find parameters for optimal read
@@ -5515,8 +6379,8 @@ class AnnotationStoreReader(WSIReader):
                 )
             base_region = Image.alpha_composite(base_region, im_region)
             base_region = base_region.convert("RGB")
-            return np.array(base_region)
-        return utils.transforms.background_composite(im_region, alpha=False)
+            return utils.misc.copy_to_out(np.array(base_region), out)
+        return utils.transforms.background_composite(im_region, alpha=False, out=out)
 
     def read_bounds(
         self: AnnotationStoreReader,
@@ -5527,6 +6391,7 @@ class AnnotationStoreReader(WSIReader):
         pad_mode: str = "constant",
         pad_constant_values: int | tuple[int, int] = 0,
         coord_space: str = "baseline",
+        out: np.ndarray | None = None,
         **kwargs: dict,
     ) -> np.ndarray:
         """Read a region by defining boundary locations.
@@ -5586,6 +6451,10 @@ class AnnotationStoreReader(WSIReader):
                 the input `bounds` is in the baseline coordinate system
                 ("baseline") or is in the requested resolution system
                 ("resolution").
+            out (np.ndarray):
+                Optional array to write the output region into. Must
+                have the shape of the output. Defaults to None, in
+                which case a new array is returned.
             **kwargs (dict):
                 Extra key-word arguments for reader specific parameters.
                 Currently only used by :obj:`VirtualWSIReader`. See
@@ -5708,5 +6577,5 @@ class AnnotationStoreReader(WSIReader):
                 )
             base_region = Image.alpha_composite(base_region, im_region)
             base_region = base_region.convert("RGB")
-            return np.array(base_region)
-        return utils.transforms.background_composite(im_region, alpha=False)
+            return utils.misc.copy_to_out(np.array(base_region), out)
+        return utils.transforms.background_composite(im_region, alpha=False, out=out)